@@ -0,0 +1,246 @@
+"""Local stand-in for the Wolt API used by the load benchmarks.
+
+Serves the endpoints Wolt Watch calls (``/v3/venues/slug/{slug}``,
+``/v1/pages/restaurants`` and ``/v4/venues/slug/{slug}/menu/data``) with configurable latency, error and 429 rates,
+and flips venues open or closed on a script.  Venue responses carry an
+ETag and answer ``If-None-Match`` with 304 Not Modified, and can be padded
+with menu-like filler to approach the size of real Wolt payloads.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import hashlib
+import json
+import random
+import time
+from typing import Any
+
+from aiohttp import web
+
+# Centre of the area venues are spread over (Tel Aviv)
+CENTER = (32.08, 34.78)
+
+
+@dataclass
+class FakeVenue:
+    """A venue served by the stand-in."""
+
+    slug: str
+    latitude: float
+    longitude: float
+    is_open: bool = False
+    opened_at: float | None = None
+    sold_out: set[str] = field(default_factory=set)
+    prices: dict[str, int] = field(default_factory=dict)
+
+    def as_payload(self, padding: int = 0) -> dict[str, Any]:
+        """Return the venue in Wolt's payload shape, with optional filler."""
+        payload = {
+            "slug": self.slug,
+            "name": self.slug.replace("-", " ").title(),
+            "online": self.is_open,
+            "location": {
+                "type": "Point",
+                "coordinates": [self.longitude, self.latitude],
+            },
+            "timezone": "UTC",
+        }
+        if padding:
+            # Stand-in for the menu, images and copy of a real venue payload
+            item = {"name": "Item", "description": "x" * 80, "price": 4200}
+            payload["menu"] = [item] * max(padding // 120, 1)
+        return payload
+
+
+    def menu_payload(self, count: int) -> dict[str, Any]:
+        """Return a menu of ``count`` items spread over ten categories."""
+        items = []
+        for index in range(count):
+            item_id = str(index)
+            item = {
+                "id": item_id,
+                "category": f"c{index % 10}",
+                "name": f"Item {index}",
+                "baseprice": self.prices.get(item_id, 1000 + index),
+            }
+            if item_id in self.sold_out:
+                item["disabled_info"] = {"disable_reason": "sold_out"}
+            items.append(item)
+        return {
+            "categories": [
+                {"id": f"c{index}", "name": f"Category {index}"} for index in range(10)
+            ],
+            "items": items,
+        }
+
+
+class FakeWolt:
+    """Scriptable fake Wolt API server.
+
+    Unknown slugs are created on first request at a stable, hash-derived
+    position within ``spread`` degrees of :data:`CENTER`, so any watch list
+    works without setup and neighbouring venues can be batched.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.05,
+        latency_jitter: float = 0.5,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 30,
+        spread: float = 0.1,
+        nearby_radius: float = 0.02,
+        padding: int = 0,
+        menu_items: int = 50,
+        conditional: bool = True,
+        seed: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the server state."""
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.spread = spread
+        self.nearby_radius = nearby_radius
+        self.padding = padding
+        self.menu_items = menu_items
+        self.conditional = conditional
+        self._random = random.Random(seed)
+        self._clock = clock
+        self.venues: dict[str, FakeVenue] = {}
+        self._script: list[tuple[float, str | None, bool]] = []
+        self.requests: Counter[str] = Counter()
+        self.responses: Counter[int] = Counter()
+        self.bytes_sent = 0
+        self._runner: web.AppRunner | None = None
+
+    def venue(self, slug: str) -> FakeVenue:
+        """Return a venue, creating it on first use."""
+        if (venue := self.venues.get(slug)) is None:
+            digest = hashlib.sha256(slug.encode()).digest()
+            lat_offset = (digest[0] / 255 - 0.5) * 2 * self.spread
+            lon_offset = (digest[1] / 255 - 0.5) * 2 * self.spread
+            venue = FakeVenue(slug, CENTER[0] + lat_offset, CENTER[1] + lon_offset)
+            self.venues[slug] = venue
+        return venue
+
+    def schedule(self, delay: float, is_open: bool, slug: str | None = None) -> None:
+        """Open or close a venue (every venue when slug is None) after a delay."""
+        self._script.append((self._clock() + delay, slug, is_open))
+        self._script.sort(key=lambda step: step[0])
+
+    def set_open(self, slug: str, is_open: bool) -> None:
+        """Open or close a venue right away."""
+        venue = self.venue(slug)
+        if is_open and not venue.is_open:
+            venue.opened_at = self._clock()
+        venue.is_open = is_open
+
+    def _advance(self) -> None:
+        """Apply every scripted transition that is due."""
+        now = self._clock()
+        while self._script and self._script[0][0] <= now:
+            at, slug, is_open = self._script.pop(0)
+            for venue in [self.venue(slug)] if slug else list(self.venues.values()):
+                if is_open and not venue.is_open:
+                    venue.opened_at = at
+                venue.is_open = is_open
+
+    async def _async_respond(self, endpoint: str) -> web.Response | None:
+        """Simulate latency and injected failures for one request."""
+        self.requests[endpoint] += 1
+        if self.latency:
+            spread = self.latency * self.latency_jitter
+            await asyncio.sleep(
+                max(self.latency + self._random.uniform(-spread, spread), 0)
+            )
+        self._advance()
+        roll = self._random.random()
+        if roll < self.rate_limit_rate:
+            self.responses[429] += 1
+            return web.Response(
+                status=429, headers={"Retry-After": str(int(self.retry_after))}
+            )
+        if roll < self.rate_limit_rate + self.error_rate:
+            self.responses[503] += 1
+            return web.Response(status=503)
+        return None
+
+    def _json(self, data: Any, request: web.Request | None = None) -> web.Response:
+        """Return a JSON response, or 304 when the client's ETag still matches."""
+        body = json.dumps(data, separators=(",", ":")).encode()
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        if (
+            self.conditional
+            and request is not None
+            and request.headers.get("If-None-Match") == etag
+        ):
+            self.responses[304] += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        self.responses[200] += 1
+        self.bytes_sent += len(body)
+        headers = {"ETag": etag} if self.conditional else None
+        return web.Response(
+            body=body, content_type="application/json", headers=headers
+        )
+
+    async def _handle_venue(self, request: web.Request) -> web.Response:
+        """Serve ``/v3/venues/slug/{slug}``."""
+        if (error := await self._async_respond("venue")) is not None:
+            return error
+        venue = self.venue(request.match_info["slug"])
+        return self._json({"results": [venue.as_payload(self.padding)]}, request)
+
+    async def _handle_menu(self, request: web.Request) -> web.Response:
+        """Serve ``/v4/venues/slug/{slug}/menu/data``."""
+        if (error := await self._async_respond("menu")) is not None:
+            return error
+        venue = self.venue(request.match_info["slug"])
+        return self._json(venue.menu_payload(self.menu_items), request)
+
+    async def _handle_nearby(self, request: web.Request) -> web.Response:
+        """Serve ``/v1/pages/restaurants`` with venues around a point."""
+        if (error := await self._async_respond("nearby")) is not None:
+            return error
+        try:
+            lat = float(request.query["lat"])
+            lon = float(request.query["lon"])
+        except (KeyError, ValueError):
+            return web.Response(status=400)
+        items = [
+            {"venue": venue.as_payload()}
+            for venue in self.venues.values()
+            if abs(venue.latitude - lat) <= self.nearby_radius
+            and abs(venue.longitude - lon) <= self.nearby_radius
+        ]
+        return self._json({"sections": [{"items": items}]})
+
+    def make_app(self) -> web.Application:
+        """Return the aiohttp application."""
+        app = web.Application()
+        app.router.add_get("/v3/venues/slug/{slug}", self._handle_venue)
+        app.router.add_get("/v1/pages/restaurants", self._handle_nearby)
+        app.router.add_get("/v4/venues/slug/{slug}/menu/data", self._handle_menu)
+        return app
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the base URL."""
+        self._runner = web.AppRunner(self.make_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        sockets = site._server.sockets  # pylint: disable=protected-access
+        return f"http://{host}:{sockets[0].getsockname()[1]}"
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
@@ -0,0 +1,295 @@
+"""Load benchmark for Wolt Watch against a local Wolt stand-in.
+
+Boots a bare Home Assistant instance with the integration pointed at
+:class:`~fake_wolt.FakeWolt`, starts N watches through the
+``wolt_watch.start`` service, opens every venue on a script and reports:
+
+* upstream requests per minute seen by the stand-in,
+* open-to-notification latency percentiles,
+* event-loop lag,
+* default executor occupancy,
+* process RSS.
+
+Requires Home Assistant to be installed::
+
+    python benchmarks/load.py --watches 1 10 100 1000 10000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+from pathlib import Path
+import resource
+import socket
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any
+
+from fake_wolt import FakeWolt
+
+ROOT = Path(__file__).resolve().parent.parent
+DOMAIN = "wolt_watch"
+NOTIFY_PREFIX = "bench"
+MAX_SLUGS = 500
+LAG_PROBE_INTERVAL = 0.1
+SAMPLE_INTERVAL = 1.0
+START_CHUNK = 500
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    """Return the nearest-rank percentile of a list of values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(math.ceil(pct / 100 * len(ordered)) - 1, len(ordered) - 1)]
+
+
+def rss_mb() -> float:
+    """Return the current resident set size in MiB."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        # Peak rather than current RSS; KiB on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def _free_port() -> int:
+    """Return a TCP port nothing is listening on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def plan_watches(count: int) -> list[tuple[str, str]]:
+    """Return ``count`` distinct (slug, device) pairs."""
+    slugs = max(min(count, MAX_SLUGS), 1)
+    return [
+        (f"venue-{index % slugs}", f"notify.{NOTIFY_PREFIX}_{index // slugs}")
+        for index in range(count)
+    ]
+
+
+class Probes:
+    """Background samplers for loop lag, executor use and RSS."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Initialize empty samples."""
+        self._loop = loop
+        self.loop_lag: list[float] = []
+        self.executor_busy: list[int] = []
+        self.executor_queued: list[int] = []
+        self.rss: list[float] = []
+        self._tasks: list[asyncio.Task] = []
+
+    async def _async_lag(self) -> None:
+        """Measure how late the loop wakes a sleeper."""
+        while True:
+            started = self._loop.time()
+            await asyncio.sleep(LAG_PROBE_INTERVAL)
+            self.loop_lag.append(self._loop.time() - started - LAG_PROBE_INTERVAL)
+
+    async def _async_sample(self) -> None:
+        """Sample the default executor and memory once a second."""
+        while True:
+            # ThreadPoolExecutor keeps these private; good enough for a benchmark
+            executor = getattr(self._loop, "_default_executor", None)
+            if executor is not None:
+                threads = len(getattr(executor, "_threads", ()))
+                idle = getattr(getattr(executor, "_idle_semaphore", None), "_value", 0)
+                self.executor_busy.append(max(threads - idle, 0))
+                self.executor_queued.append(executor._work_queue.qsize())
+            self.rss.append(rss_mb())
+            await asyncio.sleep(SAMPLE_INTERVAL)
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._tasks = [
+            self._loop.create_task(self._async_lag()),
+            self._loop.create_task(self._async_sample()),
+        ]
+
+    async def async_stop(self) -> None:
+        """Stop sampling."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+async def _async_boot_hass(config_dir: str) -> Any:
+    """Return a bare Home Assistant instance that can load the integration."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import loader
+    from homeassistant.core import HomeAssistant
+
+    custom_components = Path(config_dir, "custom_components")
+    custom_components.mkdir()
+    (custom_components / DOMAIN).symlink_to(ROOT / "custom_components" / DOMAIN)
+    if config_dir not in sys.path:
+        sys.path.insert(0, config_dir)
+
+    hass = HomeAssistant(config_dir)
+    # The manifest pins the SDK from git; the aiohttp backend does not need it
+    hass.config.skip_pip = True
+    if hasattr(loader, "async_setup"):
+        loader.async_setup(hass)
+    return hass
+
+
+async def async_run(count: int, args: argparse.Namespace) -> dict[str, Any]:
+    """Run one benchmark with ``count`` watches and return its report."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.setup import async_setup_component
+
+    loop = asyncio.get_running_loop()
+    fake = FakeWolt(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        spread=args.spread,
+        seed=args.seed,
+    )
+    url = await fake.async_start()
+    probes = Probes(loop)
+    latencies: list[float] = []
+    watches = plan_watches(count)
+    names = {
+        slug.replace("-", " ").title(): slug for slug in {slug for slug, _ in watches}
+    }
+
+    async def _async_notified(call: Any) -> None:
+        """Record the delay between each venue opening and its notification."""
+        message = call.data["message"].removesuffix(" OPEN on Wolt!")
+        message = message.removesuffix(" is now").removesuffix(" are now")
+        for name in message.replace(" and ", ", ").split(", "):
+            venue = fake.venues.get(names.get(name, ""))
+            if venue is not None and venue.opened_at is not None:
+                latencies.append(time.monotonic() - venue.opened_at)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await _async_boot_hass(config_dir)
+        for device in {device for _, device in watches}:
+            hass.services.async_register("notify", device.split(".", 1)[1], _async_notified)
+
+        setup_started = time.monotonic()
+        config = {
+            # websocket_api, a dependency, needs the HTTP server
+            "http": {"server_host": "127.0.0.1", "server_port": _free_port()},
+            DOMAIN: {"api_url": url},
+        }
+        if args.requests_per_minute:
+            config[DOMAIN]["requests_per_minute"] = args.requests_per_minute
+        assert await async_setup_component(hass, DOMAIN, config)
+        await hass.async_start()
+        setup_s = time.monotonic() - setup_started
+
+        probes.start()
+        timeout_m = min(math.ceil((args.open_after + args.duration) / 60) + 1, 1440)
+        start_started = time.monotonic()
+        for offset in range(0, len(watches), START_CHUNK):
+            await asyncio.gather(
+                *(
+                    hass.services.async_call(
+                        DOMAIN,
+                        "start",
+                        {"slug": slug, "device": device, "timeout_m": timeout_m},
+                        blocking=True,
+                    )
+                    for slug, device in watches[offset : offset + START_CHUNK]
+                )
+            )
+        start_s = time.monotonic() - start_started
+
+        requests_before = sum(fake.requests.values())
+        measure_started = time.monotonic()
+        fake.schedule(args.open_after, True)
+        await asyncio.sleep(args.open_after + args.duration)
+        elapsed_min = (time.monotonic() - measure_started) / 60
+        requests = sum(fake.requests.values()) - requests_before
+
+        await probes.async_stop()
+        await hass.async_stop(force=True)
+    await fake.async_stop()
+
+    return {
+        "watches": count,
+        "slugs": len(names),
+        "setup_s": round(setup_s, 3),
+        "start_s": round(start_s, 3),
+        "upstream_rpm": round(requests / elapsed_min, 1),
+        "upstream": dict(fake.requests),
+        "responses": {str(code): n for code, n in fake.responses.items()},
+        "notified": len(latencies),
+        "latency_s": _summary(latencies),
+        "loop_lag_ms": _summary([lag * 1000 for lag in probes.loop_lag]),
+        "executor_busy_max": max(probes.executor_busy, default=0),
+        "executor_busy_mean": round(statistics.fmean(probes.executor_busy), 2)
+        if probes.executor_busy
+        else 0,
+        "executor_queued_max": max(probes.executor_queued, default=0),
+        "rss_mb_max": round(max(probes.rss, default=rss_mb()), 1),
+    }
+
+
+def _summary(values: list[float]) -> dict[str, float | None]:
+    """Return p50/p90/p99/max of a sample."""
+    def _round(value: float | None) -> float | None:
+        """Round to milliseconds."""
+        return None if value is None else round(value, 3)
+
+    return {
+        "p50": _round(percentile(values, 50)),
+        "p90": _round(percentile(values, 90)),
+        "p99": _round(percentile(values, 99)),
+        "max": _round(max(values, default=None)),
+    }
+
+
+def _format(report: dict[str, Any]) -> str:
+    """Return a one-line human readable report."""
+    latency = report["latency_s"]
+    lag = report["loop_lag_ms"]
+    return (
+        f"{report['watches']:>6} watches / {report['slugs']:>3} slugs | "
+        f"{report['upstream_rpm']:>7} req/min | "
+        f"notified {report['notified']:>6} | "
+        f"latency p50 {latency['p50']}s p99 {latency['p99']}s | "
+        f"loop lag p99 {lag['p99']}ms max {lag['max']}ms | "
+        f"executor busy max {report['executor_busy_max']} | "
+        f"RSS {report['rss_mb_max']} MiB"
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse arguments and run the benchmark for each watch count."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--watches", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--open-after", type=float, default=30, help="seconds")
+    parser.add_argument("--duration", type=float, default=120, help="seconds after opening")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=30)
+    parser.add_argument("--spread", type=float, default=0.1, help="degrees")
+    parser.add_argument("--requests-per-minute", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print JSON reports")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    for count in args.watches:
+        report = asyncio.run(async_run(count, args))
+        print(json.dumps(report) if args.json else _format(report), flush=True)
+
+
+if __name__ == "__main__":
+    main()
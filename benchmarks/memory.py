@@ -0,0 +1,109 @@
+"""Memory footprint of active watches.
+
+Starts N watches spread over a number of venues and devices directly on a
+:class:`WatchManager`, the way the services do, and reports the Python
+memory allocated per watch (tracemalloc), covering the watch records, the
+manager's indexes and the scheduler's expiry entries.  Slug and device
+strings are built afresh for every watch, as they are when they arrive in
+service calls.  Exits non-zero if a run of 100k watches or more exceeds
+``--target`` bytes per watch; smaller runs are dominated by fixed overhead
+and only reported.  Home Assistant is not needed::
+
+    python benchmarks/memory.py --watches 1000 10000 100000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import importlib
+import json
+from pathlib import Path
+import sys
+import tracemalloc
+import types
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+TARGET_BYTES_PER_WATCH = 600  # About 57 MiB for 100k watches
+TARGET_MIN_WATCHES = 100_000  # Below this, fixed overhead dominates
+
+# Load the engine modules without Home Assistant
+package = types.ModuleType("wolt_watch")
+package.__path__ = [str(ROOT / "custom_components" / "wolt_watch")]
+sys.modules.setdefault("wolt_watch", package)
+watcher = importlib.import_module("wolt_watch.watcher")
+
+
+async def _async_never(*_: Any) -> Any:
+    """Stand in for upstream calls; nothing is polled while measuring."""
+    return {}
+
+
+async def _async_measure(watches: int, slugs: int, devices: int) -> dict[str, Any]:
+    """Start ``watches`` watches and return the memory they take."""
+    manager = watcher.WatchManager(_async_never, _async_never, asyncio.ensure_future)
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    # No awaits until measured, so no poll runs in between
+    for index in range(watches):
+        manager.async_start(
+            f"venue-{index % slugs}",
+            f"notify.device_{index // slugs % devices}",
+            3600 + index % 600,
+        )
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stats = manager.stats()
+    await manager.async_stop()
+    return {
+        "watches": watches,
+        "venues": stats["venues"],
+        "devices": stats["devices"],
+        "total_mb": (after - before) / 2**20,
+        "bytes_per_watch": (after - before) / watches,
+        "reported_mb": stats["memory_bytes"] / 2**20,
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--watches", type=int, nargs="+", default=[100000])
+    parser.add_argument("--slugs", type=int, default=5000)
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument("--target", type=float, default=TARGET_BYTES_PER_WATCH)
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    args = parser.parse_args()
+    if max(args.watches) > args.slugs * args.devices:
+        parser.error("--watches exceeds the distinct (slug, device) pairs")
+
+    results = [
+        asyncio.run(_async_measure(watches, args.slugs, args.devices))
+        for watches in args.watches
+    ]
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(
+            f"{'watches':>9}{'venues':>8}{'devices':>9}"
+            f"{'MiB':>8}{'B/watch':>9}{'stats MiB':>11}"
+        )
+        for row in results:
+            print(
+                f"{row['watches']:>9}{row['venues']:>8}{row['devices']:>9}"
+                f"{row['total_mb']:>8.1f}{row['bytes_per_watch']:>9.0f}"
+                f"{row['reported_mb']:>11.1f}"
+            )
+    if any(
+        row["bytes_per_watch"] > args.target
+        for row in results
+        if row["watches"] >= TARGET_MIN_WATCHES
+    ):
+        sys.exit(f"Above the target of {args.target:.0f} bytes per watch")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Per-poll cost of the native status fetch path.
+
+Polls one venue repeatedly through :class:`AiohttpWoltClient` against
+:class:`~fake_wolt.FakeWolt` serving padded, real-sized payloads, with and
+without conditional requests, and reports per poll:
+
+* CPU time of the whole process (client, server and event loop),
+* peak Python memory allocated (tracemalloc),
+* response bytes sent by the stand-in.
+
+A second table times decoding and field extraction alone, with the JSON
+parser the client picked (orjson when installed) against the standard
+library.  Only aiohttp is needed::
+
+    python benchmarks/parse.py --polls 500 --padding 30000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import json
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+import types
+from typing import Any
+
+import aiohttp
+
+from fake_wolt import FakeWolt
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Load the engine modules without Home Assistant
+package = types.ModuleType("wolt_watch")
+package.__path__ = [str(ROOT / "custom_components" / "wolt_watch")]
+sys.modules.setdefault("wolt_watch", package)
+api = importlib.import_module("wolt_watch.api")
+
+
+async def _async_polls(polls: int, padding: int, conditional: bool) -> dict[str, Any]:
+    """Poll one venue ``polls`` times and return the per-poll costs."""
+    fake = FakeWolt(latency=0, padding=padding, conditional=conditional)
+    url = await fake.async_start()
+    try:
+        async with aiohttp.ClientSession() as session:
+            client = api.AiohttpWoltClient(session, base_url=url)
+            await client.async_get_status("venue-0")  # Connect before measuring
+            sent = fake.bytes_sent
+            tracemalloc.start()
+            cpu = time.process_time()
+            for _ in range(polls):
+                await client.async_get_status("venue-0")
+            cpu = time.process_time() - cpu
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    finally:
+        await fake.async_stop()
+    return {
+        "mode": "conditional" if conditional else "full",
+        "cpu_us": cpu / polls * 1e6,
+        "bytes": (fake.bytes_sent - sent) / polls,
+        "peak_kb": peak / 1024,
+    }
+
+
+def _parse_costs(padding: int, repeat: int) -> list[dict[str, Any]]:
+    """Time decoding plus field extraction of one padded venue body."""
+    fake = FakeWolt(padding=padding)
+    body = json.dumps(
+        {"results": [fake.venue("venue-0").as_payload(padding)]},
+        separators=(",", ":"),
+    ).encode()
+    results = []
+    for name, loads in (("client", api.json_loads), ("json", json.loads)):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            api.venue_status_from_payload(loads(body)["results"][0])
+        elapsed = time.perf_counter() - started
+        results.append(
+            {
+                "parser": f"{name} ({loads.__module__})",
+                "body_bytes": len(body),
+                "us_per_parse": elapsed / repeat * 1e6,
+            }
+        )
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=500)
+    parser.add_argument(
+        "--padding", type=int, default=30000, help="approximate payload size in bytes"
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    args = parser.parse_args()
+
+    polls = [
+        asyncio.run(_async_polls(args.polls, args.padding, conditional))
+        for conditional in (False, True)
+    ]
+    parses = _parse_costs(args.padding, max(args.polls, 100))
+    if args.json:
+        print(json.dumps({"polls": polls, "parse": parses}, indent=2))
+        return
+
+    print(f"{'mode':<12}{'cpu us/poll':>12}{'bytes/poll':>12}{'peak KiB':>10}")
+    for row in polls:
+        print(
+            f"{row['mode']:<12}{row['cpu_us']:>12.0f}"
+            f"{row['bytes']:>12.0f}{row['peak_kb']:>10.1f}"
+        )
+    print()
+    print(f"{'parser':<28}{'body bytes':>12}{'us/parse':>10}")
+    for row in parses:
+        print(
+            f"{row['parser']:<28}{row['body_bytes']:>12}{row['us_per_parse']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
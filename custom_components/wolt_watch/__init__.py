@@ -1,51 +1,458 @@
 """Wolt Watch integration for Home Assistant."""
 from __future__ import annotations
 
-from datetime import timedelta, datetime
 import asyncio
+from collections.abc import Coroutine
+import importlib
 import logging
+from pathlib import Path
+import time
 from typing import Any
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers.typing import ConfigType
 import voluptuous as vol
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.discovery import async_load_platform
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
-    DEFAULT_SCAN_INTERVAL,
+    BACKEND_AIOHTTP,
+    BACKEND_SDK,
     DEFAULT_TIMEOUT_MINUTES,
-    BACKOFF_INTERVAL_SECONDS,
     SERVICE_START,
+    SERVICE_START_MANY,
+    SERVICE_STATUS,
+    SERVICE_METRICS,
+    SERVICE_LIST,
+    SERVICE_CANCEL,
+    SERVICE_EXTEND,
+    SERVICE_WATCH_MENU,
+    SERVICE_PROFILE,
+    SERVICE_WATCH_AREA,
+    SAVE_DELAY_SECONDS,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    WOLT_API_BASE_URL,
     CONF_SLUG,
     CONF_TIMEOUT_M,
     CONF_DEVICE,
+    CONF_WATCH_ID,
+    CONF_MINUTES,
+    CONF_ITEMS,
+    CONF_PRICE_CHANGES,
+    CONF_ETA_BELOW,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_SECONDS,
+    CONF_LATITUDE,
+    CONF_LONGITUDE,
+    CONF_RADIUS,
+    AREA_DEFAULT_RADIUS_KM,
+    AREA_MAX_RADIUS_KM,
+    MAX_POLL_INTERVAL_SECONDS,
+    PROFILE_DEFAULT_SECONDS,
+    PROFILE_MAX_SECONDS,
+    DENSE_SCAN_INTERVAL_SECONDS,
+    CONF_API_URL,
+    CONF_SENSORS,
+    CONF_WARM_UP,
+    CONF_SDK_WORKERS,
+    CONF_SDK_TIMEOUT,
+    CONF_SDK_PROCESSES,
+    SDK_WORKERS,
+    SDK_CALL_TIMEOUT_SECONDS,
+    DATA_METRICS,
+    DATA_VENUE_INDEX,
+    VENUE_INDEX_SAVE_DELAY_SECONDS,
+    VENUE_INDEX_STORAGE_KEY,
+    HISTORY_SAVE_DELAY_SECONDS,
+    HISTORY_STORAGE_KEY,
+    CONF_BACKEND,
+    CONF_REQUESTS_PER_MINUTE,
+    DEFAULT_REQUESTS_PER_MINUTE,
+    EVENT_BREAKER_STATE_CHANGED,
+    RATE_LIMIT_BURST,
     MIN_TIMEOUT_MINUTES,
     MAX_TIMEOUT_MINUTES,
 )
+from .api import AiohttpWoltClient, ExecutorWoltClient, ProcessWoltAPI, WoltClient
+from .batch import BatchStatusResolver
+from .breaker import BreakerWoltClient, CircuitBreaker
+from .cache import CachedWoltClient, StatusCache
+from .dispatch import NotificationDispatcher
+from .exceptions import WoltWatchProfileError
+from .executor import BoundedExecutor
+from .history import OpeningHistory
+from .lifecycle import WoltClientLifecycle
+from .metrics import InstrumentedWoltClient, Metrics
+from .models import VenueStatus
+from .profiler import EngineProfiler
+from .ratelimit import Backoff, RateLimitedWoltClient, TokenBucket
+from .venue_index import IndexingWoltClient, VenueIndex
+from .watcher import Watch, WatchManager
+from .websocket import async_setup_websocket
 
 _LOGGER = logging.getLogger(__name__)
 
 # Config schema - allow empty config for out-of-box experience
 CONFIG_SCHEMA = vol.Schema({
-    vol.Optional(DOMAIN): vol.Schema({})
+    vol.Optional(DOMAIN): vol.Schema({
+        vol.Optional(CONF_BACKEND, default=BACKEND_AIOHTTP): vol.In(
+            [BACKEND_AIOHTTP, BACKEND_SDK]
+        ),
+        vol.Optional(
+            CONF_REQUESTS_PER_MINUTE, default=DEFAULT_REQUESTS_PER_MINUTE
+        ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(CONF_API_URL, default=WOLT_API_BASE_URL): cv.url,
+        vol.Optional(CONF_SENSORS, default=False): cv.boolean,
+        vol.Optional(CONF_WARM_UP, default=False): cv.boolean,
+        vol.Optional(CONF_SDK_WORKERS, default=SDK_WORKERS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=32)
+        ),
+        vol.Optional(CONF_SDK_TIMEOUT, default=SDK_CALL_TIMEOUT_SECONDS): vol.All(
+            vol.Coerce(float), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_SDK_PROCESSES, default=False): cv.boolean,
+        vol.Optional(
+            CONF_MAX_POLL_INTERVAL, default=MAX_POLL_INTERVAL_SECONDS
+        ): vol.All(vol.Coerce(int), vol.Range(min=DENSE_SCAN_INTERVAL_SECONDS)),
+    })
 }, extra=vol.ALLOW_EXTRA)
 
 # Service schema
+# Poll keys put the watch kind before a ":", so slugs must not contain one
+VENUE_SLUG = vol.All(cv.string, vol.Match(r"^[^:]+$", msg="invalid venue slug"))
+# Notify services are called as <domain>.<service>
+NOTIFY_DEVICE = vol.All(
+    cv.string, vol.Match(r"^[^.]+\..+$", msg="expected a notify service")
+)
+
 SERVICE_START_SCHEMA = vol.Schema(
     {
-        vol.Required(CONF_SLUG): cv.string,
+        vol.Required(CONF_SLUG): VENUE_SLUG,
         vol.Optional(CONF_TIMEOUT_M, default=DEFAULT_TIMEOUT_MINUTES): vol.All(
             vol.Coerce(int), vol.Range(min=MIN_TIMEOUT_MINUTES, max=MAX_TIMEOUT_MINUTES)
         ),
-        vol.Required(CONF_DEVICE): cv.string,
+        vol.Required(CONF_DEVICE): NOTIFY_DEVICE,
+    }
+)
+
+SERVICE_START_MANY_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SLUG): vol.All(
+            cv.ensure_list, [VENUE_SLUG], vol.Length(min=1)
+        ),
+        vol.Optional(CONF_TIMEOUT_M, default=DEFAULT_TIMEOUT_MINUTES): vol.All(
+            vol.Coerce(int), vol.Range(min=MIN_TIMEOUT_MINUTES, max=MAX_TIMEOUT_MINUTES)
+        ),
+        vol.Required(CONF_DEVICE): vol.All(
+            cv.ensure_list, [NOTIFY_DEVICE], vol.Length(min=1)
+        ),
     }
 )
 
+SERVICE_WATCH_MENU_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(CONF_SLUG): VENUE_SLUG,
+            vol.Optional(CONF_TIMEOUT_M, default=DEFAULT_TIMEOUT_MINUTES): vol.All(
+                vol.Coerce(int),
+                vol.Range(min=MIN_TIMEOUT_MINUTES, max=MAX_TIMEOUT_MINUTES),
+            ),
+            vol.Required(CONF_DEVICE): NOTIFY_DEVICE,
+            vol.Optional(CONF_ITEMS): vol.All(
+                cv.ensure_list, [cv.string], vol.Length(min=1)
+            ),
+            vol.Optional(CONF_PRICE_CHANGES): cv.boolean,
+            vol.Optional(CONF_ETA_BELOW): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        }
+    ),
+    cv.has_at_least_one_key(CONF_ITEMS, CONF_PRICE_CHANGES, CONF_ETA_BELOW),
+)
+
+SERVICE_WATCH_AREA_SCHEMA = vol.Schema(
+    {
+        # Home Assistant's home location if left out
+        vol.Inclusive(CONF_LATITUDE, "coordinates"): cv.latitude,
+        vol.Inclusive(CONF_LONGITUDE, "coordinates"): cv.longitude,
+        vol.Optional(CONF_RADIUS, default=AREA_DEFAULT_RADIUS_KM): vol.All(
+            vol.Coerce(float), vol.Range(min=0.1, max=AREA_MAX_RADIUS_KM)
+        ),
+        vol.Optional(CONF_TIMEOUT_M, default=DEFAULT_TIMEOUT_MINUTES): vol.All(
+            vol.Coerce(int), vol.Range(min=MIN_TIMEOUT_MINUTES, max=MAX_TIMEOUT_MINUTES)
+        ),
+        vol.Required(CONF_DEVICE): NOTIFY_DEVICE,
+    }
+)
+
+SERVICE_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_SECONDS, default=PROFILE_DEFAULT_SECONDS): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=PROFILE_MAX_SECONDS)
+        ),
+    }
+)
+
+SERVICE_STATUS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_SLUG): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+SERVICE_LIST_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_SLUG): cv.string,
+        vol.Optional(CONF_DEVICE): cv.string,
+    }
+)
+
+SERVICE_CANCEL_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(CONF_WATCH_ID): cv.string,
+            vol.Optional(CONF_SLUG): cv.string,
+            vol.Optional(CONF_DEVICE): cv.string,
+        }
+    ),
+    cv.has_at_least_one_key(CONF_WATCH_ID, CONF_SLUG, CONF_DEVICE),
+)
+
+SERVICE_EXTEND_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(CONF_WATCH_ID): cv.string,
+            vol.Optional(CONF_SLUG): cv.string,
+            vol.Optional(CONF_DEVICE): cv.string,
+            vol.Required(CONF_MINUTES): vol.All(
+                vol.Coerce(int),
+                vol.Range(min=MIN_TIMEOUT_MINUTES, max=MAX_TIMEOUT_MINUTES),
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(CONF_WATCH_ID, CONF_SLUG, CONF_DEVICE),
+)
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Wolt Watch integration."""
+    setup_started = time.monotonic()
+    setup_s: float | None = None
+    conf = config.get(DOMAIN) or {}
+    cache = StatusCache()
+    metrics = Metrics()
+    venue_index = VenueIndex()
+    bucket = TokenBucket(
+        conf.get(CONF_REQUESTS_PER_MINUTE, DEFAULT_REQUESTS_PER_MINUTE) / 60,
+        RATE_LIMIT_BURST,
+    )
+
+    breaker = CircuitBreaker()
+    breaker.on_state_change = lambda state: hass.bus.async_fire(
+        EVENT_BREAKER_STATE_CHANGED, breaker.as_dict()
+    )
+
+    # SDK calls get their own bounded pool, off Home Assistant's executor
+    executor = (
+        BoundedExecutor(
+            max_workers=conf.get(CONF_SDK_WORKERS, SDK_WORKERS),
+            timeout=conf.get(CONF_SDK_TIMEOUT, SDK_CALL_TIMEOUT_SECONDS),
+            processes=conf.get(CONF_SDK_PROCESSES, False),
+        )
+        if conf.get(CONF_BACKEND, BACKEND_AIOHTTP) == BACKEND_SDK
+        else None
+    )
+
+    def _build_resolver(client: WoltClient) -> BatchStatusResolver:
+        """Put the shared cache, breaker and rate limit in front of a backend."""
+        return BatchStatusResolver(
+            CachedWoltClient(
+                BreakerWoltClient(
+                    RateLimitedWoltClient(
+                        InstrumentedWoltClient(
+                            IndexingWoltClient(client, venue_index), metrics
+                        ),
+                        bucket,
+                        Backoff(),
+                    ),
+                    breaker,
+                ),
+                cache,
+            )
+        )
+
+    async def _async_build_client() -> WoltClient:
+        """Build the configured backend, importing the SDK off the event loop."""
+        if conf.get(CONF_BACKEND, BACKEND_AIOHTTP) == BACKEND_AIOHTTP:
+            return AiohttpWoltClient(
+                async_get_clientsession(hass),
+                base_url=conf.get(CONF_API_URL, WOLT_API_BASE_URL),
+            )
+        try:
+            sdk = await hass.async_add_import_executor_job(
+                importlib.import_module, "wolt_api_mcp"
+            )
+        except ImportError as e:
+            raise HomeAssistantError(
+                f"{e}. Make sure wolt-sdk is installed: "
+                "pip install git+https://github.com/jonzarecki/wolt-sdk.git"
+            ) from e
+        assert executor is not None
+        if conf.get(CONF_SDK_PROCESSES, False):
+            return ExecutorWoltClient(ProcessWoltAPI(), executor.async_run)
+        api = await executor.async_run(sdk.WoltAPI)
+        return ExecutorWoltClient(api, executor.async_run)
+
+    lifecycle = WoltClientLifecycle(
+        _async_build_client, warm_up=conf.get(CONF_WARM_UP, False)
+    )
+
+    def _create_background_task(coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        """Start a long-lived task that Home Assistant does not wait for."""
+        return hass.async_create_background_task(coro, DOMAIN)
+
+    lifecycle.start(_create_background_task)
+    resolver = _build_resolver(lifecycle)
+
+    async def _async_send(device: str, message: str) -> None:
+        """Send a notification through a notify service."""
+        # Parse device entity (e.g., "notify.mobile_app_iphone")
+        if "." not in device:
+            raise ServiceValidationError(f"Invalid device format: {device}")
+
+        domain, service = device.split(".", 1)
+
+        await hass.services.async_call(
+            domain,
+            service,
+            {"message": message},
+            blocking=True,
+        )
+
+    dispatcher = NotificationDispatcher(_async_send, metrics=metrics)
+    dispatcher.start(_create_background_task)
+
+    async def _async_notify(watch: Watch) -> None:
+        """Queue the notification that a watch's restaurant opened."""
+        dispatcher.enqueue(watch.device, watch.slug.replace("-", " ").title())
+
+    async def _async_notify_area(watch: Watch, names: list[str]) -> None:
+        """Queue the notification that restaurants in a watched area opened."""
+        for name in names:
+            dispatcher.enqueue(watch.device, name)
+
+    async def _async_alert(watch: Watch, alerts: list[str]) -> None:
+        """Queue the menu changes a menu watch was waiting for."""
+        for text in alerts:
+            dispatcher.enqueue_alert(watch.device, text)
+
+    history = OpeningHistory(timezone=hass.config.time_zone)
+    history_store: Store[dict[str, Any]] = Store(
+        hass, STORAGE_VERSION, HISTORY_STORAGE_KEY
+    )
+    if stored_history := await history_store.async_load():
+        history.restore(stored_history)
+    history.on_change = lambda: history_store.async_delay_save(
+        history.as_dict, HISTORY_SAVE_DELAY_SECONDS
+    )
+
+    manager = WatchManager(
+        resolver.async_resolve,
+        _async_notify,
+        _create_background_task,
+        metrics=metrics,
+        fetch_menu=resolver.async_get_menu,
+        alert=_async_alert,
+        fetch_nearby=resolver.async_get_nearby,
+        notify_area=_async_notify_area,
+        budget=bucket,
+        max_interval=conf.get(CONF_MAX_POLL_INTERVAL, MAX_POLL_INTERVAL_SECONDS),
+        history=history,
+    )
+    hass.data[DOMAIN] = manager
+
+    def _metrics_report() -> dict[str, Any]:
+        """Collect metrics, watch counts, cache and breaker state."""
+        lookups = cache.hits + cache.misses
+        return {
+            **metrics.as_dict(),
+            "watches": {
+                "active": len(manager.watches),
+                "venues": len(manager.polled_slugs),
+                "per_venue": {
+                    slug: manager.watch_count(slug) for slug in manager.polled_slugs
+                },
+            },
+            "registry": manager.stats(),
+            "history": {"venues": len(history)},
+            "cache": {
+                "size": len(cache),
+                "hits": cache.hits,
+                "misses": cache.misses,
+                "hit_ratio": round(cache.hits / lookups, 3) if lookups else None,
+            },
+            "circuit_breaker": breaker.as_dict(),
+            "startup": {"setup_s": setup_s, **lifecycle.as_dict()},
+            "executor": executor.as_dict() if executor is not None else None,
+        }
+
+    hass.data[DATA_METRICS] = _metrics_report
+
+    store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+
+    def _data_to_save() -> dict[str, Any]:
+        """Snapshot watches and last known venue states."""
+        data = manager.as_dict()
+        now = dt_util.utcnow().timestamp()
+        venues = {}
+        for slug in manager.polled_slugs:
+            if (entry := cache.peek(slug)) is not None:
+                venues[slug] = {"is_open": entry[0].is_open, "checked_at": now - entry[1]}
+        data["venues"] = venues
+        return data
+
+    if (stored := await store.async_load()) and stored.get("watches"):
+        now = dt_util.utcnow().timestamp()
+        for slug, venue in stored.get("venues", {}).items():
+            cache.set(
+                VenueStatus(slug, venue["is_open"]),
+                age=max(now - venue["checked_at"], 0),
+            )
+        restored = manager.async_restore(stored)
+        _LOGGER.info("Resumed %d Wolt watches after restart", restored)
+
+    manager.on_change = lambda: store.async_delay_save(
+        _data_to_save, SAVE_DELAY_SECONDS
+    )
+
+    index_store: Store[dict[str, Any]] = Store(
+        hass, STORAGE_VERSION, VENUE_INDEX_STORAGE_KEY
+    )
+    if stored_index := await index_store.async_load():
+        venue_index.restore(stored_index)
+    venue_index.on_change = lambda: index_store.async_delay_save(
+        venue_index.as_dict, VENUE_INDEX_SAVE_DELAY_SECONDS
+    )
+    hass.data[DATA_VENUE_INDEX] = venue_index
+    async_setup_websocket(hass)
+
+    async def _async_require_client() -> None:
+        """Fail a service call if the Wolt client could not be built."""
+        if not await lifecycle.async_ready():
+            raise HomeAssistantError(
+                "The Wolt API client is unavailable; check the log for why"
+            )
 
     async def _start_watch(call: ServiceCall) -> None:
         """Start watching a Wolt restaurant."""
@@ -56,77 +463,229 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         # Convert minutes to seconds for internal calculations
         timeout_s = timeout_m * 60
 
+        await _async_require_client()
+
         _LOGGER.info("Starting Wolt watch for %s (timeout: %dm/%ds)", slug, timeout_m, timeout_s)
 
-        async def worker() -> None:
-            """Worker task to poll Wolt API."""
-            try:
-                # Import the real Wolt API client
-                from wolt_api_mcp import WoltAPI  # pylint: disable=import-outside-toplevel
-                api = WoltAPI()
-            except ImportError as e:
-                _LOGGER.error(
-                    "Failed to import Wolt API client: %s. "
-                    "Make sure wolt-sdk is installed: pip install git+https://github.com/jonzarecki/wolt-sdk.git", e
-                )
-                return
-            except Exception as e:
-                _LOGGER.error("Failed to initialize Wolt API: %s", e)
-                return
-
-            end_time = datetime.utcnow().timestamp() + timeout_s
-            seen_open = False
-
-            while datetime.utcnow().timestamp() < end_time:
-                try:
-                    # Call the Wolt API in executor to avoid blocking
-                    open_now = await hass.async_add_executor_job(
-                        api.is_restaurant_open, slug
-                    )
-
-                    if open_now and not seen_open:
-                        # Restaurant opened! Send notification
-                        restaurant_name = slug.replace("-", " ").title()
-                        message = f"{restaurant_name} is now OPEN on Wolt!"
-
-                        # Parse device entity (e.g., "notify.mobile_app_iphone")
-                        if "." not in device:
-                            _LOGGER.error("Invalid device format: %s", device)
-                            return
-                        
-                        domain, service = device.split(".", 1)
-
-                        await hass.services.async_call(
-                            domain,
-                            service,
-                            {"message": message},
-                        )
-
-                        _LOGGER.info("Sent notification: %s", message)
-                        return  # Job complete
-
-                    seen_open = open_now
-
-                except Exception as e:
-                    _LOGGER.warning("Wolt API check failed for %s: %s", slug, e)
-                    # Back off for longer on error
-                    await asyncio.sleep(BACKOFF_INTERVAL_SECONDS)
-                    continue
-
-                # Normal polling interval
-                await asyncio.sleep(DEFAULT_SCAN_INTERVAL.total_seconds())
-
-            _LOGGER.info("Wolt watch timeout reached for %s", slug)
-
-        # Start the worker task
-        hass.async_create_task(worker())
-
-    # Register the service
+        # Subscribe to the shared poller for this slug
+        manager.async_start(slug, device, timeout_s)
+
+    async def _start_many(call: ServiceCall) -> ServiceResponse:
+        """Watch every listed restaurant for every listed device at once."""
+        timeout_m: int = call.data[CONF_TIMEOUT_M]
+        await _async_require_client()
+
+        watches = manager.async_start_many(
+            (
+                (slug, device)
+                for slug in call.data[CONF_SLUG]
+                for device in call.data[CONF_DEVICE]
+            ),
+            timeout_m * 60,
+        )
+        _LOGGER.info(
+            "Starting %d Wolt watches on %d restaurants (timeout: %dm)",
+            len(watches),
+            len({watch.slug for watch in watches}),
+            timeout_m,
+        )
+        return {"watches": [manager.describe(watch) for watch in watches]}
+
+    async def _watch_menu(call: ServiceCall) -> ServiceResponse:
+        """Watch a restaurant's menu for items, prices or delivery time."""
+        # The SDK has neither menus nor delivery estimates
+        if conf.get(CONF_BACKEND, BACKEND_AIOHTTP) == BACKEND_SDK:
+            raise ServiceValidationError(
+                "Watching menus and delivery times needs the aiohttp backend"
+            )
+        await _async_require_client()
+
+        watch = manager.async_start_menu(
+            call.data[CONF_SLUG],
+            call.data[CONF_DEVICE],
+            call.data[CONF_TIMEOUT_M] * 60,
+            items=call.data.get(CONF_ITEMS, ()),
+            price_changes=call.data.get(CONF_PRICE_CHANGES, False),
+            eta_below=call.data.get(CONF_ETA_BELOW),
+        )
+        _LOGGER.info(
+            "Starting Wolt menu watch for %s (timeout: %dm)",
+            watch.slug,
+            call.data[CONF_TIMEOUT_M],
+        )
+        return {"watches": [manager.describe(watch)]}
+
+    async def _watch_area(call: ServiceCall) -> ServiceResponse:
+        """Watch every restaurant within a radius for openings."""
+        await _async_require_client()
+
+        watch = manager.async_start_area(
+            call.data.get(CONF_LATITUDE, hass.config.latitude),
+            call.data.get(CONF_LONGITUDE, hass.config.longitude),
+            call.data[CONF_RADIUS],
+            call.data[CONF_DEVICE],
+            call.data[CONF_TIMEOUT_M] * 60,
+        )
+        _LOGGER.info(
+            "Starting Wolt area watch for %s (timeout: %dm)",
+            watch.slug,
+            call.data[CONF_TIMEOUT_M],
+        )
+        return {"watches": [manager.describe(watch)]}
+
+    async def _status(call: ServiceCall) -> ServiceResponse:
+        """Report last known venue states from the cache, without polling."""
+        slugs = call.data.get(CONF_SLUG) or manager.polled_slugs
+        venues: dict[str, Any] = {}
+        for slug in slugs:
+            entry = cache.peek(slug)
+            venues[slug] = {
+                "is_open": entry[0].is_open if entry else None,
+                "age_s": round(entry[1], 1) if entry else None,
+                "watches": manager.watch_count(slug),
+            }
+        return {"venues": venues, "circuit_breaker": breaker.as_dict()}
+
+    def _selected(call: ServiceCall) -> list[Watch]:
+        """Return the watches a service call targets."""
+        if (watch_id := call.data.get(CONF_WATCH_ID)) is not None:
+            watch = manager.get(watch_id)
+            return [watch] if watch else []
+        return manager.find(
+            slug=call.data.get(CONF_SLUG), device=call.data.get(CONF_DEVICE)
+        )
+
+    async def _list(call: ServiceCall) -> ServiceResponse:
+        """List active watches."""
+        return {
+            "watches": [manager.describe(watch) for watch in _selected(call)],
+            "registry": manager.stats(),
+        }
+
+    async def _cancel(call: ServiceCall) -> ServiceResponse:
+        """Stop watches by id, slug or device."""
+        cancelled = [
+            watch.watch_id
+            for watch in _selected(call)
+            if manager.async_cancel(watch.watch_id) is not None
+        ]
+        _LOGGER.info("Cancelled %d Wolt watches", len(cancelled))
+        return {"cancelled": cancelled}
+
+    async def _extend(call: ServiceCall) -> ServiceResponse:
+        """Give watches more time, up to the maximum watch duration."""
+        extended = []
+        for watch in _selected(call):
+            seconds = min(
+                call.data[CONF_MINUTES] * 60,
+                MAX_TIMEOUT_MINUTES * 60 - manager.remaining(watch),
+            )
+            if seconds > 0:
+                manager.async_extend(watch.watch_id, seconds)
+            extended.append(manager.describe(watch))
+        return {"watches": extended}
+
+    async def _metrics(call: ServiceCall) -> ServiceResponse:
+        """Report hot-path metrics."""
+        return _metrics_report()
+
+    profiler = EngineProfiler()
+
+    async def _profile(call: ServiceCall) -> ServiceResponse:
+        """Profile the event loop and write reports to the config directory."""
+        _LOGGER.info("Profiling for %ss", call.data[CONF_SECONDS])
+        try:
+            return await profiler.async_profile(
+                call.data[CONF_SECONDS], Path(hass.config.config_dir)
+            )
+        except WoltWatchProfileError as err:
+            raise ServiceValidationError(str(err)) from err
+
+    async def _async_shutdown(event: Event) -> None:
+        """Stop polling when Home Assistant stops; the store flushes on exit."""
+        await manager.async_stop()
+        await dispatcher.async_stop()
+        await lifecycle.async_close()
+        if executor is not None:
+            executor.shutdown()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_shutdown)
+
+    # Register the services
     hass.services.async_register(
         DOMAIN, SERVICE_START, _start_watch, schema=SERVICE_START_SCHEMA
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_MANY,
+        _start_many,
+        schema=SERVICE_START_MANY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_WATCH_MENU,
+        _watch_menu,
+        schema=SERVICE_WATCH_MENU_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_WATCH_AREA,
+        _watch_area,
+        schema=SERVICE_WATCH_AREA_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STATUS,
+        _status,
+        schema=SERVICE_STATUS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LIST,
+        _list,
+        schema=SERVICE_LIST_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CANCEL,
+        _cancel,
+        schema=SERVICE_CANCEL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXTEND,
+        _extend,
+        schema=SERVICE_EXTEND_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_METRICS,
+        _metrics,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _profile,
+        schema=SERVICE_PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    if conf.get(CONF_SENSORS, False):
+        hass.async_create_task(
+            async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config)
+        )
 
-    _LOGGER.info("Wolt Watch integration loaded")
+    setup_s = round(time.monotonic() - setup_started, 3)
+    _LOGGER.info("Wolt Watch integration loaded in %.3fs", setup_s)
     return True
 
 
@@ -0,0 +1,443 @@
+"""Wolt API clients for Wolt Watch."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from email.utils import parsedate_to_datetime
+import hashlib
+import importlib
+import logging
+import time
+from typing import Any, Protocol, TypeVar
+from urllib.parse import quote
+
+import aiohttp
+
+try:
+    from orjson import dumps as _json_dumps, loads as json_loads
+except ImportError:  # Home Assistant ships orjson; plain json is a fallback
+    from json import dumps as _json_dumps, loads as json_loads
+
+from .const import (
+    MAX_CONCURRENT_REQUESTS,
+    NEARBY_LIMIT,
+    REQUEST_TIMEOUT_SECONDS,
+    STATUS_CACHE_MAX_SIZE,
+    WOLT_API_BASE_URL,
+)
+from .exceptions import (
+    WoltWatchAPIError,
+    WoltWatchConfigurationError,
+    WoltWatchConnectionError,
+    WoltWatchException,
+    WoltWatchNotFoundError,
+    WoltWatchRateLimitError,
+    WoltWatchServerError,
+)
+from .hours import parse_opening_hours
+from .models import Menu, MenuItem, MenuSection, VenueStatus
+
+_LOGGER = logging.getLogger(__name__)
+
+ExecutorRunner = Callable[..., Awaitable[Any]]
+
+_T = TypeVar("_T")
+
+
+def _decode(body: bytes, path: str) -> Any:
+    """Decode a JSON response body."""
+    try:
+        return json_loads(body)
+    except ValueError as err:
+        raise WoltWatchAPIError(f"Wolt API returned invalid JSON for {path}") from err
+
+
+def _retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _location(value: Any) -> tuple[float | None, float | None]:
+    """Extract (latitude, longitude) from a GeoJSON point or [lon, lat] pair."""
+    if isinstance(value, dict):
+        value = value.get("coordinates")
+    if isinstance(value, (list, tuple)) and len(value) == 2:
+        lon, lat = value
+        return float(lat), float(lon)
+    return None, None
+
+
+def _field(item: Any, name: str) -> Any:
+    """Read a field from a dict or an SDK model object."""
+    if isinstance(item, dict):
+        return item.get(name)
+    return getattr(item, name, None)
+
+
+def _name(value: Any) -> str | None:
+    """Extract a display name, preferring English among translations."""
+    if isinstance(value, str):
+        return value or None
+    if isinstance(value, list):
+        names = {
+            item.get("lang"): item.get("value")
+            for item in value
+            if isinstance(item, dict) and item.get("value")
+        }
+        return names.get("en") or next(iter(names.values()), None)
+    return None
+
+
+def venue_status_from_payload(venue: Any) -> VenueStatus | None:
+    """Build a status from a venue payload, or None if it has no slug."""
+    if (slug := _field(venue, "slug")) is None:
+        return None
+    is_open = _field(venue, "online")
+    if is_open is None:
+        is_open = _field(venue, "is_open")
+    latitude, longitude = _location(_field(venue, "location"))
+    hours = parse_opening_hours(venue) if isinstance(venue, dict) else None
+    estimate = _field(venue, "estimate")
+    return VenueStatus(
+        str(slug),
+        bool(is_open),
+        latitude,
+        longitude,
+        hours,
+        _name(_field(venue, "name")),
+        int(estimate) if isinstance(estimate, (int, float)) else None,
+    )
+
+
+def _fingerprint(value: Any) -> str:
+    """Return a short digest of a JSON value's serialized form."""
+    data = _json_dumps(value)
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _menu_item(item: dict[str, Any]) -> MenuItem:
+    """Build a menu item from its payload."""
+    price = item.get("baseprice", item.get("price"))
+    return MenuItem(
+        str(item.get("id")),
+        _name(item.get("name")) or "",
+        int(price) if isinstance(price, (int, float)) else None,
+        not item.get("disabled_info") and item.get("enabled", True) is not False,
+    )
+
+
+def menu_from_payload(slug: str, data: Any, previous: Menu | None = None) -> Menu:
+    """Build a menu from Wolt's menu payload, reusing unchanged sections.
+
+    Items are grouped by category and each group is fingerprinted from its
+    raw JSON; a section whose fingerprint matches the previous menu is
+    taken over as is, without building its items again.
+    """
+    if not isinstance(data, dict):
+        raise WoltWatchAPIError(f"Wolt API returned no menu for {slug}")
+    groups: dict[str, list[dict[str, Any]]] = {}
+    for item in data.get("items") or []:
+        if isinstance(item, dict) and item.get("id") is not None:
+            groups.setdefault(str(item.get("category") or ""), []).append(item)
+    names = {
+        str(category.get("id")): _name(category.get("name")) or ""
+        for category in data.get("categories") or []
+        if isinstance(category, dict)
+    }
+
+    sections = {}
+    for section_id, items in groups.items():
+        fingerprint = _fingerprint(items)
+        old = previous.sections.get(section_id) if previous is not None else None
+        if old is not None and old.fingerprint == fingerprint:
+            sections[section_id] = old
+            continue
+        sections[section_id] = MenuSection(
+            section_id,
+            names.get(section_id, ""),
+            fingerprint,
+            {(menu_item := _menu_item(item)).item_id: menu_item for item in items},
+        )
+    return Menu(slug, sections)
+
+
+class WoltClient(Protocol):
+    """Backend able to report venue open states."""
+
+    async def async_get_status(self, slug: str) -> VenueStatus:
+        """Return the current status of a single venue."""
+
+    async def async_get_nearby(
+        self, latitude: float, longitude: float
+    ) -> list[VenueStatus]:
+        """Return the status of every venue listed around a point."""
+
+    async def async_get_menu(self, slug: str) -> Menu:
+        """Return a venue's menu."""
+
+
+class AiohttpWoltClient:
+    """Non-blocking Wolt client on top of a shared aiohttp session.
+
+    Home Assistant's shared session pools keep-alive connections, so polls
+    reuse TLS connections instead of paying a handshake per request.  A
+    semaphore caps how many requests are in flight at once.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        *,
+        base_url: str = WOLT_API_BASE_URL,
+        timeout: float = REQUEST_TIMEOUT_SECONDS,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+        max_validators: int = STATUS_CACHE_MAX_SIZE,
+    ) -> None:
+        """Initialize the client."""
+        self._session = session
+        self._base_url = base_url.rstrip("/")
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Last ETag/Last-Modified and result per path, for conditional polls
+        self._validators: OrderedDict[
+            str, tuple[str | None, str | None, Any]
+        ] = OrderedDict()
+        self._max_validators = max_validators
+        self.not_modified = 0
+
+    async def _async_get(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[int, Mapping[str, str], bytes]:
+        """GET a path and return the status, headers and raw body."""
+        url = f"{self._base_url}{path}"
+        async with self._semaphore:
+            try:
+                async with self._session.get(
+                    url, params=params, headers=headers, timeout=self._timeout
+                ) as resp:
+                    if resp.status == 404:
+                        raise WoltWatchNotFoundError(f"Wolt API has no {path}")
+                    if resp.status == 429:
+                        raise WoltWatchRateLimitError(
+                            f"Wolt API rate limited {path}",
+                            _retry_after(resp.headers.get("Retry-After")),
+                        )
+                    if resp.status >= 500:
+                        raise WoltWatchServerError(
+                            f"Wolt API returned HTTP {resp.status} for {path}"
+                        )
+                    if resp.status >= 400:
+                        raise WoltWatchAPIError(
+                            f"Wolt API returned HTTP {resp.status} for {path}"
+                        )
+                    return resp.status, resp.headers, await resp.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                raise WoltWatchConnectionError(
+                    f"Error talking to Wolt API: {err!r}"
+                ) from err
+
+    async def _async_get_json(
+        self, path: str, params: dict[str, Any] | None = None
+    ) -> Any:
+        """GET a path and decode the JSON body."""
+        _, _, body = await self._async_get(path, params)
+        return _decode(body, path)
+
+    async def async_warm_up(self) -> None:
+        """Open a pooled connection to Wolt so the first poll skips the handshake."""
+        try:
+            async with self._session.head(
+                f"{self._base_url}/", timeout=self._timeout
+            ):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.debug("Wolt API warm-up failed: %s", err)
+
+    async def _async_get_conditional(
+        self, path: str, parse: Callable[[Any, _T | None], _T]
+    ) -> _T:
+        """GET a path, reusing the last result when Wolt answers 304.
+
+        ``parse`` builds the result from the decoded body and the previous
+        result for the path, if any.
+        """
+        headers = {}
+        previous: _T | None = None
+        if (known := self._validators.get(path)) is not None:
+            etag, last_modified, previous = known
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        code, resp_headers, body = await self._async_get(path, headers=headers)
+        if code == 304 and known is not None:
+            self.not_modified += 1
+            self._validators.move_to_end(path)
+            return previous  # type: ignore[return-value]
+
+        result = parse(_decode(body, path), previous)
+        self._validators[path] = (
+            resp_headers.get("ETag"),
+            resp_headers.get("Last-Modified"),
+            result,
+        )
+        self._validators.move_to_end(path)
+        while len(self._validators) > self._max_validators:
+            self._validators.popitem(last=False)
+        return result
+
+    async def async_get_status(self, slug: str) -> VenueStatus:
+        """Return the current status of a single venue.
+
+        Repeat polls are conditional: when Wolt answers 304 Not Modified the
+        previous status is reused without downloading or parsing a body.
+        """
+
+        def parse(data: Any, previous: VenueStatus | None) -> VenueStatus:
+            """Extract the status from a venue response."""
+            results = data.get("results") if isinstance(data, dict) else None
+            if not results or (status := venue_status_from_payload(results[0])) is None:
+                raise WoltWatchNotFoundError(f"Unknown Wolt venue: {slug}")
+            return status
+
+        return await self._async_get_conditional(
+            f"/v3/venues/slug/{quote(slug, safe='')}", parse
+        )
+
+    async def async_get_menu(self, slug: str) -> Menu:
+        """Return a venue's menu.
+
+        Polls are conditional like status polls, and sections whose content
+        did not change are carried over from the previous menu.
+        """
+        return await self._async_get_conditional(
+            f"/v4/venues/slug/{quote(slug, safe='')}/menu/data",
+            lambda data, previous: menu_from_payload(slug, data, previous),
+        )
+
+    async def async_get_nearby(
+        self, latitude: float, longitude: float
+    ) -> list[VenueStatus]:
+        """Return the status of every venue listed around a point."""
+        data = await self._async_get_json(
+            "/v1/pages/restaurants", {"lat": latitude, "lon": longitude}
+        )
+        statuses = []
+        for section in data.get("sections", []) if isinstance(data, dict) else []:
+            for item in section.get("items") or []:
+                if (venue := item.get("venue")) and (
+                    status := venue_status_from_payload(venue)
+                ):
+                    statuses.append(status)
+        return statuses
+
+
+_process_api: Any = None
+
+
+def _worker_api() -> Any:
+    """Return the worker process's own ``WoltAPI``, creating it on first use."""
+    global _process_api  # pylint: disable=global-statement
+    if _process_api is None:
+        _process_api = importlib.import_module("wolt_api_mcp").WoltAPI()
+    return _process_api
+
+
+class ProcessWoltAPI:
+    """Picklable stand-in for ``WoltAPI`` used with a process pool.
+
+    Only this empty object crosses the process boundary; each call runs on
+    a ``WoltAPI`` that the worker process creates and keeps.
+    """
+
+    def is_restaurant_open(self, slug: str) -> bool:
+        """Return whether a venue is open."""
+        return _worker_api().is_restaurant_open(slug)
+
+    def get_nearby_restaurants(
+        self, latitude: float, longitude: float, limit: int
+    ) -> list[dict[str, Any]]:
+        """Return the venues listed around a point."""
+        return _worker_api().get_nearby_restaurants(latitude, longitude, limit)
+
+
+def _sdk_not_found(err: Exception) -> bool:
+    """Return whether an SDK error means the venue does not exist."""
+    response = getattr(err, "response", None)
+    if getattr(response, "status_code", None) == 404:
+        return True
+    # The SDK fails to validate the empty payload of an unknown venue
+    if type(err).__name__ != "WoltAPIError":
+        return False
+    return "validation error" in str(err).casefold()
+
+
+class ExecutorWoltClient:
+    """Fallback backend running the blocking wolt-sdk in an executor."""
+
+    def __init__(self, api: Any, run_in_executor: ExecutorRunner) -> None:
+        """Initialize the client around a ``WoltAPI`` instance."""
+        self._api = api
+        self._run_in_executor = run_in_executor
+
+    async def _async_run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run an SDK call in the executor, mapping its errors."""
+        try:
+            return await self._run_in_executor(func, *args)
+        except WoltWatchException:
+            raise
+        except Exception as err:
+            if _sdk_not_found(err):
+                raise WoltWatchNotFoundError(f"Unknown Wolt venue: {err}") from err
+            if isinstance(err, OSError):
+                # requests' exceptions are OSErrors: the network failed
+                raise WoltWatchConnectionError(
+                    f"Error talking to Wolt API: {err!r}"
+                ) from err
+            raise WoltWatchAPIError(f"Wolt SDK error: {err}") from err
+
+    async def async_close(self) -> None:
+        """Release the SDK's resources, if it has any to release."""
+        if (close := getattr(self._api, "close", None)) is not None:
+            await self._run_in_executor(close)
+
+    async def async_get_status(self, slug: str) -> VenueStatus:
+        """Return the current status of a single venue."""
+        is_open = await self._async_run(self._api.is_restaurant_open, slug)
+        if is_open is None:
+            raise WoltWatchNotFoundError(f"Unknown Wolt venue: {slug}")
+        return VenueStatus(slug, bool(is_open))
+
+    async def async_get_nearby(
+        self, latitude: float, longitude: float
+    ) -> list[VenueStatus]:
+        """Return the status of every venue listed around a point."""
+        venues = await self._async_run(
+            self._api.get_nearby_restaurants, latitude, longitude, NEARBY_LIMIT
+        )
+        return [
+            status
+            for venue in venues or []
+            if (status := venue_status_from_payload(venue)) is not None
+        ]
+
+    async def async_get_menu(self, slug: str) -> Menu:
+        """Menus are not available through the SDK."""
+        raise WoltWatchConfigurationError(
+            "Menu watches need the aiohttp backend"
+        )
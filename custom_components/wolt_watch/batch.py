@@ -0,0 +1,127 @@
+"""Bulk open-status resolution for Wolt Watch."""
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Collection, Iterable
+import logging
+
+from .api import WoltClient
+from .const import AREA_CELL_DEGREES, BATCH_MIN_SLUGS
+from .exceptions import WoltWatchCircuitOpenError, WoltWatchRateLimitError
+from .models import Menu, VenueStatus
+
+_LOGGER = logging.getLogger(__name__)
+
+StatusResults = dict[str, "VenueStatus | Exception"]
+
+
+class BatchStatusResolver:
+    """Resolve many slugs with one listing call per area.
+
+    Venue locations are learned from earlier responses and bucketed into a
+    coarse grid.  When a cell holds enough watched venues, a single nearby
+    listing around them answers for all of them; only venues missing from
+    the listing (or without a known location) are fetched one by one.
+    """
+
+    def __init__(
+        self,
+        client: WoltClient,
+        *,
+        cell_degrees: float = AREA_CELL_DEGREES,
+        min_slugs: int = BATCH_MIN_SLUGS,
+    ) -> None:
+        """Initialize the resolver."""
+        self._client = client
+        self._cell_degrees = cell_degrees
+        self._min_slugs = min_slugs
+        self._locations: dict[str, tuple[float, float]] = {}
+
+    def _cell(self, location: tuple[float, float]) -> tuple[int, int]:
+        """Return the grid cell a location falls in."""
+        return (
+            int(location[0] // self._cell_degrees),
+            int(location[1] // self._cell_degrees),
+        )
+
+    def _learn(self, statuses: Iterable[VenueStatus]) -> None:
+        """Remember the location of every venue seen."""
+        for status in statuses:
+            if (location := status.location) is not None:
+                self._locations[status.slug] = location
+
+    async def async_resolve(
+        self, due: Collection[str], watched: Collection[str] = ()
+    ) -> StatusResults:
+        """Resolve the status of due slugs.
+
+        Results also include any other ``watched`` slug that a listing call
+        happened to cover, so callers can refresh those for free.
+        """
+        due = set(due)
+        cells: dict[tuple[int, int], list[str]] = defaultdict(list)
+        for slug in due | set(watched):
+            if (location := self._locations.get(slug)) is not None:
+                cells[self._cell(location)].append(slug)
+
+        results: StatusResults = {}
+        listings = [
+            slugs
+            for slugs in cells.values()
+            if len(slugs) >= self._min_slugs and not due.isdisjoint(slugs)
+        ]
+        for slugs, listing in zip(
+            listings,
+            await asyncio.gather(
+                *(self._async_list(slugs) for slugs in listings),
+                return_exceptions=True,
+            ),
+        ):
+            if isinstance(
+                listing, (WoltWatchRateLimitError, WoltWatchCircuitOpenError)
+            ):
+                # Falling back to one call per venue would only dig deeper
+                for slug in due.intersection(slugs):
+                    results[slug] = listing
+                continue
+            if isinstance(listing, Exception):
+                _LOGGER.debug("Listing call failed, resolving one by one: %s", listing)
+                continue
+            for slug in slugs:
+                if (status := listing.get(slug)) is not None:
+                    results[slug] = status
+
+        missing = [slug for slug in due if slug not in results]
+        for slug, result in zip(
+            missing,
+            await asyncio.gather(
+                *(self._client.async_get_status(slug) for slug in missing),
+                return_exceptions=True,
+            ),
+        ):
+            results[slug] = result
+        self._learn(
+            result for result in results.values() if isinstance(result, VenueStatus)
+        )
+        return results
+
+    async def _async_list(self, slugs: list[str]) -> dict[str, VenueStatus]:
+        """List the venues around the centre of a group of slugs."""
+        points = [self._locations[slug] for slug in slugs]
+        latitude = sum(point[0] for point in points) / len(points)
+        longitude = sum(point[1] for point in points) / len(points)
+        statuses = await self._client.async_get_nearby(latitude, longitude)
+        return {status.slug: status for status in statuses}
+
+    async def async_get_nearby(
+        self, latitude: float, longitude: float
+    ) -> list[VenueStatus]:
+        """List the venues around a point, learning their locations."""
+        statuses = await self._client.async_get_nearby(latitude, longitude)
+        self._learn(statuses)
+        return statuses
+
+    async def async_get_menu(self, slug: str) -> Menu:
+        """Return a venue's menu; menus are fetched one venue at a time."""
+        return await self._client.async_get_menu(slug)
@@ -0,0 +1,180 @@
+"""Circuit breaker around the Wolt backend."""
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+import logging
+import time
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .const import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_PROBE_RETRY_SECONDS,
+    BREAKER_RESET_SECONDS,
+)
+from .exceptions import (
+    WoltWatchAPIError,
+    WoltWatchCircuitOpenError,
+    WoltWatchConnectionError,
+    WoltWatchRateLimitError,
+    WoltWatchServerError,
+)
+from .models import Menu, VenueStatus
+
+if TYPE_CHECKING:
+    from .api import WoltClient
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# Errors that say Wolt itself is struggling, as opposed to a bad slug
+UPSTREAM_ERRORS = (
+    WoltWatchConnectionError,
+    WoltWatchServerError,
+    WoltWatchRateLimitError,
+)
+
+
+class CircuitBreaker:
+    """Stop calling Wolt after repeated upstream failures.
+
+    After ``threshold`` consecutive failures the breaker opens and every
+    request fails fast.  Once ``reset_timeout`` has passed a single probe is
+    let through; its success closes the breaker, its failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a closed breaker."""
+        self._threshold = threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.trips = 0
+        self.on_state_change: Callable[[str], None] | None = None
+
+    @property
+    def state(self) -> str:
+        """Return the current state."""
+        return self._state
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self._state,
+            "consecutive_failures": self._failures,
+            "trips": self.trips,
+            "retry_in_s": round(self.time_until_retry(), 1),
+        }
+
+    def _set_state(self, state: str) -> None:
+        """Move to a new state and tell the listener."""
+        if state == self._state:
+            return
+        self._state = state
+        if self.on_state_change is not None:
+            self.on_state_change(state)
+
+    def time_until_retry(self) -> float:
+        """Return seconds until requests may be attempted again."""
+        if self._state == STATE_OPEN:
+            return max(self._opened_at + self._reset_timeout - self._clock(), 0)
+        if self._state == STATE_HALF_OPEN and self._probing:
+            return BREAKER_PROBE_RETRY_SECONDS
+        return 0
+
+    def allow(self) -> bool:
+        """Return whether a request may go out now."""
+        if self._state == STATE_OPEN and self.time_until_retry() <= 0:
+            self._set_state(STATE_HALF_OPEN)
+        if self._state == STATE_CLOSED:
+            return True
+        if self._state == STATE_HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        self._failures = 0
+        self._probing = False
+        self._set_state(STATE_CLOSED)
+
+    def record_failure(self) -> None:
+        """Record an upstream failure."""
+        self._failures += 1
+        if self._state == STATE_HALF_OPEN or self._failures >= self._threshold:
+            if self._state != STATE_OPEN:
+                self.trips += 1
+                _LOGGER.warning(
+                    "Wolt API circuit breaker opened after %d failures; "
+                    "pausing polls for %ds",
+                    self._failures,
+                    self._reset_timeout,
+                )
+            self._opened_at = self._clock()
+            self._probing = False
+            self._set_state(STATE_OPEN)
+
+    def release(self) -> None:
+        """Forget an in-flight probe that ended without a verdict."""
+        self._probing = False
+
+
+class BreakerWoltClient:
+    """Wolt client that fails fast while the breaker is open."""
+
+    def __init__(self, client: WoltClient, breaker: CircuitBreaker) -> None:
+        """Initialize the wrapper."""
+        self._client = client
+        self._breaker = breaker
+
+    async def _async_call(self, func: Callable[..., Awaitable[_T]], *args: Any) -> _T:
+        """Run one request through the breaker."""
+        if not self._breaker.allow():
+            raise WoltWatchCircuitOpenError(
+                "Wolt API circuit breaker is open",
+                self._breaker.time_until_retry(),
+            )
+        try:
+            result = await func(*args)
+        except UPSTREAM_ERRORS:
+            self._breaker.record_failure()
+            raise
+        except WoltWatchAPIError:
+            # Wolt answered; the request itself was bad
+            self._breaker.record_success()
+            raise
+        except BaseException:
+            self._breaker.release()
+            raise
+        self._breaker.record_success()
+        return result
+
+    async def async_get_status(self, slug: str) -> VenueStatus:
+        """Return the current status of a single venue."""
+        return await self._async_call(self._client.async_get_status, slug)
+
+    async def async_get_nearby(
+        self, latitude: float, longitude: float
+    ) -> list[VenueStatus]:
+        """Return the status of every venue listed around a point."""
+        return await self._async_call(
+            self._client.async_get_nearby, latitude, longitude
+        )
+
+    async def async_get_menu(self, slug: str) -> Menu:
+        """Return a venue's menu."""
+        return await self._async_call(self._client.async_get_menu, slug)
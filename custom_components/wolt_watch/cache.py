@@ -0,0 +1,123 @@
+"""Shared venue status cache for Wolt Watch."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+import time
+from typing import TYPE_CHECKING
+
+from .const import STATUS_CACHE_MAX_SIZE, STATUS_CACHE_TTL_SECONDS
+from .models import Menu, VenueStatus
+
+if TYPE_CHECKING:
+    from .api import WoltClient
+
+StatusFetcher = Callable[[str], Awaitable[VenueStatus]]
+
+
+class StatusCache:
+    """Size-bounded TTL cache of venue statuses.
+
+    Entries are evicted least-recently-used once the cache is full, and
+    concurrent misses on the same slug share a single fetch.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = STATUS_CACHE_TTL_SECONDS,
+        max_size: int = STATUS_CACHE_MAX_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache."""
+        self._ttl = ttl
+        self._max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, VenueStatus]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Future[VenueStatus]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def get(self, slug: str) -> VenueStatus | None:
+        """Return a fresh cached status, or None."""
+        if (entry := self._entries.get(slug)) is None:
+            return None
+        fetched_at, status = entry
+        if self._clock() - fetched_at >= self._ttl:
+            return None
+        self._entries.move_to_end(slug)
+        return status
+
+    def peek(self, slug: str) -> tuple[VenueStatus, float] | None:
+        """Return the last known status and its age, fresh or not."""
+        if (entry := self._entries.get(slug)) is None:
+            return None
+        fetched_at, status = entry
+        return status, self._clock() - fetched_at
+
+    def set(self, status: VenueStatus, age: float = 0) -> None:
+        """Store a status, evicting the least recently used entry if full."""
+        self._entries[status.slug] = (self._clock() - age, status)
+        self._entries.move_to_end(status.slug)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    async def async_get(self, slug: str, fetch: StatusFetcher) -> VenueStatus:
+        """Return a cached status, fetching it once on a miss."""
+        if (status := self.get(slug)) is not None:
+            self.hits += 1
+            return status
+        if (future := self._in_flight.get(slug)) is not None:
+            self.hits += 1
+            return await asyncio.shield(future)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[slug] = future
+        try:
+            status = await fetch(slug)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as err:
+            future.set_exception(err)
+            # Retrieve it so an unawaited future does not log a warning
+            future.exception()
+            raise
+        else:
+            self.set(status)
+            future.set_result(status)
+            return status
+        finally:
+            del self._in_flight[slug]
+
+
+class CachedWoltClient:
+    """Wolt client answering status lookups from a shared cache."""
+
+    def __init__(self, client: WoltClient, cache: StatusCache) -> None:
+        """Initialize the wrapper."""
+        self._client = client
+        self.cache = cache
+
+    async def async_get_status(self, slug: str) -> VenueStatus:
+        """Return the status of a venue, from cache when fresh."""
+        return await self.cache.async_get(slug, self._client.async_get_status)
+
+    async def async_get_nearby(
+        self, latitude: float, longitude: float
+    ) -> list[VenueStatus]:
+        """List nearby venues, caching every status returned."""
+        statuses = await self._client.async_get_nearby(latitude, longitude)
+        for status in statuses:
+            self.cache.set(status)
+        return statuses
+
+    async def async_get_menu(self, slug: str) -> Menu:
+        """Return a venue's menu; menus are not cached."""
+        return await self._client.async_get_menu(slug)
@@ -10,14 +10,141 @@ DOMAIN = "wolt_watch"
 DEFAULT_TIMEOUT_MINUTES = 30  # 30 minutes
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=60)
 BACKOFF_INTERVAL_SECONDS = 90
+BACKOFF_MAX_SECONDS = 30 * 60
+
+# Request budget shared by all watches
+DEFAULT_REQUESTS_PER_MINUTE = 60
+RATE_LIMIT_BURST = 10
+
+# Circuit breaker
+BREAKER_FAILURE_THRESHOLD = 5  # Consecutive upstream failures before opening
+BREAKER_RESET_SECONDS = 120  # Time open before a half-open probe
+BREAKER_PROBE_RETRY_SECONDS = 15  # Recheck while a probe is in flight
+EVENT_BREAKER_STATE_CHANGED = "wolt_watch_breaker_state_changed"
+
+# Opening-hours aware cadence
+DENSE_SCAN_INTERVAL_SECONDS = 15  # Around a scheduled opening
+OPENING_LEAD_SECONDS = 5 * 60  # Start dense polling this long before opening
+OPENING_GRACE_SECONDS = 15 * 60  # Keep dense polling this long after it
+MAX_IDLE_SLEEP_SECONDS = 30 * 60  # Still catch unscheduled openings
+
+# Opening times learnt from observed transitions, for venues without hours
+HISTORY_SIZE = 64  # Transitions kept per venue, oldest overwritten first
+HISTORY_MAX_VENUES = 2000  # Least recently changed venues are dropped
+HISTORY_MIN_OPENINGS = 2  # Observed openings before a window is predicted
+HISTORY_SPARSE_INTERVAL_SECONDS = 5 * 60  # Outside the learnt window
+HISTORY_STORAGE_KEY = "wolt_watch.history"
+HISTORY_SAVE_DELAY_SECONDS = 60
+
+# Scheduler tuning
+SCAN_JITTER = 0.1  # +/- 10% of each poll delay
+SCHEDULER_WORKERS = 8  # Concurrent polls, independent of watch count
+
+# Load shedding when the request budget cannot cover every due poll
+MAX_POLL_INTERVAL_SECONDS = MAX_IDLE_SLEEP_SECONDS  # Poll everything this often
+PRIORITY_HORIZON_SECONDS = 10 * 60  # Watches expiring within this are urgent
+CHURN_HALF_LIFE_SECONDS = 30 * 60  # Decay of a venue's recent state changes
+
+# Wolt API client
+WOLT_API_BASE_URL = "https://restaurant-api.wolt.com"
+REQUEST_TIMEOUT_SECONDS = 10
+MAX_CONCURRENT_REQUESTS = 10
+NEARBY_LIMIT = 200  # Venues requested per listing call (SDK backend)
+
+# Dedicated executor for the blocking SDK backend
+SDK_WORKERS = 4  # Threads (or processes) running SDK calls
+SDK_QUEUE_DEPTH = 32  # Calls waiting for a worker before new ones are rejected
+SDK_CALL_TIMEOUT_SECONDS = 15  # Hard deadline per call, queueing included
+
+# Batch status resolution
+AREA_CELL_DEGREES = 0.02  # ~2 km grid cells used to group venues by area
+BATCH_MIN_SLUGS = 2  # Watched venues in a cell before a listing call pays off
+
+# Area watches
+AREA_DEFAULT_RADIUS_KM = 2.0
+# Largest circle accepted.  One listing around the centre is all an area
+# poll sees, so venues further out that Wolt does not list there are missed.
+AREA_MAX_RADIUS_KM = 10.0
+
+# Status cache
+STATUS_CACHE_TTL_SECONDS = 10  # Below the dense interval so polls stay live
+STATUS_CACHE_MAX_SIZE = 1000
+
+# Notification dispatch
+NOTIFY_COALESCE_SECONDS = 2  # Openings for one device within this become one push
+NOTIFY_CONCURRENCY = 4  # Notify calls in flight at once
+NOTIFY_RETRIES = 3
+NOTIFY_RETRY_SECONDS = 2  # Doubled after every failed attempt
+
+# Metrics
+METRICS_WINDOW_SECONDS = 60  # Window for per-minute call rates
+LATENCY_BUCKETS_SECONDS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+METRICS_SCAN_INTERVAL = timedelta(seconds=30)  # Aggregate sensor refresh
+
+# Venue index for slug autocomplete
+VENUE_INDEX_MAX_SIZE = 20000
+VENUE_INDEX_STORAGE_KEY = "wolt_watch.venues"
+VENUE_INDEX_SAVE_DELAY_SECONDS = 60
+VENUE_SEARCH_LIMIT = 10
+
+# On-demand profiling
+PROFILE_DEFAULT_SECONDS = 30
+PROFILE_MAX_SECONDS = 600
+PROFILE_SAMPLE_INTERVAL_SECONDS = 0.005  # Stack samples of the event loop
+PROFILE_BLOCK_THRESHOLD_SECONDS = 0.1  # Loop held this long counts as blocked
+PROFILE_TOP = 20  # Entries per table in the service response
+
+# Persistence
+STORAGE_KEY = "wolt_watch.watches"
+STORAGE_VERSION = 1
+SAVE_DELAY_SECONDS = 10  # Coalesce bursts of changes into one write
 
 # Service configuration
 SERVICE_START = "start"
+SERVICE_START_MANY = "start_many"
+SERVICE_STATUS = "status"
+SERVICE_METRICS = "metrics"
+SERVICE_LIST = "list"
+SERVICE_CANCEL = "cancel"
+SERVICE_EXTEND = "extend"
+SERVICE_WATCH_MENU = "watch_menu"
+SERVICE_PROFILE = "profile"
+SERVICE_WATCH_AREA = "watch_area"
 
 # Configuration keys
 CONF_SLUG = "slug"
 CONF_TIMEOUT_M = "timeout_m"
 CONF_DEVICE = "device"
+CONF_WATCH_ID = "watch_id"
+CONF_MINUTES = "minutes"
+CONF_BACKEND = "backend"
+CONF_REQUESTS_PER_MINUTE = "requests_per_minute"
+CONF_API_URL = "api_url"
+CONF_SENSORS = "sensors"
+CONF_WARM_UP = "warm_up"
+CONF_SDK_WORKERS = "sdk_workers"
+CONF_SDK_TIMEOUT = "sdk_call_timeout"
+CONF_SDK_PROCESSES = "sdk_processes"
+CONF_ITEMS = "items"
+CONF_PRICE_CHANGES = "price_changes"
+CONF_ETA_BELOW = "eta_below"
+CONF_MAX_POLL_INTERVAL = "max_poll_interval"
+CONF_SECONDS = "seconds"
+CONF_LATITUDE = "latitude"
+CONF_LONGITUDE = "longitude"
+CONF_RADIUS = "radius"
+
+# hass.data keys
+DATA_METRICS = f"{DOMAIN}_metrics"
+DATA_VENUE_INDEX = f"{DOMAIN}_venue_index"
+
+# Websocket commands
+WS_VENUE_SEARCH = f"{DOMAIN}/venues/search"
+WS_WATCHES_SUBSCRIBE = f"{DOMAIN}/watches/subscribe"
+
+# Client backends
+BACKEND_AIOHTTP = "aiohttp"  # Native asyncio client on HA's shared session
+BACKEND_SDK = "sdk"  # Blocking wolt-sdk run in the executor
 
 # Validation limits
 MIN_TIMEOUT_MINUTES = 1  # 1 minute
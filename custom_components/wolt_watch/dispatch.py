@@ -0,0 +1,154 @@
+"""Notification queue for Wolt Watch."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+import logging
+import time
+
+from .const import (
+    NOTIFY_COALESCE_SECONDS,
+    NOTIFY_CONCURRENCY,
+    NOTIFY_RETRIES,
+    NOTIFY_RETRY_SECONDS,
+)
+from .exceptions import WoltWatchConfigurationError
+from .metrics import Metrics
+from .scheduler import TaskFactory
+
+_LOGGER = logging.getLogger(__name__)
+
+Sender = Callable[[str, str], Awaitable[None]]
+
+
+@dataclass
+class _Batch:
+    """Openings and alerts waiting to be sent to one device."""
+
+    queued_at: float
+    names: dict[str, None] = field(default_factory=dict)
+    alerts: dict[str, None] = field(default_factory=dict)
+    timer: asyncio.TimerHandle | None = None
+
+
+def opening_message(names: list[str]) -> str:
+    """Return the notification text for one or more opened restaurants."""
+    if len(names) == 1:
+        return f"{names[0]} is now OPEN on Wolt!"
+    return f"{', '.join(names[:-1])} and {names[-1]} are now OPEN on Wolt!"
+
+
+class NotificationDispatcher:
+    """Deliver opening notifications off the polling path.
+
+    Openings for the same device within ``window`` seconds are coalesced
+    into one message.  A fixed pool of workers sends them, so a slow notify
+    backend limits only notification throughput, and failed sends are
+    retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        send: Sender,
+        *,
+        window: float = NOTIFY_COALESCE_SECONDS,
+        concurrency: int = NOTIFY_CONCURRENCY,
+        retries: int = NOTIFY_RETRIES,
+        retry_delay: float = NOTIFY_RETRY_SECONDS,
+        metrics: Metrics | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the dispatcher."""
+        self._send = send
+        self._window = window
+        self._concurrency = concurrency
+        self._retries = retries
+        self._retry_delay = retry_delay
+        self._metrics = metrics or Metrics(clock=clock)
+        self._clock = clock
+        self._pending: dict[str, _Batch] = {}
+        self._queue: asyncio.Queue[tuple[str, _Batch]] = asyncio.Queue()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def pending(self) -> int:
+        """Return the number of messages waiting to be sent."""
+        return len(self._pending) + self._queue.qsize()
+
+    def start(self, create_task: TaskFactory) -> None:
+        """Start the sender tasks."""
+        if self._tasks:
+            return
+        self._tasks = [
+            create_task(self._async_work()) for _ in range(self._concurrency)
+        ]
+
+    async def async_stop(self) -> None:
+        """Cancel the senders, dropping anything not yet sent."""
+        for batch in self._pending.values():
+            if batch.timer is not None:
+                batch.timer.cancel()
+        if dropped := self.pending:
+            _LOGGER.warning("Dropping %d unsent Wolt notifications", dropped)
+        self._pending.clear()
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _batch(self, device: str) -> _Batch:
+        """Return the device's pending batch, starting its window if new."""
+        if (batch := self._pending.get(device)) is None:
+            batch = self._pending[device] = _Batch(self._clock())
+            batch.timer = asyncio.get_running_loop().call_later(
+                self._window, self._flush, device
+            )
+        return batch
+
+    def enqueue(self, device: str, name: str) -> None:
+        """Queue an opening for a device, coalescing with recent ones."""
+        self._batch(device).names[name] = None
+
+    def enqueue_alert(self, device: str, text: str) -> None:
+        """Queue a free-form alert line for a device, such as a menu change."""
+        self._batch(device).alerts[text] = None
+
+    def _flush(self, device: str) -> None:
+        """Hand a device's coalesced openings to the senders."""
+        if (batch := self._pending.pop(device, None)) is not None:
+            self._queue.put_nowait((device, batch))
+
+    async def _async_work(self) -> None:
+        """Send queued messages."""
+        while True:
+            device, batch = await self._queue.get()
+            await self._async_deliver(device, batch)
+
+    async def _async_deliver(self, device: str, batch: _Batch) -> None:
+        """Send one message, retrying transient failures."""
+        lines = [opening_message(list(batch.names))] if batch.names else []
+        message = "\n".join([*lines, *batch.alerts])
+        for attempt in range(self._retries + 1):
+            try:
+                await self._send(device, message)
+            except WoltWatchConfigurationError as err:
+                _LOGGER.error("Cannot notify %s: %s", device, err)
+                break
+            except Exception as err:  # pylint: disable=broad-except
+                if attempt == self._retries:
+                    _LOGGER.error(
+                        "Failed to notify %s after %d attempts: %s",
+                        device,
+                        attempt + 1,
+                        err,
+                    )
+                    break
+                _LOGGER.warning("Failed to notify %s, retrying: %s", device, err)
+                await asyncio.sleep(self._retry_delay * 2**attempt)
+            else:
+                self._metrics.notifications += 1
+                self._metrics.notify_latency.observe(self._clock() - batch.queued_at)
+                _LOGGER.info("Sent notification to %s: %s", device, message)
+                return
+        self._metrics.notification_failures += 1
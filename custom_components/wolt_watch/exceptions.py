@@ -10,9 +10,43 @@ class WoltWatchConnectionError(WoltWatchException):
     """Exception for connection errors."""
 
 
+class WoltWatchBusyError(WoltWatchConnectionError):
+    """Exception for calls rejected because the SDK executor is saturated."""
+
+
 class WoltWatchConfigurationError(WoltWatchException):
     """Exception for configuration errors."""
 
 
+class WoltWatchProfileError(WoltWatchException):
+    """Exception for profiles that cannot be started."""
+
+
 class WoltWatchAPIError(WoltWatchException):
-    """Exception for API errors."""
\ No newline at end of file
+    """Exception for API errors."""
+
+
+class WoltWatchNotFoundError(WoltWatchAPIError):
+    """Exception for venues that do not exist; retrying will not help."""
+
+
+class WoltWatchServerError(WoltWatchAPIError):
+    """Exception for transient server-side (5xx) errors."""
+
+
+class WoltWatchRateLimitError(WoltWatchAPIError):
+    """Exception for rate-limited (429) requests."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        """Initialize with the server's Retry-After hint, in seconds."""
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class WoltWatchCircuitOpenError(WoltWatchException):
+    """Exception for requests skipped while the circuit breaker is open."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        """Initialize with the seconds until requests may resume."""
+        super().__init__(message)
+        self.retry_after = retry_after
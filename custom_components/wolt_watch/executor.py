@@ -0,0 +1,162 @@
+"""Dedicated, bounded executor for the blocking wolt-sdk."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+import logging
+from multiprocessing import get_context
+import time
+from typing import Any, TypeVar
+
+from .const import SDK_CALL_TIMEOUT_SECONDS, SDK_QUEUE_DEPTH, SDK_WORKERS
+from .exceptions import WoltWatchBusyError, WoltWatchConnectionError
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class BoundedExecutor:
+    """Pool of workers reserved for Wolt SDK calls.
+
+    Keeps the SDK off Home Assistant's shared executor.  At most
+    ``max_workers`` calls run and ``max_queue`` wait; further calls are
+    rejected at once with :class:`WoltWatchBusyError` instead of piling up.
+    Every call has a hard deadline, queueing included, after which the
+    caller gets :class:`WoltWatchConnectionError` and the call is abandoned.
+
+    A thread cannot be killed, so an abandoned call keeps its worker until
+    it returns and is counted as stuck until then.  With ``processes`` the
+    SDK runs in worker processes instead, and a call past its deadline
+    tears the pool down and terminates the processes.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = SDK_WORKERS,
+        max_queue: int = SDK_QUEUE_DEPTH,
+        timeout: float = SDK_CALL_TIMEOUT_SECONDS,
+        processes: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the executor; workers start on the first call."""
+        self._max_workers = max_workers
+        self._max_queue = max_queue
+        self._timeout = timeout
+        self._processes = processes
+        self._clock = clock
+        self._pool: Executor | None = None
+        # Submitted calls that have not returned, abandoned ones included
+        self._pending = 0
+        self.stuck = 0
+        self.abandoned = 0
+        self.rejected = 0
+        self.completed = 0
+
+    def _executor(self) -> Executor:
+        """Return the pool, starting it if needed."""
+        if self._pool is None:
+            if self._processes:
+                # Spawned, not forked: forking a threaded process is unsafe
+                self._pool = ProcessPoolExecutor(
+                    self._max_workers, mp_context=get_context("spawn")
+                )
+            else:
+                self._pool = ThreadPoolExecutor(
+                    self._max_workers, thread_name_prefix="wolt_watch_sdk"
+                )
+        return self._pool
+
+    def _recycle(self, pool: Executor | None) -> None:
+        """Tear a pool down, killing calls stuck in it if it has processes."""
+        if pool is None:
+            return
+        if self._pool is pool:
+            self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        # ProcessPoolExecutor has no public way to stop a running call
+        processes = getattr(pool, "_processes", None) or {}
+        for process in list(processes.values()):
+            process.terminate()
+
+    async def async_run(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking call on a dedicated worker, within the deadline."""
+        if self._pending >= self._max_workers + self._max_queue:
+            self.rejected += 1
+            raise WoltWatchBusyError(
+                f"Wolt SDK executor is saturated ({self._pending} calls pending)"
+            )
+        loop = asyncio.get_running_loop()
+        started = self._clock()
+        pool = self._executor()
+        future = pool.submit(func, *args)
+        self._pending += 1
+        abandoned = False
+
+        def _finished() -> None:
+            """Release the call's slot once its worker is free again."""
+            self._pending -= 1
+            if abandoned:
+                self.stuck -= 1
+                _LOGGER.info(
+                    "Abandoned Wolt SDK call %s returned after %.1fs",
+                    getattr(func, "__name__", func),
+                    self._clock() - started,
+                )
+
+        def _done(_: Future[_T]) -> None:
+            """Hop back to the event loop from the worker."""
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_finished)
+
+        future.add_done_callback(_done)
+        try:
+            result = await asyncio.wait_for(
+                asyncio.wrap_future(future), self._timeout
+            )
+        except asyncio.TimeoutError as err:
+            self.abandoned += 1
+            if not future.done():
+                abandoned = True
+                self.stuck += 1
+            _LOGGER.warning(
+                "Wolt SDK call %s exceeded %ss and was abandoned",
+                getattr(func, "__name__", func),
+                self._timeout,
+            )
+            if self._processes:
+                self._recycle(pool)
+            raise WoltWatchConnectionError(
+                f"Wolt SDK call timed out after {self._timeout}s"
+            ) from err
+        except BrokenExecutor as err:
+            self._recycle(pool)
+            raise WoltWatchConnectionError(f"Wolt SDK worker died: {err!r}") from err
+        self.completed += 1
+        return result
+
+    def shutdown(self) -> None:
+        """Stop the workers without waiting for calls still running."""
+        self._recycle(self._pool)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the executor's configuration and counters."""
+        return {
+            "mode": "process" if self._processes else "thread",
+            "workers": self._max_workers,
+            "max_queue": self._max_queue,
+            "timeout_s": self._timeout,
+            "pending": self._pending,
+            "stuck": self.stuck,
+            "abandoned": self.abandoned,
+            "rejected": self.rejected,
+            "completed": self.completed,
+        }
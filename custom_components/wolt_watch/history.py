@@ -0,0 +1,164 @@
+"""Opening times learnt from the transitions polls observe."""
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta
+from typing import Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from .const import (
+    DENSE_SCAN_INTERVAL_SECONDS,
+    HISTORY_MAX_VENUES,
+    HISTORY_MIN_OPENINGS,
+    HISTORY_SIZE,
+    HISTORY_SPARSE_INTERVAL_SECONDS,
+    OPENING_GRACE_SECONDS,
+    OPENING_LEAD_SECONDS,
+)
+
+
+class _Ring:
+    """Fixed-size ring of transitions packed as ``minute * 2 + is_open``."""
+
+    __slots__ = ("values", "next")
+
+    def __init__(self) -> None:
+        """Initialize an empty ring."""
+        self.values = array("i")
+        # Slot the next transition overwrites once the ring is full
+        self.next = 0
+
+    def append(self, value: int, size: int) -> None:
+        """Add a transition, overwriting the oldest one if full."""
+        if len(self.values) < size:
+            self.values.append(value)
+            return
+        self.values[self.next] = value
+        self.next = (self.next + 1) % size
+
+    def __iter__(self) -> Iterator[int]:
+        """Yield the transitions, oldest first."""
+        yield from self.values[self.next :]
+        yield from self.values[: self.next]
+
+
+class OpeningHistory:
+    """Bounded record of observed open and close transitions per venue.
+
+    Each transition takes four bytes: the minute it was seen, with the new
+    state in the lowest bit.  The minutes at which a venue was seen opening
+    on past days predict a window for today, so venues without published
+    hours can still be polled densely only when they tend to open.
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int = HISTORY_SIZE,
+        max_venues: int = HISTORY_MAX_VENUES,
+        timezone: str = "UTC",
+    ) -> None:
+        """Initialize an empty history; weekdays are taken in ``timezone``."""
+        self._size = size
+        self._max_venues = max_venues
+        try:
+            self._timezone: ZoneInfo | None = ZoneInfo(timezone)
+        except (ZoneInfoNotFoundError, ValueError):
+            self._timezone = None
+        self._rings: OrderedDict[str, _Ring] = OrderedDict()
+        self.on_change: Callable[[], None] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of venues with recorded transitions."""
+        return len(self._rings)
+
+    def _local(self, moment: datetime) -> datetime:
+        """Return an aware datetime in the history's time zone."""
+        return moment.astimezone(self._timezone) if self._timezone else moment
+
+    def _append(self, slug: str, value: int) -> None:
+        """Store one packed transition, evicting the stalest venue if full."""
+        if (ring := self._rings.get(slug)) is None:
+            ring = self._rings[slug] = _Ring()
+            if len(self._rings) > self._max_venues:
+                self._rings.popitem(last=False)
+        else:
+            self._rings.move_to_end(slug)
+        ring.append(value, self._size)
+
+    def record(self, slug: str, is_open: bool, at: float) -> None:
+        """Record that a venue was seen changing state at a Unix time."""
+        self._append(slug, int(at // 60) * 2 + int(is_open))
+        if self.on_change is not None:
+            self.on_change()
+
+    def transitions(self, slug: str) -> list[tuple[float, bool]]:
+        """Return a venue's transitions as (Unix time, is_open), oldest first."""
+        ring = self._rings.get(slug)
+        return [(value // 2 * 60, bool(value & 1)) for value in ring or ()]
+
+    def opening_window(
+        self, slug: str, now: datetime
+    ) -> tuple[datetime, datetime] | None:
+        """Predict today's opening window from the venue's past openings.
+
+        Uses openings seen on the same weekday when there are enough of
+        them, otherwise those of every day.  The window spans the earliest
+        to the latest of them, dropping the outer tenth on each side once
+        there are ten or more, plus the usual lead and grace periods.
+        """
+        local = self._local(now)
+        weekday: list[int] = []
+        daily: list[int] = []
+        for at, is_open in self.transitions(slug):
+            if not is_open:
+                continue
+            seen = self._local(datetime.fromtimestamp(at, now.tzinfo))
+            minute = seen.hour * 60 + seen.minute
+            daily.append(minute)
+            if seen.weekday() == local.weekday():
+                weekday.append(minute)
+        minutes = weekday if len(weekday) >= HISTORY_MIN_OPENINGS else daily
+        if len(minutes) < HISTORY_MIN_OPENINGS:
+            return None
+
+        minutes.sort()
+        trim = len(minutes) // 10
+        minutes = minutes[trim : len(minutes) - trim]
+        midnight = local.replace(hour=0, minute=0, second=0, microsecond=0)
+        return (
+            midnight + timedelta(minutes=minutes[0], seconds=-OPENING_LEAD_SECONDS),
+            midnight + timedelta(minutes=minutes[-1], seconds=OPENING_GRACE_SECONDS),
+        )
+
+    def poll_delay(
+        self, slug: str, now: datetime, scan_interval: float
+    ) -> float | None:
+        """Return how long to wait before polling a closed venue again.
+
+        Polls densely inside the predicted window and sparsely outside it,
+        waking up in time for the window.  Returns None if too few openings
+        were seen to predict one.
+        """
+        if (window := self.opening_window(slug, now)) is None:
+            return None
+        start, end = window
+        if start <= now <= end:
+            return DENSE_SCAN_INTERVAL_SECONDS
+        sparse = max(scan_interval, HISTORY_SPARSE_INTERVAL_SECONDS)
+        if now < start:
+            until = (start - now).total_seconds()
+            return max(min(until, sparse), DENSE_SCAN_INTERVAL_SECONDS)
+        return sparse
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the history in a form suitable for storage."""
+        return {"venues": {slug: list(ring) for slug, ring in self._rings.items()}}
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Load transitions saved by :meth:`as_dict`."""
+        for slug, values in data.get("venues", {}).items():
+            for value in values:
+                self._append(slug, value)
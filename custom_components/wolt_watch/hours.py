@@ -0,0 +1,133 @@
+"""Opening-hours aware poll cadence for Wolt Watch."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from .const import (
+    DENSE_SCAN_INTERVAL_SECONDS,
+    MAX_IDLE_SLEEP_SECONDS,
+    OPENING_GRACE_SECONDS,
+    OPENING_LEAD_SECONDS,
+)
+
+WEEKDAYS = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+
+@dataclass(frozen=True)
+class OpeningHours:
+    """Weekly opening windows of a venue in its local time zone.
+
+    Windows are (start, end) pairs in minutes since Monday 00:00; an end
+    before its start wraps around the week.
+    """
+
+    windows: tuple[tuple[float, float], ...]
+    timezone: str = "UTC"
+
+    def _minute_of_week(self, now: datetime) -> float:
+        """Return the venue-local minute of the week for an aware datetime."""
+        try:
+            local = now.astimezone(ZoneInfo(self.timezone))
+        except (ZoneInfoNotFoundError, ValueError):
+            local = now
+        return (
+            local.weekday() * MINUTES_PER_DAY
+            + local.hour * 60
+            + local.minute
+            + local.second / 60
+        )
+
+    def minutes_since_opening(self, now: datetime) -> float | None:
+        """Return minutes since the current window opened, if inside one."""
+        minute = self._minute_of_week(now)
+        for start, end in self.windows:
+            since = (minute - start) % MINUTES_PER_WEEK
+            if since < (end - start) % MINUTES_PER_WEEK:
+                return since
+        return None
+
+    def minutes_until_opening(self, now: datetime) -> float | None:
+        """Return minutes until the next window opens."""
+        if not self.windows:
+            return None
+        minute = self._minute_of_week(now)
+        return min((start - minute) % MINUTES_PER_WEEK for start, _ in self.windows)
+
+
+def _windows(schedule: Any) -> list[tuple[float, float]]:
+    """Pair the open and close events of a Wolt weekly schedule."""
+    if not isinstance(schedule, dict):
+        return []
+    events: list[tuple[float, str]] = []
+    for day, day_name in enumerate(WEEKDAYS):
+        for event in schedule.get(day_name) or []:
+            value = event.get("value")
+            if isinstance(value, dict):
+                value = value.get("$date")
+            if not isinstance(value, (int, float)):
+                continue
+            events.append((day * MINUTES_PER_DAY + value / 60000, event.get("type")))
+    events.sort()
+
+    windows = []
+    for index, (minute, kind) in enumerate(events):
+        if kind != "open":
+            continue
+        # The matching close may be the first event of the following week
+        for close_minute, close_kind in events[index + 1 :] + events[: index]:
+            if close_kind == "close":
+                windows.append((minute, close_minute))
+                break
+    return windows
+
+
+def parse_opening_hours(venue: dict[str, Any]) -> OpeningHours | None:
+    """Build opening hours from a venue payload's published schedules."""
+    windows = _windows(venue.get("opening_times"))
+    delivery_specs = venue.get("delivery_specs")
+    if isinstance(delivery_specs, dict):
+        windows += _windows(delivery_specs.get("delivery_times"))
+    if not windows:
+        return None
+    return OpeningHours(tuple(sorted(set(windows))), venue.get("timezone") or "UTC")
+
+
+def poll_delay(hours: OpeningHours | None, now: datetime, scan_interval: float) -> float:
+    """Return how long to wait before polling a closed venue again.
+
+    Polls densely around a scheduled opening, sleeps until shortly before
+    the next one otherwise, and falls back to the regular interval when the
+    hours are unknown or a scheduled opening passed without the venue
+    coming online.
+    """
+    if hours is None:
+        return scan_interval
+
+    if (since := hours.minutes_since_opening(now)) is not None:
+        if since * 60 < OPENING_GRACE_SECONDS:
+            return DENSE_SCAN_INTERVAL_SECONDS
+        return scan_interval
+
+    until = hours.minutes_until_opening(now)
+    if until is None:
+        return scan_interval
+    until_s = until * 60
+    if until_s <= OPENING_LEAD_SECONDS:
+        return DENSE_SCAN_INTERVAL_SECONDS
+    return max(
+        min(until_s - OPENING_LEAD_SECONDS, MAX_IDLE_SLEEP_SECONDS),
+        DENSE_SCAN_INTERVAL_SECONDS,
+    )
@@ -0,0 +1,132 @@
+"""Lifecycle of the shared Wolt client."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import WoltWatchConfigurationError
+from .models import Menu, VenueStatus
+
+if TYPE_CHECKING:
+    from .api import WoltClient
+
+_LOGGER = logging.getLogger(__name__)
+
+ClientFactory = Callable[[], Awaitable["WoltClient"]]
+BackgroundTaskFactory = Callable[[Coroutine[Any, Any, None]], "asyncio.Task[None]"]
+
+
+class WoltClientLifecycle:
+    """Build one Wolt client in the background and share it.
+
+    The factory runs once, off the setup path; requests made before it
+    finishes wait for it.  If the factory fails every request raises
+    :class:`WoltWatchConfigurationError`.  Also records how long setup took
+    to get a client and its first successful poll.
+    """
+
+    def __init__(
+        self,
+        factory: ClientFactory,
+        *,
+        warm_up: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the lifecycle; nothing is built until start."""
+        self._factory = factory
+        self._warm_up = warm_up
+        self._clock = clock
+        self._started_at = clock()
+        self._client: WoltClient | None = None
+        self._ready: asyncio.Future[WoltClient | None] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self.client_ready_s: float | None = None
+        self.first_poll_s: float | None = None
+
+    def start(self, create_task: BackgroundTaskFactory) -> None:
+        """Start building the client in the background."""
+        if self._ready is not None:
+            return
+        self._ready = asyncio.get_running_loop().create_future()
+        self._task = create_task(self._async_build())
+
+    async def _async_build(self) -> None:
+        """Build and optionally warm up the client."""
+        assert self._ready is not None
+        try:
+            client = await self._factory()
+            if self._warm_up and (warm_up := getattr(client, "async_warm_up", None)):
+                await warm_up()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.error("Failed to initialize Wolt API client: %s", err)
+            self._ready.set_result(None)
+            return
+        self._client = client
+        self.client_ready_s = self._clock() - self._started_at
+        _LOGGER.debug("Wolt API client ready after %.2fs", self.client_ready_s)
+        self._ready.set_result(client)
+
+    async def async_ready(self) -> bool:
+        """Wait for the client and return whether it could be built."""
+        if self._ready is None:
+            raise RuntimeError("Wolt client lifecycle was not started")
+        return await asyncio.shield(self._ready) is not None
+
+    async def _async_client(self) -> WoltClient:
+        """Return the shared client, waiting for it if needed."""
+        if self._client is None and not await self.async_ready():
+            raise WoltWatchConfigurationError("Wolt API client is not available")
+        assert self._client is not None
+        return self._client
+
+    def _polled(self) -> None:
+        """Note the first successful poll."""
+        if self.first_poll_s is None:
+            self.first_poll_s = self._clock() - self._started_at
+            _LOGGER.debug("First Wolt poll after %.2fs", self.first_poll_s)
+
+    async def async_get_status(self, slug: str) -> VenueStatus:
+        """Return the current status of a single venue."""
+        status = await (await self._async_client()).async_get_status(slug)
+        self._polled()
+        return status
+
+    async def async_get_nearby(
+        self, latitude: float, longitude: float
+    ) -> list[VenueStatus]:
+        """Return the status of every venue listed around a point."""
+        client = await self._async_client()
+        statuses = await client.async_get_nearby(latitude, longitude)
+        self._polled()
+        return statuses
+
+    async def async_get_menu(self, slug: str) -> Menu:
+        """Return a venue's menu."""
+        return await (await self._async_client()).async_get_menu(slug)
+
+    async def async_close(self) -> None:
+        """Stop a pending build and close the client."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        if self._ready is not None and not self._ready.done():
+            self._ready.set_result(None)
+        client, self._client = self._client, None
+        if client is not None and (close := getattr(client, "async_close", None)):
+            await close()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the startup timings for metrics."""
+        return {
+            "ready": self._client is not None,
+            "client_ready_s": _round(self.client_ready_s),
+            "time_to_first_poll_s": _round(self.first_poll_s),
+        }
+
+
+def _round(value: float | None) -> float | None:
+    """Round a duration for reporting."""
+    return None if value is None else round(value, 3)
@@ -0,0 +1,87 @@
+"""Change detection for menu watches."""
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from .models import Menu, MenuItem, VenueStatus
+
+ItemChange = tuple["MenuItem | None", MenuItem]
+
+
+def menu_changes(old: Menu, new: Menu) -> list[ItemChange]:
+    """Return (before, after) for every item that differs between two menus.
+
+    Sections carried over unchanged by the parser are the same objects in
+    both menus and are skipped without looking at their items.
+    """
+    changes: list[ItemChange] = []
+    moved: dict[str, MenuItem] | None = None
+    for section_id, section in new.sections.items():
+        before = old.sections.get(section_id)
+        if before is section:
+            continue
+        for item_id, item in section.items.items():
+            previous = before.items.get(item_id) if before is not None else None
+            if previous is None:
+                # Possibly moved from another section
+                if moved is None:
+                    moved = {known.item_id: known for known in old.items()}
+                previous = moved.get(item_id)
+            if previous != item:
+                changes.append((previous, item))
+    return changes
+
+
+def _matches(item: MenuItem, wanted: Collection[str]) -> bool:
+    """Return whether an item is one of the wanted ids or names."""
+    return not wanted or item.item_id in wanted or item.name.casefold() in wanted
+
+
+def _price(price: int | None) -> str:
+    """Format a price in minor units."""
+    return "?" if price is None else f"{price / 100:.2f}"
+
+
+def menu_alerts(
+    name: str,
+    old: Menu | None,
+    new: Menu,
+    changes: list[ItemChange],
+    *,
+    items: Collection[str] = (),
+    price_changes: bool = False,
+) -> list[str]:
+    """Return the alerts a menu watch should send for one poll.
+
+    ``items`` are case-folded item names or ids.  On the first poll a
+    watched item that is already available triggers right away; after that
+    only the changed items are looked at.
+    """
+    alerts = []
+    if old is None:
+        if items:
+            alerts.extend(
+                f"{name}: {item.name} is available"
+                for item in new.items()
+                if item.available and _matches(item, items)
+            )
+        return alerts
+    for before, after in changes:
+        if not _matches(after, items):
+            continue
+        if items and after.available and (before is None or not before.available):
+            alerts.append(f"{name}: {after.name} is back")
+        if price_changes and before is not None and before.price != after.price:
+            alerts.append(
+                f"{name}: {after.name} now costs {_price(after.price)}"
+                f" (was {_price(before.price)})"
+            )
+    return alerts
+
+
+def eta_alert(name: str, status: VenueStatus, eta_below: int) -> str | None:
+    """Return an alert if an open venue delivers within the threshold."""
+    if status.is_open and status.eta_minutes is not None:
+        if status.eta_minutes <= eta_below:
+            return f"{name} delivers in about {status.eta_minutes} min"
+    return None
@@ -0,0 +1,199 @@
+"""Lightweight hot-path metrics for Wolt Watch."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+import time
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .const import LATENCY_BUCKETS_SECONDS, METRICS_WINDOW_SECONDS
+from .models import Menu, VenueStatus
+
+if TYPE_CHECKING:
+    from .api import WoltClient
+
+_T = TypeVar("_T")
+
+
+class Histogram:
+    """Fixed-bucket histogram of durations in seconds.
+
+    Recording is a bisect and two additions, so it is cheap enough for
+    every request.  Quantiles are reported as the upper bound of the
+    bucket they fall in.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS_SECONDS) -> None:
+        """Initialize an empty histogram."""
+        self._bounds = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one value."""
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float | None:
+        """Return the bucket bound at or below which ``q`` of values fall."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self._bounds, self._counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary with cumulative bucket counts."""
+        buckets = {}
+        seen = 0
+        for bound, count in zip(self._bounds, self._counts):
+            seen += count
+            buckets[f"le_{bound}"] = seen
+        buckets["le_inf"] = self.count
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 4) if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "max": round(self.max, 4),
+            "buckets": buckets,
+        }
+
+
+class RateWindow:
+    """Count of events over a sliding window, kept in one-second slots."""
+
+    def __init__(
+        self,
+        window: float = METRICS_WINDOW_SECONDS,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty window."""
+        self._window = window
+        self._clock = clock
+        self._slots: deque[list[int]] = deque()
+        self.total = 0
+
+    def _prune(self, now: int) -> None:
+        """Drop slots that fell out of the window."""
+        while self._slots and self._slots[0][0] <= now - self._window:
+            self._slots.popleft()
+
+    def add(self, count: int = 1) -> None:
+        """Record events happening now."""
+        now = int(self._clock())
+        self.total += count
+        if self._slots and self._slots[-1][0] == now:
+            self._slots[-1][1] += count
+        else:
+            self._slots.append([now, count])
+            self._prune(now)
+
+    def per_minute(self) -> float:
+        """Return the event rate over the window, per minute."""
+        self._prune(int(self._clock()))
+        return sum(count for _, count in self._slots) * 60 / self._window
+
+
+class Metrics:
+    """Counters and histograms shared by the client chain and the manager."""
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize empty metrics."""
+        self.upstream_latency = Histogram()
+        self.upstream_calls = RateWindow(clock=clock)
+        self.upstream_errors: Counter[str] = Counter()
+        self.calls_by_endpoint: Counter[str] = Counter()
+        self.backoffs = 0
+        self.scheduler_lag = Histogram()
+        self.shed_polls = 0
+        self.notify_latency = Histogram()
+        self.notifications = 0
+        self.notification_failures = 0
+
+    def record_call(
+        self, endpoint: str, elapsed: float, error: BaseException | None = None
+    ) -> None:
+        """Record one upstream request."""
+        self.upstream_latency.observe(elapsed)
+        self.upstream_calls.add()
+        self.calls_by_endpoint[endpoint] += 1
+        if error is not None:
+            self.upstream_errors[type(error).__name__] += 1
+
+    def record_shed(self, count: int) -> None:
+        """Record polls put off because the request budget was short."""
+        self.shed_polls += count
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return every metric in a JSON-friendly form."""
+        return {
+            "upstream": {
+                "calls_total": self.upstream_calls.total,
+                "calls_per_minute": round(self.upstream_calls.per_minute(), 1),
+                "calls_by_endpoint": dict(self.calls_by_endpoint),
+                "errors": dict(self.upstream_errors),
+                "latency_s": self.upstream_latency.as_dict(),
+            },
+            "backoffs": self.backoffs,
+            "scheduler_lag_s": self.scheduler_lag.as_dict(),
+            "shed_polls": self.shed_polls,
+            "notifications": self.notifications,
+            "notification_failures": self.notification_failures,
+            "open_to_notify_s": self.notify_latency.as_dict(),
+        }
+
+
+class InstrumentedWoltClient:
+    """Wolt client recording the latency and outcome of every request."""
+
+    def __init__(
+        self,
+        client: WoltClient,
+        metrics: Metrics,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the wrapper."""
+        self._client = client
+        self._metrics = metrics
+        self._clock = clock
+
+    async def _async_call(
+        self, endpoint: str, func: Callable[..., Awaitable[_T]], *args: Any
+    ) -> _T:
+        """Run and time one request."""
+        started = self._clock()
+        try:
+            result = await func(*args)
+        except Exception as err:
+            self._metrics.record_call(endpoint, self._clock() - started, err)
+            raise
+        self._metrics.record_call(endpoint, self._clock() - started)
+        return result
+
+    async def async_get_status(self, slug: str) -> VenueStatus:
+        """Return the current status of a single venue."""
+        return await self._async_call("status", self._client.async_get_status, slug)
+
+    async def async_get_nearby(
+        self, latitude: float, longitude: float
+    ) -> list[VenueStatus]:
+        """Return the status of every venue listed around a point."""
+        return await self._async_call(
+            "nearby", self._client.async_get_nearby, latitude, longitude
+        )
+
+    async def async_get_menu(self, slug: str) -> Menu:
+        """Return a venue's menu."""
+        return await self._async_call("menu", self._client.async_get_menu, slug)
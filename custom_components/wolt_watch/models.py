@@ -0,0 +1,60 @@
+"""Data models for Wolt Watch."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from .hours import OpeningHours
+
+
+@dataclass(frozen=True)
+class VenueStatus:
+    """Open state of a venue as reported by Wolt."""
+
+    slug: str
+    is_open: bool
+    latitude: float | None = None
+    longitude: float | None = None
+    hours: OpeningHours | None = None
+    name: str | None = None
+    eta_minutes: int | None = None
+
+    @property
+    def location(self) -> tuple[float, float] | None:
+        """Return the venue's (latitude, longitude), if known."""
+        if self.latitude is None or self.longitude is None:
+            return None
+        return (self.latitude, self.longitude)
+
+
+@dataclass(frozen=True)
+class MenuItem:
+    """One item on a venue's menu."""
+
+    item_id: str
+    name: str
+    price: int | None  # In minor currency units
+    available: bool
+
+
+@dataclass(frozen=True)
+class MenuSection:
+    """A menu category with a fingerprint of its raw content."""
+
+    section_id: str
+    name: str
+    fingerprint: str
+    items: dict[str, MenuItem]
+
+
+@dataclass(frozen=True)
+class Menu:
+    """A venue's menu, split into sections."""
+
+    slug: str
+    sections: dict[str, MenuSection]
+
+    def items(self) -> Iterator[MenuItem]:
+        """Yield every item on the menu."""
+        for section in self.sections.values():
+            yield from section.items.values()
@@ -0,0 +1,229 @@
+"""On-demand profiling of the event loop Wolt Watch runs on."""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Callable
+import cProfile
+from pathlib import Path
+import pstats
+import selectors
+import sys
+import threading
+import time
+from types import CodeType, FrameType
+from typing import Any
+
+from .const import (
+    PROFILE_BLOCK_THRESHOLD_SECONDS,
+    PROFILE_SAMPLE_INTERVAL_SECONDS,
+    PROFILE_TOP,
+)
+from .exceptions import WoltWatchProfileError
+
+PACKAGE_DIR = str(Path(__file__).parent)
+
+
+def _label(code: CodeType) -> str:
+    """Return a flamegraph frame name for a code object."""
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+def _stack(frame: FrameType | None) -> str:
+    """Return a frame's stack in collapsed form, outermost first."""
+    labels = []
+    while frame is not None:
+        labels.append(_label(frame.f_code))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+def _coroutine(task: asyncio.Task[Any] | None) -> str:
+    """Return the name of the coroutine a task runs."""
+    if task is None:
+        return "<callback>"
+    coro = task.get_coro()
+    return getattr(coro, "__qualname__", None) or task.get_name()
+
+
+class _Sampler(threading.Thread):
+    """Samples the event loop thread's stack from a daemon thread.
+
+    The loop bumps ``beat`` every interval; a beat later than the block
+    threshold means a callback is holding the loop, and the stacks seen
+    meanwhile are what blocked it.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        interval: float,
+        block_threshold: float,
+        clock: Callable[[], float],
+    ) -> None:
+        """Initialize the sampler for the calling (event loop) thread."""
+        super().__init__(name="wolt_watch_profiler", daemon=True)
+        self._loop = loop
+        self._loop_thread = threading.get_ident()
+        self._interval = interval
+        self._block_threshold = block_threshold
+        self._clock = clock
+        self._stopped = threading.Event()
+        self.beat = clock()
+        self.samples = 0
+        self.blocks = 0
+        self.max_lag = 0.0
+        self.stacks: Counter[str] = Counter()
+        self.blocked: Counter[str] = Counter()
+        self.coroutines: Counter[str] = Counter()
+
+    def run(self) -> None:
+        """Sample until stopped."""
+        in_block = False
+        while not self._stopped.wait(self._interval):
+            # pylint: disable-next=protected-access
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            self.samples += 1
+            lag = max(self._clock() - self.beat - self._interval, 0.0)
+            self.max_lag = max(self.max_lag, lag)
+            blocked = lag >= self._block_threshold
+            if blocked and not in_block:
+                self.blocks += 1
+            in_block = blocked
+            if frame.f_code.co_filename == selectors.__file__:
+                continue  # Idle, waiting for I/O
+            stack = _stack(frame)
+            self.stacks[stack] += 1
+            if blocked:
+                self.blocked[stack] += 1
+            self.coroutines[_coroutine(asyncio.current_task(self._loop))] += 1
+
+    def stop(self) -> None:
+        """Ask the thread to stop after its current sample."""
+        self._stopped.set()
+
+
+class EngineProfiler:
+    """Profiles everything running on the event loop for a while.
+
+    Combines a deterministic profile (cProfile, saved as pstats) with a
+    sampler thread that records collapsed stacks for flamegraphs, time per
+    coroutine, and stretches where the loop was blocked.  Nothing is
+    installed until :meth:`async_profile` runs, so it costs nothing when
+    idle.  SDK calls on worker threads show up only as the wait for them.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval: float = PROFILE_SAMPLE_INTERVAL_SECONDS,
+        block_threshold: float = PROFILE_BLOCK_THRESHOLD_SECONDS,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """Initialize the profiler."""
+        self._interval = interval
+        self._block_threshold = block_threshold
+        self._clock = clock
+        self.running = False
+
+    async def async_profile(self, seconds: float, directory: Path) -> dict[str, Any]:
+        """Profile the loop for ``seconds`` and write reports to ``directory``."""
+        if self.running:
+            raise WoltWatchProfileError("A profile is already running")
+        loop = asyncio.get_running_loop()
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as err:
+            # Another profiler (e.g. Home Assistant's own) is active
+            raise WoltWatchProfileError(f"Cannot start profiling: {err}") from err
+        self.running = True
+        sampler = _Sampler(loop, self._interval, self._block_threshold, self._clock)
+        heartbeat: asyncio.TimerHandle | None = None
+
+        def _beat() -> None:
+            """Tell the sampler the loop is responsive."""
+            nonlocal heartbeat
+            sampler.beat = self._clock()
+            heartbeat = loop.call_later(self._interval, _beat)
+
+        _beat()
+        sampler.start()
+        started = self._clock()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profile.disable()
+            sampler.stop()
+            if heartbeat is not None:
+                heartbeat.cancel()
+            self.running = False
+        elapsed = self._clock() - started
+        stem = directory / time.strftime("wolt_watch_profile_%Y%m%d_%H%M%S")
+        return await loop.run_in_executor(
+            None, self._report, profile, sampler, stem, elapsed
+        )
+
+    def _report(
+        self,
+        profile: cProfile.Profile,
+        sampler: _Sampler,
+        stem: Path,
+        elapsed: float,
+    ) -> dict[str, Any]:
+        """Write the pstats and collapsed-stack files and summarize them."""
+        sampler.join()
+        stats_path = stem.with_suffix(".prof")
+        profile.dump_stats(stats_path)
+        folded_path = stem.with_suffix(".folded")
+        with folded_path.open("w", encoding="utf-8") as folded:
+            for stack, count in sampler.stacks.most_common():
+                folded.write(f"{stack} {count}\n")
+
+        def _ms(samples: int) -> float:
+            """Convert a sample count to milliseconds of the profile."""
+            return round(samples / max(sampler.samples, 1) * elapsed * 1000, 1)
+
+        # Only the integration's own functions; totals include their callees
+        stats = pstats.Stats(profile).stats  # type: ignore[attr-defined]
+        entries = [
+            (f"{name} ({Path(filename).name}:{line})", calls, own, total)
+            for (filename, line, name), (_, calls, own, total, _) in stats.items()
+            if filename.startswith(PACKAGE_DIR)
+        ]
+        entries.sort(key=lambda entry: entry[3], reverse=True)
+        return {
+            "seconds": round(elapsed, 1),
+            "pstats": str(stats_path),
+            "flamegraph": str(folded_path),
+            "loop": {
+                "samples": sampler.samples,
+                "busy_ratio": (
+                    round(sum(sampler.stacks.values()) / sampler.samples, 3)
+                    if sampler.samples
+                    else None
+                ),
+                "max_lag_ms": round(sampler.max_lag * 1000, 1),
+                "blocks": sampler.blocks,
+                "blocked_ms": _ms(sum(sampler.blocked.values())),
+            },
+            "coroutines": {
+                name: _ms(count)
+                for name, count in sampler.coroutines.most_common(PROFILE_TOP)
+            },
+            "blocking": [
+                {"stack": stack.rsplit(";", 3)[-3:], "ms": _ms(count)}
+                for stack, count in sampler.blocked.most_common(PROFILE_TOP)
+            ],
+            "functions": [
+                {
+                    "function": function,
+                    "calls": calls,
+                    "own_ms": round(own * 1000, 1),
+                    "total_ms": round(total * 1000, 1),
+                }
+                for function, calls, own, total in entries[:PROFILE_TOP]
+            ],
+        }
@@ -0,0 +1,148 @@
+"""Process-wide request budget and backoff for Wolt Watch."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import random
+import time
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .const import BACKOFF_INTERVAL_SECONDS, BACKOFF_MAX_SECONDS
+from .exceptions import WoltWatchRateLimitError
+from .models import Menu, VenueStatus
+
+if TYPE_CHECKING:
+    from .api import WoltClient
+
+_T = TypeVar("_T")
+
+
+class TokenBucket:
+    """Token bucket shared by every request to Wolt.
+
+    Tokens refill at ``rate`` per second up to ``capacity``.  A 429 from
+    the server pauses the whole bucket, so every watch backs off together.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket."""
+        self._rate = rate
+        self._capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+
+    def _refill(self) -> float:
+        """Top up tokens for the time elapsed and return the current time."""
+        now = self._clock()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+        return now
+
+    @property
+    def rate(self) -> float:
+        """Return the refill rate in tokens per second."""
+        return self._rate
+
+    @property
+    def tokens(self) -> float:
+        """Return the tokens currently available; none while paused."""
+        if self._refill() < self._paused_until:
+            return 0.0
+        return self._tokens
+
+    def time_until_available(self) -> float:
+        """Return the seconds until a token can be taken."""
+        now = self._refill()
+        wait = max(self._paused_until - now, 0)
+        if self._tokens < 1:
+            wait = max(wait, (1 - self._tokens) / self._rate)
+        return wait
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available right now."""
+        if self.time_until_available() > 0:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def async_acquire(self) -> None:
+        """Wait for and take a token."""
+        while not self.try_acquire():
+            await asyncio.sleep(self.time_until_available())
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for a number of seconds."""
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+class Backoff:
+    """Exponential backoff with jitter that honours Retry-After."""
+
+    def __init__(
+        self,
+        base: float = BACKOFF_INTERVAL_SECONDS,
+        cap: float = BACKOFF_MAX_SECONDS,
+    ) -> None:
+        """Initialize the policy."""
+        self._base = base
+        self._cap = cap
+
+    def delay(self, failures: int, retry_after: float | None = None) -> float:
+        """Return the wait after a number of consecutive failures."""
+        ceiling = min(self._cap, self._base * 2 ** max(failures - 1, 0))
+        # Equal jitter: never less than half the ceiling
+        delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+class RateLimitedWoltClient:
+    """Wolt client spending one token of a shared bucket per request."""
+
+    def __init__(
+        self, client: WoltClient, bucket: TokenBucket, backoff: Backoff
+    ) -> None:
+        """Initialize the wrapper."""
+        self._client = client
+        self._bucket = bucket
+        self._backoff = backoff
+        self._throttled = 0
+
+    async def _async_call(self, func: Callable[..., Awaitable[_T]], *args: Any) -> _T:
+        """Run one request within the budget, pausing everyone on a 429."""
+        await self._bucket.async_acquire()
+        try:
+            result = await func(*args)
+        except WoltWatchRateLimitError as err:
+            self._throttled += 1
+            self._bucket.pause(self._backoff.delay(self._throttled, err.retry_after))
+            raise
+        self._throttled = 0
+        return result
+
+    async def async_get_status(self, slug: str) -> VenueStatus:
+        """Return the current status of a single venue."""
+        return await self._async_call(self._client.async_get_status, slug)
+
+    async def async_get_nearby(
+        self, latitude: float, longitude: float
+    ) -> list[VenueStatus]:
+        """Return the status of every venue listed around a point."""
+        return await self._async_call(
+            self._client.async_get_nearby, latitude, longitude
+        )
+
+    async def async_get_menu(self, slug: str) -> Menu:
+        """Return a venue's menu."""
+        return await self._async_call(self._client.async_get_menu, slug)
@@ -0,0 +1,271 @@
+"""Deadline-ordered scheduler driving every Wolt Watch poll."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine
+import heapq
+import logging
+import random
+import time
+from typing import Any, Protocol
+
+from .const import (
+    BACKOFF_INTERVAL_SECONDS,
+    MAX_POLL_INTERVAL_SECONDS,
+    SCAN_JITTER,
+    SCHEDULER_WORKERS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+PollCallback = Callable[[list[str]], Awaitable["dict[str, float | None]"]]
+ExpireCallback = Callable[[str], None]
+TaskFactory = Callable[[Coroutine[Any, Any, None]], "asyncio.Task[None]"]
+PriorityCallback = Callable[[str], float]
+
+
+class Budget(Protocol):
+    """Request budget the scheduler sheds load against."""
+
+    @property
+    def tokens(self) -> float:
+        """Return the requests that can be made right now, 0 while paused."""
+
+    @property
+    def rate(self) -> float:
+        """Return the requests regained per second."""
+
+
+_POLL = 0
+_EXPIRE = 1
+
+
+class WatchScheduler:
+    """Single timer over a heap of poll and expiry deadlines.
+
+    One runner task sleeps until the earliest deadline, hands every poll due
+    at that moment to a fixed pool of worker tasks as one batch and fires
+    expiries inline, so the number of tasks does not grow with the number of
+    watches.  Deadlines come from a monotonic clock and poll delays are
+    jittered to keep venues out of lockstep.
+
+    The poll callback receives the batch of due slugs and returns the delay
+    until each slug's next poll, or ``None`` to stop polling it.  It may
+    return delays for slugs outside the batch that it refreshed for free.
+    If it raises, every slug in the batch is retried after ``retry_delay``.
+
+    With a ``budget`` and a ``priority`` callback, a batch larger than the
+    requests available is shed: the highest-priority polls run and the rest
+    are pushed back in priority order, roughly to when the budget will have
+    room for them.  Shedding never puts a poll off beyond ``max_interval``
+    since it last ran; the delays the poll callback returns are its own.
+    """
+
+    def __init__(
+        self,
+        poll: PollCallback,
+        expire: ExpireCallback,
+        *,
+        workers: int = SCHEDULER_WORKERS,
+        jitter: float = SCAN_JITTER,
+        clock: Callable[[], float] = time.monotonic,
+        budget: Budget | None = None,
+        priority: PriorityCallback | None = None,
+        max_interval: float = MAX_POLL_INTERVAL_SECONDS,
+        retry_delay: float = BACKOFF_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._poll = poll
+        self._expire = expire
+        self._budget = budget
+        self._priority = priority
+        self._max_interval = max_interval
+        self._retry_delay = retry_delay
+        self._last_polled: dict[str, float] = {}
+        self._waiting = 0
+        self._workers = workers
+        self._jitter = jitter
+        self._clock = clock
+        self._heap: list[tuple[float, int, int, str]] = []
+        # Live sequence number per key, one dict per kind of deadline
+        self._pending: tuple[dict[str, int], dict[str, int]] = ({}, {})
+        self._seq = 0
+        self._queue: asyncio.Queue[tuple[float, list[str]]] = asyncio.Queue()
+        self._busy: set[str] = set()
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+        self.on_lag: Callable[[float], None] | None = None
+        self.on_shed: Callable[[int], None] | None = None
+
+    @property
+    def task_count(self) -> int:
+        """Return the number of tasks the scheduler owns."""
+        return len(self._tasks)
+
+    def __len__(self) -> int:
+        """Return the number of pending deadlines."""
+        return sum(len(pending) for pending in self._pending)
+
+    def start(self, create_task: TaskFactory) -> None:
+        """Start the runner and worker tasks."""
+        if self._tasks:
+            return
+        self._tasks.append(create_task(self._async_run()))
+        self._tasks.extend(
+            create_task(self._async_work()) for _ in range(self._workers)
+        )
+
+    async def async_stop(self) -> None:
+        """Cancel all scheduler tasks and forget pending deadlines."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._heap.clear()
+        for pending in self._pending:
+            pending.clear()
+        self._busy.clear()
+        self._last_polled.clear()
+        self._waiting = 0
+
+    def schedule_poll(self, slug: str, delay: float, *, jitter: bool = True) -> None:
+        """Schedule the next poll of a slug, replacing any earlier one."""
+        if jitter and delay > 0:
+            jittered = delay * (1 + random.uniform(-self._jitter, self._jitter))
+            # Jitter must not push a capped cadence past the maximum interval
+            delay = (
+                jittered
+                if delay > self._max_interval
+                else min(jittered, self._max_interval)
+            )
+        now = self._clock()
+        # The maximum interval counts from when a new slug is first scheduled
+        self._last_polled.setdefault(slug, now)
+        self._push(_POLL, slug, now + max(delay, 0))
+
+    def schedule_expiry(self, watch_id: str, deadline: float) -> None:
+        """Schedule a watch to expire at a monotonic deadline."""
+        self._push(_EXPIRE, watch_id, deadline)
+
+    def cancel_poll(self, slug: str) -> None:
+        """Stop polling a slug."""
+        self._pending[_POLL].pop(slug, None)
+        self._last_polled.pop(slug, None)
+
+    def cancel_expiry(self, watch_id: str) -> None:
+        """Forget the expiry of a watch."""
+        self._pending[_EXPIRE].pop(watch_id, None)
+
+    def _push(self, kind: int, key: str, due: float) -> None:
+        """Push a deadline, superseding any pending one for the same key."""
+        self._seq += 1
+        self._pending[kind][key] = self._seq
+        heapq.heappush(self._heap, (due, self._seq, kind, key))
+        if self._heap[0][1] == self._seq:
+            self._wakeup.set()
+
+    def _pop_due(self, now: float) -> None:
+        """Dispatch every deadline that has passed."""
+        heap = self._heap
+        batch = []
+        earliest = now
+        while heap and heap[0][0] <= now:
+            due, seq, kind, key = heapq.heappop(heap)
+            if self._pending[kind].get(key) != seq:
+                continue  # Superseded or cancelled
+            del self._pending[kind][key]
+            if kind == _EXPIRE:
+                try:
+                    self._expire(key)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Unexpected error expiring watch %s", key)
+            elif key not in self._busy:
+                self._busy.add(key)
+                batch.append(key)
+                earliest = min(earliest, due)
+        if batch and self._budget is not None and self._priority is not None:
+            try:
+                batch = self._shed(batch, now)
+            except Exception:  # pylint: disable=broad-except
+                # Run the whole batch rather than lose it
+                _LOGGER.exception("Unexpected error shedding %s", batch)
+        if batch:
+            for key in batch:
+                self._last_polled[key] = now
+            self._waiting += len(batch)
+            self._queue.put_nowait((earliest, batch))
+
+        # Drop stale entries so the head is always a live deadline
+        while heap and self._pending[heap[0][2]].get(heap[0][3]) != heap[0][1]:
+            heapq.heappop(heap)
+
+    def _shed(self, batch: list[str], now: float) -> list[str]:
+        """Defer the lowest-priority polls the budget cannot cover now."""
+        assert self._budget is not None and self._priority is not None
+        available = max(int(self._budget.tokens) - self._waiting, 0)
+        if len(batch) <= available:
+            return batch
+
+        # Polls at their maximum interval run regardless of the budget
+        keep = []
+        ranked = []
+        for key in batch:
+            if now - self._last_polled.get(key, now) >= self._max_interval:
+                keep.append(key)
+            else:
+                ranked.append(key)
+        ranked.sort(key=self._priority, reverse=True)
+        room = max(available - len(keep), 0)
+        keep.extend(ranked[:room])
+        deferred = ranked[room:]
+
+        rate = self._budget.rate
+        for rank, key in enumerate(deferred, 1):
+            self._busy.discard(key)
+            latest = self._last_polled.get(key, now) + self._max_interval
+            self._push(_POLL, key, min(now + rank / rate, latest))
+        if self.on_shed is not None:
+            self.on_shed(len(deferred))
+        return keep
+
+    async def _async_run(self) -> None:
+        """Sleep until the earliest deadline and dispatch due work."""
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wakeup.clear()
+            try:
+                self._pop_due(self._clock())
+            except Exception:  # pylint: disable=broad-except
+                # The runner is the only timer; it must outlive any bug
+                _LOGGER.exception("Unexpected error dispatching due work")
+            timer = None
+            if self._heap:
+                timer = loop.call_later(
+                    max(self._heap[0][0] - self._clock(), 0), self._wakeup.set
+                )
+            try:
+                await self._wakeup.wait()
+            finally:
+                if timer is not None:
+                    timer.cancel()
+
+    async def _async_work(self) -> None:
+        """Run batches of due polls and reschedule them."""
+        while True:
+            due, batch = await self._queue.get()
+            self._waiting -= len(batch)
+            if self.on_lag is not None:
+                # How late the batch starts, including time queued for a worker
+                self.on_lag(self._clock() - due)
+            try:
+                delays = await self._poll(batch)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Unexpected error polling %s", batch)
+                delays = dict.fromkeys(batch, self._retry_delay)
+            finally:
+                self._busy.difference_update(batch)
+            now = self._clock()
+            for slug, delay in delays.items():
+                if delay is not None:
+                    self._last_polled[slug] = now
+                    self.schedule_poll(slug, delay)
@@ -0,0 +1,149 @@
+"""Aggregate metric sensors for Wolt Watch."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import PERCENTAGE, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
+
+from .const import DATA_METRICS, DOMAIN, METRICS_SCAN_INTERVAL
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True)
+class WoltWatchSensorEntityDescription(SensorEntityDescription):
+    """Describes a Wolt Watch metric sensor."""
+
+    value_fn: Callable[[dict[str, Any]], Any]
+
+
+def _ratio(value: float | None) -> float | None:
+    """Convert a 0-1 ratio to a percentage."""
+    return None if value is None else round(value * 100, 1)
+
+
+SENSORS: tuple[WoltWatchSensorEntityDescription, ...] = (
+    WoltWatchSensorEntityDescription(
+        key="active_watches",
+        name="Wolt Watch active watches",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda report: report["watches"]["active"],
+    ),
+    WoltWatchSensorEntityDescription(
+        key="watched_venues",
+        name="Wolt Watch watched venues",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda report: report["watches"]["venues"],
+    ),
+    WoltWatchSensorEntityDescription(
+        key="upstream_calls_per_minute",
+        name="Wolt Watch upstream calls per minute",
+        native_unit_of_measurement="calls/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda report: report["upstream"]["calls_per_minute"],
+    ),
+    WoltWatchSensorEntityDescription(
+        key="upstream_latency_p95",
+        name="Wolt Watch upstream latency p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda report: report["upstream"]["latency_s"]["p95"],
+    ),
+    WoltWatchSensorEntityDescription(
+        key="upstream_errors",
+        name="Wolt Watch upstream errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda report: sum(report["upstream"]["errors"].values()),
+    ),
+    WoltWatchSensorEntityDescription(
+        key="cache_hit_ratio",
+        name="Wolt Watch cache hit ratio",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda report: _ratio(report["cache"]["hit_ratio"]),
+    ),
+    WoltWatchSensorEntityDescription(
+        key="scheduler_lag_p95",
+        name="Wolt Watch scheduler lag p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda report: report["scheduler_lag_s"]["p95"],
+    ),
+    WoltWatchSensorEntityDescription(
+        key="open_to_notify_p95",
+        name="Wolt Watch open to notify p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda report: report["open_to_notify_s"]["p95"],
+    ),
+)
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the metric sensors when the integration asks for them."""
+    if discovery_info is None:
+        return
+    report: Callable[[], dict[str, Any]] = hass.data[DATA_METRICS]
+
+    async def _async_update() -> dict[str, Any]:
+        """Build the report once for every sensor."""
+        return report()
+
+    coordinator: DataUpdateCoordinator[dict[str, Any]] = DataUpdateCoordinator(
+        hass,
+        _LOGGER,
+        name=f"{DOMAIN} metrics",
+        update_method=_async_update,
+        update_interval=METRICS_SCAN_INTERVAL,
+    )
+    await coordinator.async_refresh()
+    async_add_entities(
+        WoltWatchMetricSensor(coordinator, description) for description in SENSORS
+    )
+
+
+class WoltWatchMetricSensor(
+    CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], SensorEntity
+):
+    """Sensor exposing one aggregate metric of the shared report."""
+
+    entity_description: WoltWatchSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator[dict[str, Any]],
+        description: WoltWatchSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{DOMAIN}_{description.key}"
+
+    @property
+    def native_value(self) -> Any:
+        """Read the metric from the latest report."""
+        return self.entity_description.value_fn(self.coordinator.data)
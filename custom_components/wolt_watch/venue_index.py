@@ -0,0 +1,205 @@
+"""Local prefix index of Wolt venues for slug autocomplete."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+import heapq
+import re
+from typing import TYPE_CHECKING, Any
+
+from .const import VENUE_INDEX_MAX_SIZE
+from .models import Menu, VenueStatus
+
+if TYPE_CHECKING:
+    from .api import WoltClient
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def _tokens(text: str) -> set[str]:
+    """Return the lower-cased words of a slug or display name."""
+    return set(_WORD.findall(text.casefold()))
+
+
+class _Node:
+    """Trie node holding the venues whose words end here."""
+
+    __slots__ = ("children", "slugs", "size")
+
+    def __init__(self) -> None:
+        """Initialize an empty node."""
+        self.children: dict[str, _Node] = {}
+        self.slugs: set[str] = set()
+        # Entries in this subtree, to pick the most selective query word
+        self.size = 0
+
+
+class VenueIndex:
+    """Prefix trie over venue slugs and display names.
+
+    Every word of a venue's slug and name is indexed, so "dizen" finds
+    ``mcdonalds-dizengoff``.  Venues are learnt from the results of normal
+    polls and listings; the least recently seen are dropped once the index
+    is full.
+    """
+
+    def __init__(self, *, max_size: int = VENUE_INDEX_MAX_SIZE) -> None:
+        """Initialize an empty index."""
+        self._max_size = max_size
+        self._root = _Node()
+        self._names: dict[str, str] = {}
+        self.on_change: Callable[[], None] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of indexed venues."""
+        return len(self._names)
+
+    def _words(self, slug: str, name: str) -> set[str]:
+        """Return every word a venue is indexed under."""
+        return _tokens(slug) | _tokens(name) | {slug.casefold()}
+
+    def _insert(self, word: str, slug: str) -> None:
+        """Index a venue under one word."""
+        path = [self._root]
+        for char in word:
+            path.append(path[-1].children.setdefault(char, _Node()))
+        if slug not in path[-1].slugs:
+            path[-1].slugs.add(slug)
+            for node in path:
+                node.size += 1
+
+    def _discard(self, word: str, slug: str) -> None:
+        """Remove a venue from one word, pruning the branch it leaves empty."""
+        if (path := self._path(word)) is None or slug not in path[-1].slugs:
+            return
+        path[-1].slugs.discard(slug)
+        for node in path:
+            node.size -= 1
+        # Empty nodes would otherwise outlive evicted venues for good
+        for depth in range(len(word), 0, -1):
+            if path[depth].size:
+                break
+            del path[depth - 1].children[word[depth - 1]]
+
+    def _path(self, prefix: str) -> list[_Node] | None:
+        """Return the nodes from the root to a prefix, if it is indexed."""
+        path = [self._root]
+        for char in prefix:
+            if (node := path[-1].children.get(char)) is None:
+                return None
+            path.append(node)
+        return path
+
+    def _remove(self, slug: str) -> None:
+        """Drop a venue from the index."""
+        name = self._names.pop(slug)
+        for word in self._words(slug, name):
+            self._discard(word, slug)
+
+    def add(self, slug: str, name: str | None = None) -> bool:
+        """Index or refresh a venue; return whether anything changed."""
+        name = name or slug.replace("-", " ").title()
+        if (known := self._names.get(slug)) is not None:
+            # Keep recently seen venues at the end, away from eviction
+            del self._names[slug]
+            self._names[slug] = known
+            if known == name:
+                return False
+            self._remove(slug)
+        self._names[slug] = name
+        for word in self._words(slug, name):
+            self._insert(word, slug)
+        while len(self._names) > self._max_size:
+            self._remove(next(iter(self._names)))
+        return True
+
+    def add_many(self, statuses: list[VenueStatus]) -> None:
+        """Index venues from poll results, telling the listener once."""
+        changed = False
+        for status in statuses:
+            if status.name:
+                changed |= self.add(status.slug, status.name)
+        if changed and self.on_change is not None:
+            self.on_change()
+
+    def _matches(self, slug: str, prefixes: list[str]) -> bool:
+        """Return whether every prefix starts one of a venue's words."""
+        words = self._words(slug, self._names[slug])
+        return all(
+            any(word.startswith(prefix) for word in words) for prefix in prefixes
+        )
+
+    def search(self, query: str, limit: int = 10) -> list[dict[str, str]]:
+        """Return venues matching every word of a query as a prefix.
+
+        Venues whose word completes the query with the fewest extra
+        characters come first, then by name.  The trie is walked breadth
+        first and the walk stops once ``limit`` venues are found, so broad
+        queries cost no more than narrow ones.
+        """
+        nodes = []
+        for word in _tokens(query):
+            if (path := self._path(word)) is None:
+                return []
+            nodes.append((path[-1].size, word, path[-1]))
+        if not nodes:
+            return []
+
+        # Walk the rarest word's subtree, checking the other words per venue
+        nodes.sort(key=lambda item: item[0])
+        others = [word for _, word, _ in nodes[1:]]
+        found: dict[str, None] = {}
+        queue = deque([nodes[0][2]])
+        while queue and len(found) < limit:
+            node = queue.popleft()
+            candidates = [
+                slug
+                for slug in node.slugs
+                if slug not in found and (not others or self._matches(slug, others))
+            ]
+            for slug in heapq.nsmallest(
+                limit - len(found), candidates, key=self._sort_key
+            ):
+                found[slug] = None
+            queue.extend(node.children[char] for char in sorted(node.children))
+        return [{"slug": slug, "name": self._names[slug]} for slug in found]
+
+    def _sort_key(self, slug: str) -> tuple[str, str]:
+        """Order venues by name, then slug."""
+        return (self._names[slug].casefold(), slug)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the index in a form suitable for storage."""
+        return {"venues": [[slug, name] for slug, name in self._names.items()]}
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Load venues saved by :meth:`as_dict`."""
+        for slug, name in data.get("venues", []):
+            self.add(slug, name)
+
+
+class IndexingWoltClient:
+    """Wolt client adding every venue it sees to a venue index."""
+
+    def __init__(self, client: WoltClient, index: VenueIndex) -> None:
+        """Initialize the wrapper."""
+        self._client = client
+        self._index = index
+
+    async def async_get_status(self, slug: str) -> VenueStatus:
+        """Return the current status of a single venue."""
+        status = await self._client.async_get_status(slug)
+        self._index.add_many([status])
+        return status
+
+    async def async_get_nearby(
+        self, latitude: float, longitude: float
+    ) -> list[VenueStatus]:
+        """Return the status of every venue listed around a point."""
+        statuses = await self._client.async_get_nearby(latitude, longitude)
+        self._index.add_many(statuses)
+        return statuses
+
+    async def async_get_menu(self, slug: str) -> Menu:
+        """Return a venue's menu."""
+        return await self._client.async_get_menu(slug)
@@ -0,0 +1,901 @@
+"""Shared per-slug polling for Wolt Watch."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Collection, Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+import logging
+from math import asin, cos, radians, sin, sqrt
+import random
+import sys
+import time
+from typing import Any
+import uuid
+
+from .const import (
+    BACKOFF_INTERVAL_SECONDS,
+    CHURN_HALF_LIFE_SECONDS,
+    DEFAULT_SCAN_INTERVAL,
+    MAX_POLL_INTERVAL_SECONDS,
+    OPENING_LEAD_SECONDS,
+    PRIORITY_HORIZON_SECONDS,
+)
+from .exceptions import (
+    WoltWatchCircuitOpenError,
+    WoltWatchConfigurationError,
+    WoltWatchNotFoundError,
+)
+from .history import OpeningHistory
+from .hours import OpeningHours, poll_delay
+from .menu import eta_alert, menu_alerts, menu_changes
+from .metrics import Metrics
+from .models import Menu, VenueStatus
+from .ratelimit import Backoff
+from .scheduler import Budget, TaskFactory, WatchScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+StatusResolver = Callable[
+    [list[str], Collection[str]], Awaitable[dict[str, "VenueStatus | Exception"]]
+]
+Notifier = Callable[["Watch"], Awaitable[None]]
+MenuFetcher = Callable[[str], Awaitable[Menu]]
+NearbyFetcher = Callable[[float, float], Awaitable[list[VenueStatus]]]
+Alerter = Callable[["Watch", list[str]], Awaitable[None]]
+WatchListener = Callable[[dict[str, Any]], None]
+
+# Watch kinds
+WATCH_OPEN = "open"
+WATCH_MENU = "menu"
+WATCH_AREA = "area"
+
+EARTH_RADIUS_KM = 6371.0
+
+# Venue states streamed to subscribers
+VENUE_POLLING = "polling"
+VENUE_BACKING_OFF = "backing_off"
+
+# Reasons a watch ends
+REMOVED_OPENED = "opened"
+REMOVED_EXPIRED = "expired"
+REMOVED_CANCELLED = "cancelled"
+REMOVED_NOT_FOUND = "not_found"
+REMOVED_TRIGGERED = "triggered"
+
+
+def area_id(latitude: float, longitude: float, radius_km: float) -> str:
+    """Return the id area watches on the same circle share, to ~10 m."""
+    return f"{latitude:.4f},{longitude:.4f},{radius_km:g}"
+
+
+def split_key(key: str) -> tuple[str, str]:
+    """Return the watch kind and slug of a poll key.
+
+    Open watches are keyed by bare slug; only a known kind prefix marks the
+    others, so a slug that happens to contain ":" is still an open watch.
+    """
+    kind, sep, slug = key.partition(":")
+    if sep and kind in (WATCH_MENU, WATCH_AREA):
+        return kind, slug
+    return WATCH_OPEN, key
+
+
+def distance_km(a: tuple[float, float], b: tuple[float, float]) -> float:
+    """Return the great-circle distance between two (lat, lon) points."""
+    lat1, lon1, lat2, lon2 = map(radians, (*a, *b))
+    half_chord = (
+        sin((lat2 - lat1) / 2) ** 2
+        + cos(lat1) * cos(lat2) * sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * asin(sqrt(half_chord))
+
+
+@dataclass(slots=True)
+class Watch:
+    """A single subscriber waiting for a venue to open or its menu to change.
+
+    Menu watches name the items to wait for (case-folded names or ids) and
+    can also trigger on price changes or a short delivery estimate.  Area
+    watches use the :func:`area_id` of their circle as slug and report
+    every venue in it that opens.
+
+    Watches are slotted records, and their slug and device strings are
+    interned so the many watches on one venue or device share them.
+    """
+
+    slug: str
+    device: str
+    deadline: float
+    watch_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    seen_open: bool = False
+    kind: str = WATCH_OPEN
+    items: tuple[str, ...] = ()
+    price_changes: bool = False
+    eta_below: int | None = None
+    latitude: float | None = None
+    longitude: float | None = None
+    radius_km: float | None = None
+
+    def __post_init__(self) -> None:
+        """Share the slug and device strings with other watches."""
+        self.slug = sys.intern(self.slug)
+        self.device = sys.intern(self.device)
+
+    @property
+    def key(self) -> str:
+        """Return the key of the poll this watch shares with others."""
+        return self.slug if self.kind == WATCH_OPEN else f"{self.kind}:{self.slug}"
+
+
+class WatchManager:
+    """Registry of watches sharing one scheduled poll per slug.
+
+    Every subscriber of a slug gets the result of the same upstream call, so
+    request volume scales with the number of distinct venues being watched.
+    Menu watches on a slug share a separate menu poll, run by the same
+    scheduler and through the same client chain.
+    """
+
+    def __init__(
+        self,
+        resolve: StatusResolver,
+        notify: Notifier,
+        create_task: TaskFactory,
+        *,
+        scan_interval: float = DEFAULT_SCAN_INTERVAL.total_seconds(),
+        backoff_interval: float = BACKOFF_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+        metrics: Metrics | None = None,
+        fetch_menu: MenuFetcher | None = None,
+        alert: Alerter | None = None,
+        fetch_nearby: NearbyFetcher | None = None,
+        notify_area: Alerter | None = None,
+        budget: Budget | None = None,
+        max_interval: float = MAX_POLL_INTERVAL_SECONDS,
+        history: OpeningHistory | None = None,
+    ) -> None:
+        """Initialize the manager."""
+        self._resolve = resolve
+        self._notify = notify
+        self._fetch_menu = fetch_menu
+        self._alert = alert
+        self._fetch_nearby = fetch_nearby
+        self._notify_area = notify_area
+        self._create_task = create_task
+        self._scan_interval = scan_interval
+        self._max_interval = max_interval
+        self._backoff = Backoff(backoff_interval)
+        self._failures: dict[str, int] = {}
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self.on_change: Callable[[], None] | None = None
+        self._watches: dict[str, Watch] = {}
+        self._subscribers: dict[str, dict[str, Watch]] = {}
+        self._menu_subscribers: dict[str, dict[str, Watch]] = {}
+        self._menus: dict[str, Menu] = {}
+        self._area_subscribers: dict[str, dict[str, Watch]] = {}
+        # Slugs open at the last poll of each area; None until polled
+        self._area_open: dict[str, frozenset[str]] = {}
+        self._pools = {
+            WATCH_OPEN: self._subscribers,
+            WATCH_MENU: self._menu_subscribers,
+            WATCH_AREA: self._area_subscribers,
+        }
+        self._by_device: dict[str, dict[str, Watch]] = {}
+        self._hours: dict[str, OpeningHours] = {}
+        self._venue_states: dict[str, str] = {}
+        self._open_states: dict[str, bool] = {}
+        # Recent state changes per poll key, decayed: (score, updated at)
+        self._churn: dict[str, tuple[float, float]] = {}
+        self._listeners: list[WatchListener] = []
+        self.metrics = metrics or Metrics(clock=clock)
+        self.history = history or OpeningHistory()
+        self.scheduler = WatchScheduler(
+            self._async_poll,
+            self._expire,
+            clock=clock,
+            budget=budget,
+            priority=self._priority,
+            max_interval=max_interval,
+            retry_delay=backoff_interval,
+        )
+        self.scheduler.on_lag = self.metrics.scheduler_lag.observe
+        self.scheduler.on_shed = self.metrics.record_shed
+
+    @property
+    def watches(self) -> list[Watch]:
+        """Return all active watches."""
+        return list(self._watches.values())
+
+    @property
+    def polled_slugs(self) -> set[str]:
+        """Return the slugs that currently have subscribers."""
+        return set(self._subscribers)
+
+    def watch_count(self, slug: str) -> int:
+        """Return how many watches are subscribed to a slug."""
+        return len(self._subscribers.get(slug, ()))
+
+    def get(self, watch_id: str) -> Watch | None:
+        """Return a watch by id."""
+        return self._watches.get(watch_id)
+
+    def find(
+        self, *, slug: str | None = None, device: str | None = None
+    ) -> list[Watch]:
+        """Return the watches on a slug and/or device, or all of them."""
+        if slug is not None and device is not None:
+            return [
+                watch
+                for kind in (WATCH_OPEN, WATCH_MENU)
+                if (watch := self._existing(kind, slug, device)) is not None
+            ]
+        if slug is not None:
+            return [
+                *self._subscribers.get(slug, {}).values(),
+                *self._menu_subscribers.get(slug, {}).values(),
+            ]
+        if device is not None:
+            return list(self._by_device.get(device, {}).values())
+        return self.watches
+
+    def remaining(self, watch: Watch) -> float:
+        """Return the seconds left before a watch expires."""
+        return max(watch.deadline - self._clock(), 0)
+
+    def describe(self, watch: Watch) -> dict[str, Any]:
+        """Return a watch in a JSON-friendly form."""
+        remaining = self.remaining(watch)
+        description = {
+            "watch_id": watch.watch_id,
+            "kind": watch.kind,
+            "slug": watch.slug,
+            "device": watch.device,
+            "remaining_s": round(remaining),
+            "expires_at": round(self._wall_clock() + remaining, 1),
+            "seen_open": watch.seen_open,
+            "state": self._venue_states.get(watch.key, VENUE_POLLING),
+        }
+        if watch.kind == WATCH_MENU:
+            description["items"] = list(watch.items)
+            description["price_changes"] = watch.price_changes
+            description["eta_below"] = watch.eta_below
+        elif watch.kind == WATCH_AREA:
+            description["latitude"] = watch.latitude
+            description["longitude"] = watch.longitude
+            description["radius_km"] = watch.radius_km
+            description["open_venues"] = len(self._area_open.get(watch.slug, ()))
+        return description
+
+    def async_subscribe(self, listener: WatchListener) -> Callable[[], None]:
+        """Stream watch changes to a listener, starting with a snapshot.
+
+        Events are ``snapshot``, ``added``, ``updated`` and ``removed`` (with
+        a reason) for watches, and ``venue`` when a venue starts or stops
+        backing off.  Returns a function that ends the subscription.
+        """
+        listener(
+            {
+                "event": "snapshot",
+                "watches": [self.describe(watch) for watch in self._watches.values()],
+            }
+        )
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _emit(self, event: dict[str, Any]) -> None:
+        """Send an event to every subscriber."""
+        for listener in list(self._listeners):
+            listener(event)
+
+    def _set_venue_state(self, key: str, state: str) -> None:
+        """Record a poll's state, streaming it if it changed."""
+        if self._venue_states.get(key, VENUE_POLLING) == state:
+            return
+        self._venue_states[key] = state
+        if self._listeners:
+            kind, slug = split_key(key)
+            self._emit(
+                {
+                    "event": "venue",
+                    "slug": slug,
+                    "kind": kind,
+                    "state": state,
+                }
+            )
+
+    def async_start(self, slug: str, device: str, timeout_s: float) -> Watch:
+        """Subscribe a device to a slug, polling it right away if new.
+
+        Starting a watch that already exists for the same slug and device
+        keeps the existing one, pushing its deadline out if the new one is
+        later.
+        """
+        watch = self._start(slug, device, self._clock() + timeout_s)
+        self._changed()
+        return watch
+
+    def async_start_many(
+        self, pairs: Iterable[tuple[str, str]], timeout_s: float
+    ) -> list[Watch]:
+        """Subscribe many (slug, device) pairs in one pass.
+
+        Duplicate pairs are dropped.  New slugs are all due at once, so the
+        scheduler polls them as a single batch.
+        """
+        deadline = self._clock() + timeout_s
+        watches = [
+            self._start(slug, device, deadline)
+            for slug, device in dict.fromkeys(pairs)
+        ]
+        self._changed()
+        return watches
+
+    def async_start_menu(
+        self,
+        slug: str,
+        device: str,
+        timeout_s: float,
+        *,
+        items: Iterable[str] = (),
+        price_changes: bool = False,
+        eta_below: int | None = None,
+    ) -> Watch:
+        """Watch a venue's menu for items coming back, price changes or ETA.
+
+        An existing menu watch for the same slug and device takes over the
+        new conditions, and its deadline is pushed out if the new one is
+        later.
+        """
+        deadline = self._clock() + timeout_s
+        wanted = tuple(dict.fromkeys(item.casefold() for item in items))
+        if (watch := self._existing(WATCH_MENU, slug, device)) is not None:
+            watch.items = wanted
+            watch.price_changes = price_changes
+            watch.eta_below = eta_below
+            if deadline > watch.deadline:
+                self._set_deadline(watch, deadline)
+            else:
+                self._updated(watch)
+            return watch
+        watch = Watch(
+            slug=slug,
+            device=device,
+            deadline=deadline,
+            kind=WATCH_MENU,
+            items=wanted,
+            price_changes=price_changes,
+            eta_below=eta_below,
+        )
+        self._add(watch, 0)
+        self._changed()
+        return watch
+
+    def async_start_area(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        device: str,
+        timeout_s: float,
+    ) -> Watch:
+        """Watch every venue within a radius for openings.
+
+        Each poll is one nearby listing, however many venues the area holds
+        and however many watches share it.  Venues already open at the
+        first poll are not reported.
+        """
+        slug = area_id(latitude, longitude, radius_km)
+        deadline = self._clock() + timeout_s
+        if (watch := self._existing(WATCH_AREA, slug, device)) is not None:
+            if deadline > watch.deadline:
+                self._set_deadline(watch, deadline)
+            return watch
+        watch = Watch(
+            slug=slug,
+            device=device,
+            deadline=deadline,
+            kind=WATCH_AREA,
+            latitude=latitude,
+            longitude=longitude,
+            radius_km=radius_km,
+        )
+        self._add(watch, 0)
+        self._changed()
+        return watch
+
+    def async_cancel(self, watch_id: str) -> Watch | None:
+        """Stop a watch by id without notifying it."""
+        if (watch := self._watches.get(watch_id)) is None:
+            return None
+        self._remove(watch, REMOVED_CANCELLED)
+        return watch
+
+    def async_extend(self, watch_id: str, seconds: float) -> Watch | None:
+        """Push a watch's deadline out by a number of seconds."""
+        if (watch := self._watches.get(watch_id)) is None:
+            return None
+        self._set_deadline(watch, watch.deadline + seconds)
+        return watch
+
+    def stats(self) -> dict[str, Any]:
+        """Return registry sizes, task count and an approximate memory use."""
+        watch_bytes = sum(sys.getsizeof(watch) for watch in self._watches.values())
+        index_bytes = sum(
+            sys.getsizeof(index)
+            for index in (
+                self._watches,
+                self._subscribers,
+                self._by_device,
+                self._menu_subscribers,
+                self._area_subscribers,
+                *self._subscribers.values(),
+                *self._menu_subscribers.values(),
+                *self._area_subscribers.values(),
+                *self._area_open.values(),
+                *self._by_device.values(),
+            )
+        )
+        return {
+            "watches": len(self._watches),
+            "venues": len(self._subscribers),
+            "menus": len(self._menu_subscribers),
+            "areas": len(self._area_subscribers),
+            "devices": len(self._by_device),
+            "scheduled": len(self.scheduler),
+            "tasks": self.scheduler.task_count,
+            "memory_bytes": watch_bytes + index_bytes,
+        }
+
+    def async_restore(self, data: dict[str, Any]) -> int:
+        """Resume persisted watches with their original deadlines.
+
+        First polls are spread over one scan interval so a restart does not
+        query every venue at the same instant.  Returns the number of
+        watches resumed.
+        """
+        now = self._clock()
+        wall_now = self._wall_clock()
+        restored = 0
+        for item in data.get("watches", []):
+            remaining = item["deadline"] - wall_now
+            if remaining <= 0:
+                continue
+            watch = Watch(
+                slug=item["slug"],
+                device=item["device"],
+                deadline=now + remaining,
+                watch_id=item["watch_id"],
+                seen_open=item.get("seen_open", False),
+                kind=item.get("kind", WATCH_OPEN),
+                items=tuple(item.get("items", ())),
+                price_changes=item.get("price_changes", False),
+                eta_below=item.get("eta_below"),
+                latitude=item.get("latitude"),
+                longitude=item.get("longitude"),
+                radius_km=item.get("radius_km"),
+            )
+            if self._existing(watch.kind, watch.slug, watch.device) is not None:
+                continue
+            self._add(watch, random.uniform(0, self._scan_interval))
+            restored += 1
+        return restored
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the watches in a form suitable for storage."""
+        offset = self._wall_clock() - self._clock()
+        return {
+            "watches": [
+                {
+                    "watch_id": watch.watch_id,
+                    "slug": watch.slug,
+                    "device": watch.device,
+                    "deadline": watch.deadline + offset,
+                    "seen_open": watch.seen_open,
+                    **(
+                        {
+                            "kind": watch.kind,
+                            "items": list(watch.items),
+                            "price_changes": watch.price_changes,
+                            "eta_below": watch.eta_below,
+                        }
+                        if watch.kind == WATCH_MENU
+                        else {}
+                    ),
+                    **(
+                        {
+                            "kind": watch.kind,
+                            "latitude": watch.latitude,
+                            "longitude": watch.longitude,
+                            "radius_km": watch.radius_km,
+                        }
+                        if watch.kind == WATCH_AREA
+                        else {}
+                    ),
+                }
+                for watch in self._watches.values()
+            ]
+        }
+
+    async def async_stop(self) -> None:
+        """Stop the scheduler, keeping the watches for a final save."""
+        await self.scheduler.async_stop()
+
+    def _churn_score(self, key: str) -> float:
+        """Return a poll key's recent state changes, decayed to now."""
+        if (entry := self._churn.get(key)) is None:
+            return 0.0
+        score, updated = entry
+        return score * 0.5 ** ((self._clock() - updated) / CHURN_HALF_LIFE_SECONDS)
+
+    def _record_churn(self, key: str) -> None:
+        """Note that a poll key's state just changed."""
+        self._churn[key] = (self._churn_score(key) + 1, self._clock())
+
+    def _opening_score(self, slug: str) -> float:
+        """Return how close a venue is to its expected opening, from 0 to 1."""
+        now = datetime.fromtimestamp(self._wall_clock(), UTC)
+        if (hours := self._hours.get(slug)) is None:
+            # Fall back to the window learnt from past openings
+            if (window := self.history.opening_window(slug, now)) is None:
+                return 0.5
+            start, end = window
+            if now > end:
+                return 0.0
+            lead = max((start - now).total_seconds(), 0)
+            return 1 / (1 + lead / OPENING_LEAD_SECONDS)
+        if hours.minutes_since_opening(now) is not None:
+            return 1.0
+        if (until := hours.minutes_until_opening(now)) is None:
+            return 0.5
+        lead = max(until * 60 - OPENING_LEAD_SECONDS, 0)
+        return 1 / (1 + lead / OPENING_LEAD_SECONDS)
+
+    def _priority(self, key: str) -> float:
+        """Rank a due poll when the request budget cannot cover every one.
+
+        Adds how close the venue is to opening, how soon its first watch
+        expires and how often its state changed lately, each from 0 to 1.
+        """
+        kind, slug = split_key(key)
+        watches = self._pools[kind].get(slug)
+        if not watches:
+            return 0.0
+        remaining = min(watch.deadline for watch in watches.values()) - self._clock()
+        urgency = 1 / (1 + max(remaining, 0) / PRIORITY_HORIZON_SECONDS)
+        churn = self._churn_score(key)
+        return self._opening_score(slug) + urgency + churn / (1 + churn)
+
+    def _changed(self) -> None:
+        """Tell the listener that persisted state changed."""
+        if self.on_change is not None:
+            self.on_change()
+
+    def _start(self, slug: str, device: str, deadline: float) -> Watch:
+        """Add a watch, or push out the deadline of an identical one."""
+        if (watch := self._existing(WATCH_OPEN, slug, device)) is not None:
+            if deadline > watch.deadline:
+                self._set_deadline(watch, deadline)
+            return watch
+        watch = Watch(slug=slug, device=device, deadline=deadline)
+        self._add(watch, 0)
+        return watch
+
+    def _set_deadline(self, watch: Watch, deadline: float) -> None:
+        """Move a watch's deadline and reschedule its expiry."""
+        watch.deadline = deadline
+        self.scheduler.schedule_expiry(watch.watch_id, deadline)
+        self._updated(watch)
+
+    def _updated(self, watch: Watch) -> None:
+        """Persist and stream a change to an existing watch."""
+        self._changed()
+        if self._listeners:
+            self._emit({"event": "updated", "watch": self.describe(watch)})
+
+    def _pool(self, watch: Watch) -> dict[str, dict[str, Watch]]:
+        """Return the per-slug subscriber index for a watch's kind."""
+        return self._pools[watch.kind]
+
+    def _existing(self, kind: str, slug: str, device: str) -> Watch | None:
+        """Return the watch of a kind on a slug for a device, if any."""
+        return self._pools[kind].get(slug, {}).get(device)
+
+    def _add(self, watch: Watch, first_poll: float) -> None:
+        """Register a watch, scheduling its slug's first poll if new."""
+        self.scheduler.start(self._create_task)
+        self._watches[watch.watch_id] = watch
+        self._by_device.setdefault(watch.device, {})[watch.watch_id] = watch
+        self.scheduler.schedule_expiry(watch.watch_id, watch.deadline)
+        pool = self._pool(watch)
+        if watch.slug not in pool:
+            pool[watch.slug] = {}
+            self.scheduler.schedule_poll(watch.key, first_poll, jitter=False)
+        # Keyed by device: one watch of a kind per slug and device
+        pool[watch.slug][watch.device] = watch
+        if self._listeners:
+            self._emit({"event": "added", "watch": self.describe(watch)})
+
+    def _remove(self, watch: Watch, reason: str = REMOVED_CANCELLED) -> None:
+        """Remove a watch, stopping its slug's polls if it was the last."""
+        self._watches.pop(watch.watch_id, None)
+        self.scheduler.cancel_expiry(watch.watch_id)
+        if self._listeners:
+            self._emit(
+                {"event": "removed", "watch_id": watch.watch_id, "reason": reason}
+            )
+        if (by_device := self._by_device.get(watch.device)) is not None:
+            by_device.pop(watch.watch_id, None)
+            if not by_device:
+                del self._by_device[watch.device]
+        pool = self._pool(watch)
+        subscribers = pool.get(watch.slug)
+        if subscribers is None:
+            return
+        if subscribers.get(watch.device) is watch:
+            del subscribers[watch.device]
+        if not subscribers:
+            del pool[watch.slug]
+            if watch.kind == WATCH_OPEN:
+                self._hours.pop(watch.slug, None)
+                self._open_states.pop(watch.slug, None)
+            elif watch.kind == WATCH_MENU:
+                self._menus.pop(watch.slug, None)
+            else:
+                self._area_open.pop(watch.slug, None)
+            self._churn.pop(watch.key, None)
+            self._venue_states.pop(watch.key, None)
+            self._failures.pop(watch.key, None)
+            self.scheduler.cancel_poll(watch.key)
+        self._changed()
+
+    def _expire(self, watch_id: str) -> None:
+        """Drop a watch whose deadline passed."""
+        if (watch := self._watches.get(watch_id)) is None:
+            return
+        _LOGGER.info(
+            "Wolt watch timeout reached for %s (%s)", watch.slug, watch.device
+        )
+        self._remove(watch, REMOVED_EXPIRED)
+
+    async def _async_poll(self, keys: list[str]) -> dict[str, float | None]:
+        """Poll a batch of keys; return the delay until each one's next poll."""
+        parsed = [(key, *split_key(key)) for key in keys]
+        slugs = [slug for _, kind, slug in parsed if kind == WATCH_OPEN]
+        delays: dict[str, float | None] = {}
+        if slugs:
+            delays.update(await self._async_poll_open(slugs))
+        others = [(key, kind, slug) for key, kind, slug in parsed if kind != WATCH_OPEN]
+        if others:
+            pollers = {
+                WATCH_MENU: self._async_poll_menu,
+                WATCH_AREA: self._async_poll_area,
+            }
+            results = await asyncio.gather(
+                *(pollers[kind](slug) for _, kind, slug in others)
+            )
+            delays.update((key, delay) for (key, _, _), delay in zip(others, results))
+        return delays
+
+    def _cadence(self, delay: float) -> float:
+        """Cap a successful poll's next delay at the maximum interval.
+
+        Failure backoff is left alone, so a broken venue or an upstream
+        asking to be left alone is not polled again sooner than it should.
+        """
+        return min(delay, self._max_interval)
+
+    def _failed(self, key: str, watches: list[Watch], error: Exception) -> float | None:
+        """Handle a failed poll; return the delay until the next one."""
+        if isinstance(error, WoltWatchNotFoundError):
+            _LOGGER.error("Stopping watches for %s: %s", key, error)
+            for watch in watches:
+                self._remove(watch, REMOVED_NOT_FOUND)
+            return None
+        if isinstance(error, WoltWatchCircuitOpenError):
+            # Skip this poll without counting it as a failure
+            self._set_venue_state(key, VENUE_BACKING_OFF)
+            return max(error.retry_after or 0, self._scan_interval)
+        failures = self._failures[key] = self._failures.get(key, 0) + 1
+        _LOGGER.warning("Wolt API check failed for %s: %s", key, error)
+        self.metrics.backoffs += 1
+        self._set_venue_state(key, VENUE_BACKING_OFF)
+        # Back off exponentially on transient errors
+        return self._backoff.delay(failures, getattr(error, "retry_after", None))
+
+    async def _async_poll_open(self, slugs: list[str]) -> dict[str, float | None]:
+        """Poll a batch of slugs for their open watches."""
+        due = [slug for slug in slugs if self._subscribers.get(slug)]
+        if not due:
+            return {}
+        results = await self._resolve(due, self._subscribers.keys())
+
+        delays: dict[str, float | None] = {}
+        fan_outs = []
+        for slug, result in results.items():
+            if not self._subscribers.get(slug):
+                continue
+            if isinstance(result, Exception):
+                delays[slug] = self._failed(
+                    slug, list(self._subscribers[slug].values()), result
+                )
+                continue
+            self._failures.pop(slug, None)
+            self._set_venue_state(slug, VENUE_POLLING)
+            if result.hours is not None:
+                self._hours[slug] = result.hours
+            if self._open_states.get(slug, result.is_open) != result.is_open:
+                self._record_churn(slug)
+                self.history.record(slug, result.is_open, self._wall_clock())
+            self._open_states[slug] = result.is_open
+            fan_outs.append(self._async_fan_out(slug, result.is_open))
+        await asyncio.gather(*fan_outs)
+
+        now = datetime.fromtimestamp(self._wall_clock(), UTC)
+        for slug in results:
+            if slug not in delays and self._subscribers.get(slug):
+                # Follow the venue's published hours, else its learnt ones
+                hours = self._hours.get(slug)
+                learnt = None
+                if hours is None:
+                    learnt = self.history.poll_delay(slug, now, self._scan_interval)
+                delays[slug] = self._cadence(
+                    learnt
+                    if learnt is not None
+                    else poll_delay(hours, now, self._scan_interval)
+                )
+        return delays
+
+    async def _async_poll_menu(self, slug: str) -> float | None:
+        """Poll a venue's menu (and status, for ETA) for its menu watches."""
+        key = f"{WATCH_MENU}:{slug}"
+        watches = list(self._menu_subscribers.get(slug, {}).values())
+        if not watches:
+            return None
+        name = slug.replace("-", " ").title()
+        alerts: dict[str, list[str]] = {watch.watch_id: [] for watch in watches}
+        menu = None
+        try:
+            if any(watch.items or watch.price_changes for watch in watches):
+                if self._fetch_menu is None:
+                    raise WoltWatchConfigurationError("Menus are not available")
+                menu = await self._fetch_menu(slug)
+                old = self._menus.get(slug)
+                changes = menu_changes(old, menu) if old is not None else []
+                if changes:
+                    self._record_churn(key)
+                for watch in watches:
+                    alerts[watch.watch_id] += menu_alerts(
+                        name,
+                        old,
+                        menu,
+                        changes,
+                        items=watch.items,
+                        price_changes=watch.price_changes,
+                    )
+            if any(watch.eta_below is not None for watch in watches):
+                status = (await self._resolve([slug], [slug]))[slug]
+                if isinstance(status, Exception):
+                    raise status
+                for watch in watches:
+                    if watch.eta_below is not None and (
+                        text := eta_alert(name, status, watch.eta_below)
+                    ):
+                        alerts[watch.watch_id].append(text)
+        except Exception as err:  # pylint: disable=broad-except
+            # Watches may have been cancelled while the poll was in flight
+            if not (current := self._menu_subscribers.get(slug)):
+                return None
+            return self._failed(key, list(current.values()), err)
+        if not (current := self._menu_subscribers.get(slug)):
+            return None
+
+        # Only move the baseline once the whole poll succeeded
+        if menu is not None:
+            self._menus[slug] = menu
+        self._failures.pop(key, None)
+        self._set_venue_state(key, VENUE_POLLING)
+        triggered = [
+            watch
+            for watch in watches
+            if alerts[watch.watch_id] and current.get(watch.device) is watch
+        ]
+        for watch in triggered:
+            self._remove(watch, REMOVED_TRIGGERED)
+        if triggered and self._alert is not None:
+            results = await asyncio.gather(
+                *(self._alert(watch, alerts[watch.watch_id]) for watch in triggered),
+                return_exceptions=True,
+            )
+            for watch, result in zip(triggered, results):
+                if isinstance(result, Exception):
+                    _LOGGER.error(
+                        "Failed to alert %s about %s: %s", watch.device, slug, result
+                    )
+        if not self._menu_subscribers.get(slug):
+            return None
+        return self._cadence(self._scan_interval)
+
+    async def _async_poll_area(self, slug: str) -> float | None:
+        """Poll an area's venues with one listing for its area watches."""
+        key = f"{WATCH_AREA}:{slug}"
+        watches = list(self._area_subscribers.get(slug, {}).values())
+        if not watches:
+            return None
+        centre = (watches[0].latitude, watches[0].longitude)
+        radius = watches[0].radius_km
+        try:
+            if self._fetch_nearby is None:
+                raise WoltWatchConfigurationError("Venue listings are not available")
+            statuses = await self._fetch_nearby(*centre)
+        except Exception as err:  # pylint: disable=broad-except
+            # Watches may have been cancelled while the poll was in flight
+            if not (current := self._area_subscribers.get(slug)):
+                return None
+            return self._failed(key, list(current.values()), err)
+        if not (current := self._area_subscribers.get(slug)):
+            return None
+        watches = list(current.values())
+        self._failures.pop(key, None)
+        self._set_venue_state(key, VENUE_POLLING)
+
+        # Interned, so every poll's set shares the same slug strings
+        open_now = frozenset(
+            sys.intern(status.slug)
+            for status in statuses
+            if status.is_open
+            and (
+                status.location is None
+                or distance_km(centre, status.location) <= radius
+            )
+        )
+        before = self._area_open.get(slug)
+        self._area_open[slug] = open_now
+        if before is None:
+            return self._cadence(self._scan_interval)
+        opened = open_now - before
+        if opened:
+            self._record_churn(key)
+        if opened and self._notify_area is not None:
+            names = {status.slug: status.name for status in statuses}
+            texts = sorted(
+                names[venue] or venue.replace("-", " ").title() for venue in opened
+            )
+            results = await asyncio.gather(
+                *(self._notify_area(watch, texts) for watch in watches),
+                return_exceptions=True,
+            )
+            for watch, result in zip(watches, results):
+                if isinstance(result, Exception):
+                    _LOGGER.error(
+                        "Failed to notify %s about openings near %s: %s",
+                        watch.device,
+                        slug,
+                        result,
+                    )
+        return self._cadence(self._scan_interval)
+
+    async def _async_fan_out(self, slug: str, open_now: bool) -> None:
+        """Deliver a poll result to every subscriber of a slug."""
+        opened = []
+        for watch in list(self._subscribers.get(slug, {}).values()):
+            if open_now and not watch.seen_open:
+                opened.append(watch)
+                self._remove(watch, REMOVED_OPENED)
+            elif watch.seen_open != open_now:
+                watch.seen_open = open_now
+                self._updated(watch)
+
+        results = await asyncio.gather(
+            *(self._notify(watch) for watch in opened), return_exceptions=True
+        )
+        for watch, result in zip(opened, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Failed to notify %s that %s opened: %s",
+                    watch.device,
+                    slug,
+                    result,
+                )
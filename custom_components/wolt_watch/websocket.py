@@ -0,0 +1,64 @@
+"""Websocket commands for the Wolt Watch card."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+import voluptuous as vol
+
+from .const import (
+    DATA_VENUE_INDEX,
+    DOMAIN,
+    VENUE_SEARCH_LIMIT,
+    WS_VENUE_SEARCH,
+    WS_WATCHES_SUBSCRIBE,
+)
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_venue_search)
+    websocket_api.async_register_command(hass, websocket_subscribe_watches)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_VENUE_SEARCH,
+        vol.Required("query"): str,
+        vol.Optional("limit", default=VENUE_SEARCH_LIMIT): vol.All(
+            int, vol.Range(min=1, max=50)
+        ),
+    }
+)
+@callback
+def websocket_venue_search(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Look venues up in the local index, without calling Wolt."""
+    index = hass.data[DATA_VENUE_INDEX]
+    connection.send_result(
+        msg["id"], {"venues": index.search(msg["query"], msg["limit"])}
+    )
+
+
+@websocket_api.websocket_command({vol.Required("type"): WS_WATCHES_SUBSCRIBE})
+@callback
+def websocket_subscribe_watches(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream a snapshot of active watches, then every change to them."""
+    manager = hass.data[DOMAIN]
+
+    @callback
+    def forward(event: dict[str, Any]) -> None:
+        """Send one watch event to the subscriber."""
+        connection.send_message(websocket_api.event_message(msg["id"], event))
+
+    connection.send_result(msg["id"])
+    connection.subscriptions[msg["id"]] = manager.async_subscribe(forward)
@@ -1,9 +1,33 @@
 """Common fixtures for Wolt Watch tests."""
 from __future__ import annotations
 
+import sys
+import types
+from pathlib import Path
+
 import pytest
 from unittest.mock import Mock
 
+ROOT_DIR = Path(__file__).parent.parent
+
+# Register the package without executing __init__.py (which needs Home
+# Assistant), so test modules can import its engine modules directly
+package = types.ModuleType("wolt_watch")
+package.__path__ = [str(ROOT_DIR / "custom_components" / "wolt_watch")]
+sys.modules.setdefault("wolt_watch", package)
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
 
 @pytest.fixture
 def mock_wolt_api():
@@ -0,0 +1,194 @@
+"""Test the Wolt API clients."""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import types
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+api_module = importlib.import_module("wolt_watch.api")
+exceptions_module = importlib.import_module("wolt_watch.exceptions")
+AiohttpWoltClient = api_module.AiohttpWoltClient
+ExecutorWoltClient = api_module.ExecutorWoltClient
+
+
+async def _venue(request):
+    """Serve a minimal venue payload."""
+    slug = request.match_info["slug"]
+    if slug == "missing":
+        return web.json_response({"results": []})
+    if slug == "broken":
+        return web.Response(status=500)
+    if slug == "slow":
+        await asyncio.sleep(1)
+    if slug == "throttled":
+        return web.Response(status=429, headers={"Retry-After": "120"})
+    return web.json_response(
+        {
+            "results": [
+                {
+                    "slug": slug,
+                    "online": slug == "taizu",
+                    "location": {"type": "Point", "coordinates": [34.78, 32.08]},
+                }
+            ]
+        }
+    )
+
+
+async def _nearby(request):
+    """Serve a minimal nearby listing."""
+    assert request.query["lat"] == "32.08"
+    return web.json_response(
+        {
+            "sections": [
+                {"name": "banner"},
+                {
+                    "items": [
+                        {"venue": {"slug": "taizu", "online": True, "location": [34.78, 32.08]}},
+                        {"venue": {"slug": "other", "online": False}},
+                        {"title": "not a venue"},
+                    ]
+                },
+            ]
+        }
+    )
+
+
+def _run_with_server(test):
+    """Run a coroutine against a local fake Wolt server."""
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/v3/venues/slug/{slug}", _venue)
+        app.router.add_get("/v1/pages/restaurants", _nearby)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            async with aiohttp.ClientSession() as session:
+                client = AiohttpWoltClient(
+                    session, base_url=str(server.make_url("")), timeout=0.2
+                )
+                return await test(client)
+        finally:
+            await server.close()
+
+    return asyncio.run(run())
+
+
+def test_aiohttp_client_reads_online_flag():
+    """Test that the open state comes from the venue's online flag."""
+
+    async def test(client):
+        return await client.async_get_status("taizu"), await client.async_get_status("other")
+
+    taizu, other = _run_with_server(test)
+    assert (taizu.is_open, other.is_open) == (True, False)
+    assert taizu.location == (32.08, 34.78)
+
+
+def test_aiohttp_client_quotes_slugs():
+    """Test that a slug cannot escape the venue path."""
+
+    async def test(client):
+        return await client.async_get_status("taizu/../x?y#z")
+
+    status = _run_with_server(test)
+    assert status.slug == "taizu/../x?y#z"
+
+
+def test_aiohttp_client_nearby_listing():
+    """Test that a listing call yields a status per venue."""
+
+    async def test(client):
+        return await client.async_get_nearby(32.08, 34.78)
+
+    statuses = _run_with_server(test)
+    assert [(status.slug, status.is_open) for status in statuses] == [
+        ("taizu", True),
+        ("other", False),
+    ]
+    assert statuses[0].location == (32.08, 34.78)
+    assert statuses[1].location is None
+
+
+def test_aiohttp_client_errors():
+    """Test that failures map to the integration's exceptions."""
+
+    async def test(client):
+        errors = []
+        for slug in ("missing", "broken", "slow", "throttled"):
+            try:
+                await client.async_get_status(slug)
+            except exceptions_module.WoltWatchException as err:
+                errors.append(err)
+        return errors
+
+    errors = _run_with_server(test)
+    assert [type(err).__name__ for err in errors] == [
+        "WoltWatchNotFoundError",
+        "WoltWatchServerError",
+        "WoltWatchConnectionError",
+        "WoltWatchRateLimitError",
+    ]
+    assert errors[3].retry_after == 120
+
+
+def test_executor_client_delegates_to_sdk(mock_wolt_api):
+    """Test that the fallback backend runs the SDK through the executor."""
+    calls = []
+
+    async def run_in_executor(func, *args):
+        calls.append(args)
+        return func(*args)
+
+    client = ExecutorWoltClient(mock_wolt_api, run_in_executor)
+
+    assert asyncio.run(client.async_get_status("taizu")).is_open is False
+    assert calls == [("taizu",)]
+    mock_wolt_api.is_restaurant_open.assert_called_once_with("taizu")
+
+
+class WoltAPIError(Exception):
+    """Stand-in for the SDK's own error type."""
+
+
+class HTTPError(OSError):
+    """Stand-in for a requests HTTP error."""
+
+    def __init__(self, status_code):
+        """Carry a response with a status code."""
+        super().__init__(f"{status_code} Client Error")
+        self.response = types.SimpleNamespace(status_code=status_code)
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (WoltAPIError("1 validation error for Venue"), "WoltWatchNotFoundError"),
+        (HTTPError(404), "WoltWatchNotFoundError"),
+        (None, "WoltWatchNotFoundError"),
+        (HTTPError(503), "WoltWatchConnectionError"),
+        (WoltAPIError("Error checking venue"), "WoltWatchAPIError"),
+        (ValueError("bad"), "WoltWatchAPIError"),
+    ],
+)
+def test_executor_client_maps_unknown_venues(error, expected):
+    """Test that the SDK's unknown-venue failures end watches at once."""
+
+    async def run_in_executor(func, *args):
+        if error is None:
+            return None  # No venue, no open state
+        raise error
+
+    api = types.SimpleNamespace(is_restaurant_open=lambda slug: None)
+    client = ExecutorWoltClient(api, run_in_executor)
+
+    with pytest.raises(exceptions_module.WoltWatchException) as err:
+        asyncio.run(client.async_get_status("no-such-venue"))
+    assert type(err.value).__name__ == expected
@@ -0,0 +1,93 @@
+"""Test bulk open-status resolution."""
+from __future__ import annotations
+
+import asyncio
+import importlib
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+batch_module = importlib.import_module("wolt_watch.batch")
+models_module = importlib.import_module("wolt_watch.models")
+BatchStatusResolver = batch_module.BatchStatusResolver
+VenueStatus = models_module.VenueStatus
+
+
+class FakeClient:
+    """Client recording every upstream call."""
+
+    def __init__(self, listed):
+        """Initialize with the slugs the nearby listing returns."""
+        self.listed = listed
+        self.calls = []
+
+    async def async_get_status(self, slug):
+        """Return a closed venue in Tel Aviv."""
+        self.calls.append(("status", slug))
+        return VenueStatus(slug, False, 32.08, 34.78)
+
+    async def async_get_nearby(self, latitude, longitude):
+        """Return every listed venue as open."""
+        self.calls.append(("nearby", round(latitude, 2), round(longitude, 2)))
+        return [VenueStatus(slug, True, 32.08, 34.78) for slug in self.listed]
+
+
+def test_unknown_locations_resolve_one_by_one():
+    """Test that venues are fetched individually until located."""
+    slugs = [f"venue-{i}" for i in range(20)]
+    client = FakeClient(slugs)
+    resolver = BatchStatusResolver(client)
+
+    results = asyncio.run(resolver.async_resolve(slugs, slugs))
+
+    assert len(client.calls) == 20
+    assert all(result.is_open is False for result in results.values())
+
+
+def test_located_neighbours_share_one_listing_call():
+    """Test that 20 venues in one area cost one request per cycle."""
+    slugs = [f"venue-{i}" for i in range(20)]
+    client = FakeClient(slugs)
+    resolver = BatchStatusResolver(client)
+    asyncio.run(resolver.async_resolve(slugs, slugs))
+    client.calls.clear()
+
+    results = asyncio.run(resolver.async_resolve(slugs[:3], slugs))
+
+    assert client.calls == [("nearby", 32.08, 34.78)]
+    assert set(results) == set(slugs)
+    assert all(result.is_open for result in results.values())
+
+
+def test_venues_missing_from_listing_fall_back():
+    """Test that only unlisted venues are fetched individually."""
+    slugs = ["listed", "unlisted"]
+    client = FakeClient(["listed"])
+    resolver = BatchStatusResolver(client)
+    asyncio.run(resolver.async_resolve(slugs, slugs))
+    client.calls.clear()
+
+    results = asyncio.run(resolver.async_resolve(slugs, slugs))
+
+    assert client.calls == [("nearby", 32.08, 34.78), ("status", "unlisted")]
+    assert results["listed"].is_open is True
+    assert results["unlisted"].is_open is False
+
+
+def test_failed_listing_falls_back_to_single_calls():
+    """Test that a listing error does not fail the batch."""
+    slugs = ["a", "b"]
+    client = FakeClient(slugs)
+    resolver = BatchStatusResolver(client)
+    asyncio.run(resolver.async_resolve(slugs, slugs))
+    client.calls.clear()
+
+    async def broken(latitude, longitude):
+        raise ConnectionError("down")
+
+    client.async_get_nearby = broken
+    results = asyncio.run(resolver.async_resolve(slugs, slugs))
+
+    assert sorted(client.calls) == [("status", "a"), ("status", "b")]
+    assert set(results) == {"a", "b"}
@@ -0,0 +1,99 @@
+"""Test the circuit breaker around the Wolt backend."""
+from __future__ import annotations
+
+import asyncio
+import importlib
+
+import pytest
+
+from .conftest import FakeClock
+
+breaker_module = importlib.import_module("wolt_watch.breaker")
+exceptions_module = importlib.import_module("wolt_watch.exceptions")
+models_module = importlib.import_module("wolt_watch.models")
+BreakerWoltClient = breaker_module.BreakerWoltClient
+CircuitBreaker = breaker_module.CircuitBreaker
+
+
+class FlakyClient:
+    """Client that fails while ``down`` is set."""
+
+    def __init__(self):
+        """Start failing."""
+        self.down = True
+        self.calls = 0
+
+    async def async_get_status(self, slug):
+        """Fail with a connection error or report a closed venue."""
+        self.calls += 1
+        if self.down:
+            raise exceptions_module.WoltWatchConnectionError("down")
+        if slug == "unknown":
+            raise exceptions_module.WoltWatchNotFoundError("unknown")
+        return models_module.VenueStatus(slug, False)
+
+
+def _call(client, slug="taizu"):
+    """Make one call and return the exception type name, if any."""
+    try:
+        asyncio.run(client.async_get_status(slug))
+    except exceptions_module.WoltWatchException as err:
+        return type(err).__name__
+    return None
+
+
+def test_breaker_opens_after_threshold_and_fails_fast():
+    """Test that repeated upstream failures stop further calls."""
+    clock = FakeClock()
+    states = []
+    breaker = CircuitBreaker(threshold=3, reset_timeout=60, clock=clock)
+    breaker.on_state_change = states.append
+    upstream = FlakyClient()
+    client = BreakerWoltClient(upstream, breaker)
+
+    assert [_call(client) for _ in range(3)] == ["WoltWatchConnectionError"] * 3
+    assert breaker.state == "open"
+    assert _call(client) == "WoltWatchCircuitOpenError"
+    assert upstream.calls == 3
+    assert states == ["open"]
+    assert breaker.as_dict()["trips"] == 1
+
+
+def test_half_open_lets_a_single_probe_through():
+    """Test that only one probe goes out after the reset timeout."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=1, reset_timeout=60, clock=clock)
+    breaker.record_failure()
+    clock.now = 60
+
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+
+def test_failed_probe_reopens_breaker():
+    """Test that a failing probe restarts the open period."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=1, reset_timeout=60, clock=clock)
+    client = BreakerWoltClient(FlakyClient(), breaker)
+    _call(client)
+    clock.now = 60
+
+    assert _call(client) == "WoltWatchConnectionError"
+    assert breaker.state == "open"
+    assert breaker.time_until_retry() == pytest.approx(60)
+    assert breaker.trips == 2
+
+
+def test_bad_slug_does_not_trip_breaker():
+    """Test that errors about the request itself count as a live upstream."""
+    breaker = CircuitBreaker(threshold=1)
+    upstream = FlakyClient()
+    upstream.down = False
+    client = BreakerWoltClient(upstream, breaker)
+
+    assert _call(client, "unknown") == "WoltWatchNotFoundError"
+    assert breaker.state == "closed"
@@ -0,0 +1,89 @@
+"""Test the shared venue status cache."""
+from __future__ import annotations
+
+import asyncio
+import importlib
+
+import pytest
+
+from .conftest import FakeClock
+
+cache_module = importlib.import_module("wolt_watch.cache")
+models_module = importlib.import_module("wolt_watch.models")
+StatusCache = cache_module.StatusCache
+VenueStatus = models_module.VenueStatus
+
+
+def test_entries_expire_after_ttl():
+    """Test that entries are only served while fresh."""
+    clock = FakeClock()
+    cache = StatusCache(ttl=30, clock=clock)
+    cache.set(VenueStatus("taizu", True))
+
+    clock.now = 29
+    assert cache.get("taizu").is_open is True
+    clock.now = 30
+    assert cache.get("taizu") is None
+    assert cache.peek("taizu") == (VenueStatus("taizu", True), 30)
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Test that the cache stays within its size bound."""
+    cache = StatusCache(max_size=2)
+    cache.set(VenueStatus("a", False))
+    cache.set(VenueStatus("b", False))
+    cache.get("a")
+    cache.set(VenueStatus("c", False))
+
+    assert len(cache) == 2
+    assert cache.peek("b") is None
+    assert cache.get("a") is not None
+
+
+def test_concurrent_misses_share_one_fetch():
+    """Test in-flight deduplication of concurrent misses."""
+    cache = StatusCache()
+    calls = []
+
+    async def fetch(slug):
+        calls.append(slug)
+        await asyncio.sleep(0.01)
+        return VenueStatus(slug, True)
+
+    async def run():
+        return await asyncio.gather(
+            *(cache.async_get("taizu", fetch) for _ in range(5))
+        )
+
+    results = asyncio.run(run())
+
+    assert calls == ["taizu"]
+    assert all(result.is_open for result in results)
+    assert (cache.hits, cache.misses) == (4, 1)
+    assert asyncio.run(cache.async_get("taizu", fetch)).is_open is True
+    assert calls == ["taizu"]
+
+
+def test_failed_fetch_is_shared_and_not_cached():
+    """Test that an error reaches every waiter and the next call retries."""
+    cache = StatusCache()
+    calls = []
+
+    async def fetch(slug):
+        calls.append(slug)
+        await asyncio.sleep(0.01)
+        raise ConnectionError("down")
+
+    async def run():
+        return await asyncio.gather(
+            *(cache.async_get("taizu", fetch) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+
+    assert calls == ["taizu"]
+    assert all(isinstance(result, ConnectionError) for result in results)
+    with pytest.raises(ConnectionError):
+        asyncio.run(cache.async_get("taizu", fetch))
+    assert calls == ["taizu", "taizu"]
@@ -0,0 +1,129 @@
+"""Test the notification dispatcher."""
+from __future__ import annotations
+
+import asyncio
+import importlib
+
+dispatch_module = importlib.import_module("wolt_watch.dispatch")
+exceptions_module = importlib.import_module("wolt_watch.exceptions")
+NotificationDispatcher = dispatch_module.NotificationDispatcher
+opening_message = dispatch_module.opening_message
+
+
+def test_opening_message():
+    """Test the single and combined message formats."""
+    assert opening_message(["Taizu"]) == "Taizu is now OPEN on Wolt!"
+    assert (
+        opening_message(["Taizu", "Miznon", "Vitrina"])
+        == "Taizu, Miznon and Vitrina are now OPEN on Wolt!"
+    )
+
+
+def test_openings_are_coalesced_per_device():
+    """Test that openings within the window become one message per device."""
+    sent = []
+
+    async def send(device, message):
+        sent.append((device, message))
+
+    async def run():
+        dispatcher = NotificationDispatcher(send, window=0.02)
+        dispatcher.start(asyncio.ensure_future)
+        dispatcher.enqueue("notify.a", "Taizu")
+        dispatcher.enqueue("notify.b", "Taizu")
+        dispatcher.enqueue("notify.a", "Miznon")
+        dispatcher.enqueue("notify.a", "Taizu")
+        assert sent == []
+        await asyncio.sleep(0.05)
+        metrics = dispatcher._metrics  # pylint: disable=protected-access
+        await dispatcher.async_stop()
+        return metrics
+
+    metrics = asyncio.run(run())
+
+    assert sorted(sent) == [
+        ("notify.a", "Taizu and Miznon are now OPEN on Wolt!"),
+        ("notify.b", "Taizu is now OPEN on Wolt!"),
+    ]
+    assert metrics.notifications == 2
+    assert metrics.notify_latency.count == 2
+
+
+def test_failed_sends_are_retried():
+    """Test that transient failures retry and bad devices do not."""
+    attempts = []
+
+    async def send(device, message):
+        attempts.append(device)
+        if device == "broken":
+            raise exceptions_module.WoltWatchConfigurationError("bad device")
+        if attempts.count(device) < 3:
+            raise RuntimeError("push service down")
+
+    async def run():
+        dispatcher = NotificationDispatcher(
+            send, window=0, retries=3, retry_delay=0.001
+        )
+        dispatcher.start(asyncio.ensure_future)
+        dispatcher.enqueue("notify.a", "Taizu")
+        dispatcher.enqueue("broken", "Taizu")
+        await asyncio.sleep(0.05)
+        metrics = dispatcher._metrics  # pylint: disable=protected-access
+        await dispatcher.async_stop()
+        return metrics
+
+    metrics = asyncio.run(run())
+
+    assert attempts.count("notify.a") == 3
+    assert attempts.count("broken") == 1
+    assert metrics.notifications == 1
+    assert metrics.notification_failures == 1
+
+
+def test_slow_sends_do_not_exceed_concurrency():
+    """Test that a slow notify backend is limited to the worker pool."""
+    in_flight = []
+    peak = []
+
+    async def send(device, message):
+        in_flight.append(device)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(device)
+
+    async def run():
+        dispatcher = NotificationDispatcher(send, window=0, concurrency=2)
+        dispatcher.start(asyncio.ensure_future)
+        for index in range(6):
+            dispatcher.enqueue(f"notify.{index}", "Taizu")
+        await asyncio.sleep(0.1)
+        await dispatcher.async_stop()
+
+    asyncio.run(run())
+
+    assert len(peak) == 6
+    assert max(peak) == 2
+
+
+def test_alerts_join_openings_in_one_message():
+    """Test that menu alerts are coalesced with openings for a device."""
+    sent = []
+
+    async def send(device, message):
+        sent.append((device, message))
+
+    async def run():
+        dispatcher = NotificationDispatcher(send, window=0.01)
+        dispatcher.start(asyncio.ensure_future)
+        dispatcher.enqueue_alert("notify.a", "Taizu: Pad Thai is back")
+        dispatcher.enqueue("notify.a", "Miznon")
+        dispatcher.enqueue_alert("notify.b", "Taizu delivers in about 25 min")
+        await asyncio.sleep(0.05)
+        await dispatcher.async_stop()
+
+    asyncio.run(run())
+
+    assert sorted(sent) == [
+        ("notify.a", "Miznon is now OPEN on Wolt!\nTaizu: Pad Thai is back"),
+        ("notify.b", "Taizu delivers in about 25 min"),
+    ]
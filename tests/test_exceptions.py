@@ -23,6 +23,9 @@ WoltWatchException = exceptions_module.WoltWatchException
 WoltWatchConnectionError = exceptions_module.WoltWatchConnectionError
 WoltWatchConfigurationError = exceptions_module.WoltWatchConfigurationError
 WoltWatchAPIError = exceptions_module.WoltWatchAPIError
+WoltWatchNotFoundError = exceptions_module.WoltWatchNotFoundError
+WoltWatchServerError = exceptions_module.WoltWatchServerError
+WoltWatchRateLimitError = exceptions_module.WoltWatchRateLimitError
 
 
 def test_base_exception():
@@ -56,12 +59,25 @@ def test_api_error():
     assert isinstance(exception, Exception)
 
 
+def test_rate_limit_error():
+    """Test WoltWatchRateLimitError carries the Retry-After hint."""
+    exception = WoltWatchRateLimitError("Slow down", retry_after=30)
+    assert str(exception) == "Slow down"
+    assert exception.retry_after == 30
+    assert WoltWatchRateLimitError("Slow down").retry_after is None
+
+
 def test_exception_hierarchy():
     """Test that all custom exceptions inherit properly."""
     # All custom exceptions should inherit from WoltWatchException
     assert issubclass(WoltWatchConnectionError, WoltWatchException)
     assert issubclass(WoltWatchConfigurationError, WoltWatchException)
     assert issubclass(WoltWatchAPIError, WoltWatchException)
+
+    # Classified API errors are still API errors
+    assert issubclass(WoltWatchNotFoundError, WoltWatchAPIError)
+    assert issubclass(WoltWatchServerError, WoltWatchAPIError)
+    assert issubclass(WoltWatchRateLimitError, WoltWatchAPIError)
     
     # And ultimately from Exception
     assert issubclass(WoltWatchException, Exception)
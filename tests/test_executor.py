@@ -0,0 +1,109 @@
+"""Test the dedicated SDK executor."""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import os
+import threading
+import time
+
+import pytest
+
+executor_module = importlib.import_module("wolt_watch.executor")
+api_module = importlib.import_module("wolt_watch.api")
+exceptions_module = importlib.import_module("wolt_watch.exceptions")
+BoundedExecutor = executor_module.BoundedExecutor
+
+
+def test_calls_run_on_dedicated_threads():
+    """Test that calls run off the loop's own executor and are counted."""
+    executor = BoundedExecutor(max_workers=2)
+
+    async def run():
+        return await executor.async_run(lambda: threading.current_thread().name)
+
+    name = asyncio.run(run())
+    executor.shutdown()
+
+    assert name.startswith("wolt_watch_sdk")
+    assert executor.as_dict()["completed"] == 1
+    assert executor.as_dict()["pending"] == 0
+
+
+def test_hung_call_is_abandoned_and_reported():
+    """Test that a call past its deadline fails while its thread stays busy."""
+    release = threading.Event()
+    executor = BoundedExecutor(max_workers=1, timeout=0.05)
+
+    async def run():
+        with pytest.raises(exceptions_module.WoltWatchConnectionError):
+            await executor.async_run(release.wait)
+        stuck = executor.as_dict()
+        release.set()
+        await asyncio.sleep(0.05)
+        return stuck, executor.as_dict()
+
+    stuck, after = asyncio.run(run())
+    executor.shutdown()
+
+    assert (stuck["abandoned"], stuck["stuck"], stuck["pending"]) == (1, 1, 1)
+    assert (after["stuck"], after["pending"]) == (0, 0)
+
+
+def test_saturated_executor_rejects_calls():
+    """Test that calls beyond the workers and queue are rejected at once."""
+    release = threading.Event()
+    executor = BoundedExecutor(max_workers=1, max_queue=1, timeout=5)
+
+    async def run():
+        calls = [
+            asyncio.ensure_future(executor.async_run(release.wait)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        with pytest.raises(exceptions_module.WoltWatchBusyError):
+            await executor.async_run(release.wait)
+        release.set()
+        await asyncio.gather(*calls)
+
+    asyncio.run(run())
+    executor.shutdown()
+
+    assert executor.rejected == 1
+    assert executor.completed == 2
+
+
+def test_executor_errors_are_not_rewrapped():
+    """Test that the SDK client passes the executor's own errors through."""
+
+    async def run_in_executor(func, *args):
+        raise exceptions_module.WoltWatchBusyError("saturated")
+
+    client = api_module.ExecutorWoltClient(api_module.ProcessWoltAPI(), run_in_executor)
+
+    with pytest.raises(exceptions_module.WoltWatchBusyError):
+        asyncio.run(client.async_get_nearby(32.08, 34.78))
+
+
+def test_process_mode_kills_hung_calls():
+    """Test that process mode runs elsewhere and replaces a hung worker."""
+    executor = BoundedExecutor(max_workers=1, timeout=10, processes=True)
+
+    async def run():
+        pid = await executor.async_run(os.getpid)
+        executor._timeout = 0.2  # pylint: disable=protected-access
+        started = time.monotonic()
+        with pytest.raises(exceptions_module.WoltWatchConnectionError):
+            await executor.async_run(time.sleep, 30)
+        elapsed = time.monotonic() - started
+        executor._timeout = 10  # pylint: disable=protected-access
+        return pid, elapsed, await executor.async_run(os.getpid)
+
+    try:
+        pid, elapsed, new_pid = asyncio.run(run())
+    finally:
+        executor.shutdown()
+
+    assert pid != os.getpid()
+    assert elapsed < 5
+    assert new_pid not in (pid, os.getpid())
+    assert executor.abandoned == 1
@@ -0,0 +1,128 @@
+"""Test the benchmark Wolt stand-in against the real client."""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import sys
+
+import pytest
+
+from .conftest import ROOT_DIR, FakeClock
+
+aiohttp = pytest.importorskip("aiohttp")
+
+sys.path.insert(0, str(ROOT_DIR / "benchmarks"))
+
+api_module = importlib.import_module("wolt_watch.api")
+exceptions_module = importlib.import_module("wolt_watch.exceptions")
+fake_wolt = importlib.import_module("fake_wolt")
+
+
+def _run_against(fake, scenario):
+    """Serve the stand-in and run a scenario with a client pointed at it."""
+
+    async def _run():
+        url = await fake.async_start()
+        try:
+            async with aiohttp.ClientSession() as session:
+                client = api_module.AiohttpWoltClient(session, base_url=url)
+                return await scenario(client)
+        finally:
+            await fake.async_stop()
+
+    return asyncio.run(_run())
+
+
+def test_scripted_opening():
+    """Venues flip open when their scripted transition is due."""
+    clock = FakeClock()
+    fake = fake_wolt.FakeWolt(latency=0, clock=clock)
+    fake.schedule(60, True)
+
+    async def scenario(client):
+        before = await client.async_get_status("taizu")
+        clock.now = 61
+        after = await client.async_get_status("taizu")
+        return before, after
+
+    before, after = _run_against(fake, scenario)
+    assert not before.is_open
+    assert after.is_open
+    assert fake.venues["taizu"].opened_at == 60
+    assert before.location == after.location
+    assert fake.requests["venue"] == 2
+
+
+def test_nearby_lists_known_venues():
+    """The listing returns the venues around the requested point."""
+    fake = fake_wolt.FakeWolt(latency=0, spread=0.001)
+    fake.set_open("taizu", True)
+    fake.venue("miznon")
+
+    async def scenario(client):
+        return await client.async_get_nearby(*fake_wolt.CENTER)
+
+    statuses = _run_against(fake, scenario)
+    assert {status.slug: status.is_open for status in statuses} == {
+        "taizu": True,
+        "miznon": False,
+    }
+
+
+def test_injected_failures():
+    """Injected 429s and server errors map to the client's exceptions."""
+    throttled = fake_wolt.FakeWolt(latency=0, rate_limit_rate=1, retry_after=42)
+    failing = fake_wolt.FakeWolt(latency=0, error_rate=1)
+
+    async def scenario(client):
+        return await client.async_get_status("taizu")
+
+    with pytest.raises(exceptions_module.WoltWatchRateLimitError) as err:
+        _run_against(throttled, scenario)
+    assert err.value.retry_after == 42
+    with pytest.raises(exceptions_module.WoltWatchServerError):
+        _run_against(failing, scenario)
+    assert failing.responses == {503: 1}
+
+
+def test_unchanged_venues_are_not_downloaded_again():
+    """Repeat polls are answered 304 until the venue changes."""
+    clock = FakeClock()
+    fake = fake_wolt.FakeWolt(latency=0, padding=4000, clock=clock)
+    fake.schedule(60, True)
+
+    async def scenario(client):
+        statuses = [await client.async_get_status("taizu") for _ in range(3)]
+        clock.now = 61
+        statuses.append(await client.async_get_status("taizu"))
+        return client, statuses
+
+    client, statuses = _run_against(fake, scenario)
+    assert [status.is_open for status in statuses] == [False, False, False, True]
+    assert statuses[1] is statuses[0]
+    assert fake.responses == {200: 2, 304: 2}
+    assert client.not_modified == 2
+    assert fake.bytes_sent > 2 * 4000
+
+
+def test_menu_polls_reuse_unchanged_sections():
+    """Unchanged menus cost a 304; a change rebuilds only its section."""
+    fake = fake_wolt.FakeWolt(latency=0, menu_items=40)
+
+    async def scenario(client):
+        first = await client.async_get_menu("taizu")
+        second = await client.async_get_menu("taizu")
+        fake.venue("taizu").sold_out.add("3")
+        third = await client.async_get_menu("taizu")
+        return first, second, third
+
+    first, second, third = _run_against(fake, scenario)
+    assert second is first
+    assert fake.responses == {200: 2, 304: 1}
+    rebuilt = [
+        section_id
+        for section_id, section in third.sections.items()
+        if section is not first.sections[section_id]
+    ]
+    assert rebuilt == ["c3"]
+    assert not third.sections["c3"].items["3"].available
@@ -0,0 +1,102 @@
+"""Test opening times learnt from observed transitions."""
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+import importlib
+
+history_module = importlib.import_module("wolt_watch.history")
+OpeningHistory = history_module.OpeningHistory
+
+# 2026-10-19 is a Monday
+MONDAY = datetime(2026, 10, 19, tzinfo=UTC)
+
+
+def _opened(history, slug, *moments):
+    """Record a closed-to-open transition at each moment."""
+    for moment in moments:
+        history.record(slug, False, (moment - timedelta(hours=1)).timestamp())
+        history.record(slug, True, moment.timestamp())
+
+
+def test_ring_keeps_the_latest_transitions():
+    """Test that each venue keeps a bounded number of transitions."""
+    history = OpeningHistory(size=4, max_venues=2)
+    moments = [(MONDAY + timedelta(hours=hour)).timestamp() for hour in range(6)]
+    for hour, moment in enumerate(moments):
+        history.record("a", hour % 2 == 1, moment)
+
+    assert history.transitions("a") == [
+        (moment, hour % 2 == 1) for hour, moment in enumerate(moments) if hour >= 2
+    ]
+
+    history.record("b", True, MONDAY.timestamp())
+    history.record("c", True, MONDAY.timestamp())
+    # The least recently changed venue was dropped
+    assert len(history) == 2
+    assert history.transitions("a") == []
+
+    restored = OpeningHistory(size=4)
+    restored.restore(history.as_dict())
+    assert restored.transitions("c") == history.transitions("c")
+
+
+def test_predicts_window_from_past_openings():
+    """Test dense polling around learnt openings and sparse polling elsewhere."""
+    history = OpeningHistory()
+    _opened(
+        history,
+        "venue",
+        MONDAY - timedelta(days=7) + timedelta(hours=18, minutes=10),
+        MONDAY - timedelta(days=14) + timedelta(hours=18, minutes=30),
+    )
+
+    assert history.opening_window("venue", MONDAY.replace(hour=12)) == (
+        MONDAY.replace(hour=18, minute=5),
+        MONDAY.replace(hour=18, minute=45),
+    )
+    assert history.poll_delay("venue", MONDAY.replace(hour=18, minute=20), 60) == 15
+    assert history.poll_delay("venue", MONDAY.replace(hour=12), 60) == 5 * 60
+    # Wake up right as the window starts
+    assert history.poll_delay("venue", MONDAY.replace(hour=18, minute=3), 60) == 120
+    assert history.poll_delay("venue", MONDAY.replace(hour=21), 60) == 5 * 60
+    assert history.poll_delay("unknown", MONDAY, 60) is None
+
+
+def test_same_weekday_openings_win():
+    """Test that a weekday with its own openings ignores other days."""
+    history = OpeningHistory()
+    _opened(
+        history,
+        "venue",
+        *(MONDAY - timedelta(days=day) + timedelta(hours=11) for day in range(1, 6)),
+    )
+    # Without Monday data, every day's openings are used
+    assert history.opening_window("venue", MONDAY)[1] == MONDAY.replace(
+        hour=11, minute=15
+    )
+
+    _opened(
+        history,
+        "venue",
+        MONDAY - timedelta(days=7) + timedelta(hours=20),
+        MONDAY - timedelta(days=14) + timedelta(hours=20),
+    )
+    assert history.opening_window("venue", MONDAY)[0] == MONDAY.replace(
+        hour=19, minute=55
+    )
+
+
+def test_weekdays_follow_the_time_zone():
+    """Test that openings are bucketed by local, not UTC, weekday."""
+    history = OpeningHistory(timezone="Asia/Jerusalem")
+    # Sunday 22:30 UTC is Monday 01:30 in Israel
+    _opened(
+        history,
+        "venue",
+        MONDAY - timedelta(days=7, minutes=90),
+        MONDAY - timedelta(days=14, minutes=90),
+    )
+
+    start, _ = history.opening_window("venue", MONDAY.replace(hour=12))
+    assert start.weekday() == 0
+    assert (start.hour, start.minute) == (1, 25)
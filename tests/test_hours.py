@@ -0,0 +1,79 @@
+"""Test opening-hours aware poll cadence."""
+from __future__ import annotations
+
+from datetime import UTC, datetime
+import importlib
+
+hours_module = importlib.import_module("wolt_watch.hours")
+parse_opening_hours = hours_module.parse_opening_hours
+poll_delay = hours_module.poll_delay
+
+HOUR_MS = 3600 * 1000
+
+# Open 18:00-23:00 UTC every day, and 22:00-02:00 on Sunday night
+VENUE = {
+    "timezone": "UTC",
+    "opening_times": {
+        day: [
+            {"type": "open", "value": {"$date": 18 * HOUR_MS}},
+            {"type": "close", "value": {"$date": 23 * HOUR_MS}},
+        ]
+        for day in hours_module.WEEKDAYS[:6]
+    }
+    | {
+        "sunday": [{"type": "open", "value": {"$date": 22 * HOUR_MS}}],
+        "monday": [
+            {"type": "close", "value": {"$date": 2 * HOUR_MS}},
+            {"type": "open", "value": {"$date": 18 * HOUR_MS}},
+            {"type": "close", "value": {"$date": 23 * HOUR_MS}},
+        ],
+    },
+}
+
+# 2026-10-19 is a Monday
+MONDAY = datetime(2026, 10, 19, tzinfo=UTC)
+
+
+def test_parse_pairs_open_and_close_events():
+    """Test that windows are built from Wolt's weekly schedule."""
+    hours = parse_opening_hours(VENUE)
+
+    assert (18 * 60, 23 * 60) in hours.windows
+    # Sunday 22:00 closes on Monday 02:00, wrapping around the week
+    assert (6 * 1440 + 22 * 60, 2 * 60) in hours.windows
+    assert parse_opening_hours({"slug": "x"}) is None
+
+
+def test_sleeps_until_shortly_before_opening():
+    """Test that a venue closed for hours is not polled every minute."""
+    hours = parse_opening_hours(VENUE)
+
+    # 14:00: four hours to go, capped at the maximum idle sleep
+    assert poll_delay(hours, MONDAY.replace(hour=14), 60) == 30 * 60
+    # 17:45: sleep until five minutes before opening
+    assert poll_delay(hours, MONDAY.replace(hour=17, minute=45), 60) == 10 * 60
+
+
+def test_polls_densely_around_opening():
+    """Test the dense cadence just before and after the scheduled opening."""
+    hours = parse_opening_hours(VENUE)
+
+    assert poll_delay(hours, MONDAY.replace(hour=17, minute=57), 60) == 15
+    assert poll_delay(hours, MONDAY.replace(hour=18, minute=5), 60) == 15
+    # Opening passed long ago without the venue going online
+    assert poll_delay(hours, MONDAY.replace(hour=20), 60) == 60
+    # Inside the window that wrapped over from Sunday
+    assert poll_delay(hours, MONDAY.replace(hour=1), 60) == 60
+
+
+def test_unknown_hours_use_scan_interval():
+    """Test the fallback when a venue publishes no hours."""
+    assert poll_delay(None, MONDAY, 60) == 60
+
+
+def test_local_time_zone_is_respected():
+    """Test that windows are evaluated in the venue's time zone."""
+    hours = parse_opening_hours(VENUE | {"timezone": "Asia/Jerusalem"})
+
+    # 15:00 UTC is 18:00 in Israel (UTC+3 in October)
+    assert poll_delay(hours, MONDAY.replace(hour=15, minute=1), 60) == 15
@@ -0,0 +1,96 @@
+"""Test the shared Wolt client lifecycle."""
+from __future__ import annotations
+
+import asyncio
+import importlib
+
+import pytest
+
+lifecycle_module = importlib.import_module("wolt_watch.lifecycle")
+exceptions_module = importlib.import_module("wolt_watch.exceptions")
+models_module = importlib.import_module("wolt_watch.models")
+WoltClientLifecycle = lifecycle_module.WoltClientLifecycle
+VenueStatus = models_module.VenueStatus
+
+
+class FakeClient:
+    """Client recording its lifecycle calls."""
+
+    def __init__(self):
+        """Start with no calls."""
+        self.calls = []
+
+    async def async_warm_up(self):
+        """Record the warm-up."""
+        self.calls.append("warm_up")
+
+    async def async_get_status(self, slug):
+        """Return a closed venue."""
+        self.calls.append(slug)
+        return VenueStatus(slug, False)
+
+    async def async_close(self):
+        """Record the close."""
+        self.calls.append("close")
+
+
+def test_client_is_built_once_and_shared():
+    """Requests wait for one background build, then reuse the client."""
+    client = FakeClient()
+    builds = []
+
+    async def factory():
+        builds.append(1)
+        await asyncio.sleep(0.01)
+        return client
+
+    async def run():
+        lifecycle = WoltClientLifecycle(factory, warm_up=True)
+        lifecycle.start(asyncio.ensure_future)
+        lifecycle.start(asyncio.ensure_future)
+        await asyncio.gather(
+            lifecycle.async_get_status("a"), lifecycle.async_get_status("b")
+        )
+        timings = lifecycle.as_dict()
+        await lifecycle.async_close()
+        return timings
+
+    timings = asyncio.run(run())
+    assert builds == [1]
+    assert client.calls == ["warm_up", "a", "b", "close"]
+    assert timings["ready"] is True
+    assert timings["client_ready_s"] <= timings["time_to_first_poll_s"]
+
+
+def test_failed_build_rejects_requests():
+    """A factory error leaves the lifecycle unusable instead of raising at setup."""
+
+    async def factory():
+        raise exceptions_module.WoltWatchConfigurationError("no SDK")
+
+    async def run():
+        lifecycle = WoltClientLifecycle(factory)
+        lifecycle.start(asyncio.ensure_future)
+        assert not await lifecycle.async_ready()
+        with pytest.raises(exceptions_module.WoltWatchConfigurationError):
+            await lifecycle.async_get_status("a")
+        await lifecycle.async_close()
+
+    asyncio.run(run())
+
+
+def test_close_cancels_pending_build():
+    """Closing during the build cancels it and releases waiters."""
+
+    async def factory():
+        await asyncio.sleep(10)
+
+    async def run():
+        lifecycle = WoltClientLifecycle(factory)
+        lifecycle.start(asyncio.ensure_future)
+        waiter = asyncio.ensure_future(lifecycle.async_ready())
+        await asyncio.sleep(0)
+        await lifecycle.async_close()
+        return await waiter
+
+    assert asyncio.run(run()) is False
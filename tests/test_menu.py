@@ -0,0 +1,80 @@
+"""Test menu parsing and change detection."""
+from __future__ import annotations
+
+import copy
+import importlib
+
+api_module = importlib.import_module("wolt_watch.api")
+menu_module = importlib.import_module("wolt_watch.menu")
+models_module = importlib.import_module("wolt_watch.models")
+menu_from_payload = api_module.menu_from_payload
+menu_alerts = menu_module.menu_alerts
+menu_changes = menu_module.menu_changes
+
+PAYLOAD = {
+    "categories": [
+        {"id": "mains", "name": [{"lang": "en", "value": "Mains"}]},
+        {"id": "drinks", "name": "Drinks"},
+    ],
+    "items": [
+        {"id": "1", "category": "mains", "name": "Pad Thai", "baseprice": 5200,
+         "disabled_info": {"disable_reason": "sold_out"}},
+        {"id": "2", "category": "mains", "name": "Green Curry", "baseprice": 5600},
+        {"id": "3", "category": "drinks", "name": "Thai Iced Tea", "baseprice": 1800},
+    ],
+}
+
+
+def test_menu_is_grouped_into_sections():
+    """Test that items are parsed per category with availability and price."""
+    menu = menu_from_payload("taizu", PAYLOAD)
+
+    assert {section.name for section in menu.sections.values()} == {"Mains", "Drinks"}
+    items = {item.name: item for item in menu.items()}
+    assert items["Pad Thai"].available is False
+    assert items["Green Curry"].available is True
+    assert items["Thai Iced Tea"].price == 1800
+
+
+def test_unchanged_sections_are_reused():
+    """Test that only sections whose content changed are rebuilt and diffed."""
+    old = menu_from_payload("taizu", PAYLOAD)
+    payload = copy.deepcopy(PAYLOAD)
+    del payload["items"][0]["disabled_info"]
+    payload["items"][1]["baseprice"] = 5900
+    new = menu_from_payload("taizu", payload, old)
+
+    assert new.sections["drinks"] is old.sections["drinks"]
+    assert new.sections["mains"] is not old.sections["mains"]
+    changes = menu_changes(old, new)
+    assert [after.name for _, after in changes] == ["Pad Thai", "Green Curry"]
+    assert menu_changes(new, menu_from_payload("taizu", payload, new)) == []
+
+    assert menu_alerts("Taizu", old, new, changes, items=("pad thai",)) == [
+        "Taizu: Pad Thai is back"
+    ]
+    assert menu_alerts("Taizu", old, new, changes, price_changes=True) == [
+        "Taizu: Green Curry now costs 59.00 (was 56.00)"
+    ]
+    assert menu_alerts("Taizu", old, new, changes, items=("3",), price_changes=True) == []
+
+
+def test_available_item_triggers_on_first_poll():
+    """Test that a watched item that is already available alerts at once."""
+    menu = menu_from_payload("taizu", PAYLOAD)
+
+    assert menu_alerts("Taizu", None, menu, [], items=("green curry",)) == [
+        "Taizu: Green Curry is available"
+    ]
+    assert menu_alerts("Taizu", None, menu, [], items=("pad thai",)) == []
+    assert menu_alerts("Taizu", None, menu, [], price_changes=True) == []
+
+
+def test_eta_alert():
+    """Test the delivery estimate threshold."""
+    status = models_module.VenueStatus("taizu", True, eta_minutes=25)
+
+    assert menu_module.eta_alert("Taizu", status, 30) == "Taizu delivers in about 25 min"
+    assert menu_module.eta_alert("Taizu", status, 20) is None
+    closed = models_module.VenueStatus("taizu", False, eta_minutes=10)
+    assert menu_module.eta_alert("Taizu", closed, 30) is None
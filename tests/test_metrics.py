@@ -0,0 +1,74 @@
+"""Test the hot-path metrics."""
+from __future__ import annotations
+
+import asyncio
+import importlib
+
+import pytest
+
+from .conftest import FakeClock
+
+metrics_module = importlib.import_module("wolt_watch.metrics")
+exceptions_module = importlib.import_module("wolt_watch.exceptions")
+models_module = importlib.import_module("wolt_watch.models")
+Histogram = metrics_module.Histogram
+RateWindow = metrics_module.RateWindow
+Metrics = metrics_module.Metrics
+InstrumentedWoltClient = metrics_module.InstrumentedWoltClient
+VenueStatus = models_module.VenueStatus
+
+
+def test_histogram_quantiles():
+    """Quantiles report the bucket bound, capped at the largest value."""
+    histogram = Histogram((0.1, 1, 10))
+    assert histogram.quantile(0.5) is None
+    for value in (0.05, 0.05, 0.5, 3):
+        histogram.observe(value)
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1
+    assert histogram.quantile(1) == 3
+    histogram.observe(60)
+    assert histogram.quantile(1) == 60
+    summary = histogram.as_dict()
+    assert summary["count"] == 5
+    assert summary["buckets"] == {"le_0.1": 2, "le_1": 3, "le_10": 4, "le_inf": 5}
+
+
+def test_rate_window_slides():
+    """Events older than the window stop counting towards the rate."""
+    clock = FakeClock()
+    window = RateWindow(60, clock=clock)
+    window.add()
+    clock.now = 30
+    window.add(2)
+    assert window.per_minute() == 3
+    clock.now = 61
+    assert window.per_minute() == 2
+    assert window.total == 3
+
+
+def test_instrumented_client_records_calls():
+    """Every upstream call is timed and failures are counted by type."""
+    clock = FakeClock()
+    metrics = Metrics(clock=clock)
+
+    class Client:
+        async def async_get_status(self, slug):
+            clock.now += 0.2
+            if slug == "broken":
+                raise exceptions_module.WoltWatchServerError("boom")
+            return VenueStatus(slug, True)
+
+    client = InstrumentedWoltClient(Client(), metrics, clock=clock)
+
+    async def run():
+        await client.async_get_status("taizu")
+        with pytest.raises(exceptions_module.WoltWatchServerError):
+            await client.async_get_status("broken")
+
+    asyncio.run(run())
+    report = metrics.as_dict()
+    assert report["upstream"]["calls_total"] == 2
+    assert report["upstream"]["calls_by_endpoint"] == {"status": 2}
+    assert report["upstream"]["errors"] == {"WoltWatchServerError": 1}
+    assert report["upstream"]["latency_s"]["p50"] == 0.2
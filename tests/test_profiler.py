@@ -0,0 +1,59 @@
+"""Test the on-demand event loop profiler."""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import pstats
+import time
+from pathlib import Path
+
+import pytest
+
+profiler_module = importlib.import_module("wolt_watch.profiler")
+exceptions_module = importlib.import_module("wolt_watch.exceptions")
+EngineProfiler = profiler_module.EngineProfiler
+
+
+async def _blocking_poll():
+    """Hold the event loop the way a synchronous call would."""
+    await asyncio.sleep(0.05)
+    time.sleep(0.2)
+
+
+def test_profile_finds_the_blocking_coroutine(tmp_path):
+    """Test that a loop-blocking coroutine is reported and files are written."""
+    profiler = EngineProfiler(interval=0.005, block_threshold=0.05)
+
+    async def run():
+        task = asyncio.ensure_future(_blocking_poll())
+        report = await profiler.async_profile(0.4, tmp_path)
+        await task
+        return report
+
+    report = asyncio.run(run())
+
+    assert report["loop"]["blocks"] == 1
+    assert report["loop"]["max_lag_ms"] >= 100
+    assert max(report["coroutines"], key=report["coroutines"].get) == "_blocking_poll"
+    assert report["blocking"][0]["stack"][-1].startswith("_blocking_poll")
+    assert any(
+        function["function"].startswith("async_profile")
+        for function in report["functions"]
+    )
+    assert pstats.Stats(report["pstats"]).total_calls > 0
+    assert "_blocking_poll" in Path(report["flamegraph"]).read_text(encoding="utf-8")
+    assert not profiler.running
+
+
+def test_one_profile_at_a_time(tmp_path):
+    """Test that a second profile is refused while one runs."""
+    profiler = EngineProfiler()
+
+    async def run():
+        first = asyncio.ensure_future(profiler.async_profile(0.05, tmp_path))
+        await asyncio.sleep(0)
+        with pytest.raises(exceptions_module.WoltWatchProfileError):
+            await profiler.async_profile(0.05, tmp_path)
+        await first
+
+    asyncio.run(run())
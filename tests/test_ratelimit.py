@@ -0,0 +1,68 @@
+"""Test the shared request budget and backoff."""
+from __future__ import annotations
+
+import asyncio
+import importlib
+
+import pytest
+
+from .conftest import FakeClock
+
+ratelimit_module = importlib.import_module("wolt_watch.ratelimit")
+exceptions_module = importlib.import_module("wolt_watch.exceptions")
+models_module = importlib.import_module("wolt_watch.models")
+Backoff = ratelimit_module.Backoff
+RateLimitedWoltClient = ratelimit_module.RateLimitedWoltClient
+TokenBucket = ratelimit_module.TokenBucket
+
+
+def test_bucket_allows_burst_then_refills():
+    """Test that the bucket spends its burst and refills at its rate."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, capacity=3, clock=clock)
+
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+    assert bucket.time_until_available() == pytest.approx(1)
+    clock.now = 1
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+
+def test_pause_holds_back_every_request():
+    """Test that a pause blocks acquisition until it ends."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, capacity=10, clock=clock)
+    bucket.pause(30)
+
+    assert not bucket.try_acquire()
+    assert bucket.tokens == 0
+    assert bucket.time_until_available() == pytest.approx(30)
+    clock.now = 30
+    assert bucket.tokens == 10
+    assert bucket.try_acquire()
+
+
+def test_backoff_grows_exponentially_and_honours_retry_after():
+    """Test the backoff ceiling doubles per failure and respects the cap."""
+    backoff = Backoff(base=10, cap=100)
+
+    for failures, ceiling in ((1, 10), (2, 20), (3, 40), (10, 100)):
+        delay = backoff.delay(failures)
+        assert ceiling / 2 <= delay <= ceiling
+    assert backoff.delay(1, retry_after=300) == 300
+
+
+def test_rate_limit_response_pauses_shared_bucket():
+    """Test that a 429 on one request holds back all requests."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=100, capacity=100, clock=clock)
+
+    class ThrottledClient:
+        async def async_get_status(self, slug):
+            raise exceptions_module.WoltWatchRateLimitError("429", retry_after=60)
+
+    client = RateLimitedWoltClient(ThrottledClient(), bucket, Backoff(base=1))
+
+    with pytest.raises(exceptions_module.WoltWatchRateLimitError):
+        asyncio.run(client.async_get_status("taizu"))
+    assert bucket.time_until_available() == pytest.approx(60)
@@ -0,0 +1,310 @@
+"""Test the deadline-ordered watch scheduler."""
+from __future__ import annotations
+
+import asyncio
+import importlib
+
+import pytest
+
+scheduler_module = importlib.import_module("wolt_watch.scheduler")
+WatchScheduler = scheduler_module.WatchScheduler
+
+
+def test_polls_run_in_deadline_order():
+    """Test that polls fire in order of their due time."""
+    order = []
+
+    async def poll(batch):
+        order.extend(batch)
+        return {}
+
+    async def run():
+        scheduler = WatchScheduler(poll, lambda key: None, workers=1)
+        scheduler.schedule_poll("late", 0.05, jitter=False)
+        scheduler.schedule_poll("early", 0.01, jitter=False)
+        scheduler.schedule_poll("now", 0, jitter=False)
+        scheduler.start(asyncio.ensure_future)
+        await asyncio.sleep(0.1)
+        await scheduler.async_stop()
+
+    asyncio.run(run())
+
+    assert order == ["now", "early", "late"]
+
+
+def test_poll_reschedules_with_returned_delay():
+    """Test that the returned delay schedules the next poll."""
+    calls = []
+
+    async def poll(batch):
+        calls.extend(batch)
+        return {"taizu": 0.01 if len(calls) < 3 else None}
+
+    async def run():
+        scheduler = WatchScheduler(poll, lambda key: None)
+        scheduler.start(asyncio.ensure_future)
+        scheduler.schedule_poll("taizu", 0)
+        await asyncio.sleep(0.1)
+        assert len(scheduler) == 0
+        await scheduler.async_stop()
+
+    asyncio.run(run())
+
+    assert calls == ["taizu"] * 3
+
+
+def test_expiry_fires_and_cancel_prevents_it():
+    """Test that expiries fire at their deadline unless cancelled."""
+    expired = []
+
+    async def poll(batch):
+        return {}
+
+    async def run():
+        scheduler = WatchScheduler(poll, expired.append)
+        scheduler.start(asyncio.ensure_future)
+        now = scheduler_module.time.monotonic()
+        scheduler.schedule_expiry("a", now + 0.01)
+        scheduler.schedule_expiry("b", now + 0.01)
+        scheduler.cancel_expiry("b")
+        await asyncio.sleep(0.05)
+        await scheduler.async_stop()
+
+    asyncio.run(run())
+
+    assert expired == ["a"]
+
+
+def test_task_count_is_constant():
+    """Test that thousands of watches do not add tasks."""
+
+    async def poll(batch):
+        return {}
+
+    async def run():
+        scheduler = WatchScheduler(poll, lambda key: None, workers=4)
+        scheduler.start(asyncio.ensure_future)
+        tasks_before = len(asyncio.all_tasks())
+        now = scheduler_module.time.monotonic()
+        for i in range(5000):
+            scheduler.schedule_poll(f"venue-{i}", 3600)
+            scheduler.schedule_expiry(f"watch-{i}", now + 3600)
+        await asyncio.sleep(0)
+        assert len(asyncio.all_tasks()) == tasks_before
+        assert scheduler.task_count == 5
+        assert len(scheduler) == 10000
+        await scheduler.async_stop()
+
+    asyncio.run(run())
+
+
+def test_jitter_spreads_polls():
+    """Test that jitter keeps equal delays from landing together."""
+
+    async def poll(batch):
+        return {}
+
+    async def run():
+        scheduler = WatchScheduler(poll, lambda key: None, jitter=0.1)
+        for i in range(50):
+            scheduler.schedule_poll(f"venue-{i}", 60)
+        # pylint: disable-next=protected-access
+        dues = [entry[0] for entry in scheduler._heap]
+        assert max(dues) - min(dues) > 1
+
+    asyncio.run(run())
+
+
+def test_jitter_never_exceeds_the_maximum_interval(monkeypatch):
+    """Test that upward jitter is clipped for capped delays but not backoff."""
+    monkeypatch.setattr(scheduler_module.random, "uniform", lambda low, high: high)
+
+    async def poll(batch):
+        return {}
+
+    async def run():
+        scheduler = WatchScheduler(
+            poll, lambda key: None, clock=lambda: 0.0, jitter=0.1, max_interval=1800
+        )
+        scheduler.schedule_poll("capped", 1800)
+        scheduler.schedule_poll("short", 60)
+        scheduler.schedule_poll("backoff", 3600)
+        # pylint: disable-next=protected-access
+        return {entry[3]: entry[0] for entry in scheduler._heap}
+
+    dues = asyncio.run(run())
+
+    assert dues["capped"] == 1800
+    assert dues["short"] == pytest.approx(66)
+    assert dues["backoff"] == pytest.approx(3960)
+
+
+def test_due_polls_are_dispatched_as_one_batch():
+    """Test that polls due together reach the callback in a single call."""
+    batches = []
+
+    async def poll(batch):
+        batches.append(sorted(batch))
+        return {}
+
+    async def run():
+        scheduler = WatchScheduler(poll, lambda key: None)
+        for slug in ("a", "b", "c"):
+            scheduler.schedule_poll(slug, 0)
+        scheduler.start(asyncio.ensure_future)
+        await asyncio.sleep(0.01)
+        await scheduler.async_stop()
+
+    asyncio.run(run())
+
+    assert batches == [["a", "b", "c"]]
+
+
+class FakeBudget:
+    """Request budget with a fixed number of tokens."""
+
+    def __init__(self, tokens: float, rate: float) -> None:
+        """Initialize the budget."""
+        self.tokens = tokens
+        self.rate = rate
+
+
+def test_short_budget_runs_highest_priority_polls_first():
+    """Test that polls beyond the budget are deferred in priority order."""
+    batches = []
+    shed = []
+    priority = {"a": 1, "b": 5, "c": 3, "d": 4, "e": 2}
+
+    async def poll(batch):
+        batches.append(batch)
+        return {}
+
+    async def run():
+        scheduler = WatchScheduler(
+            poll,
+            lambda key: None,
+            workers=1,
+            budget=FakeBudget(2, 100),
+            priority=priority.__getitem__,
+        )
+        scheduler.on_shed = shed.append
+        for key in priority:
+            scheduler.schedule_poll(key, 0, jitter=False)
+        scheduler.start(asyncio.ensure_future)
+        await asyncio.sleep(0.1)
+        await scheduler.async_stop()
+
+    asyncio.run(run())
+
+    assert batches[0] == ["b", "d"]
+    assert [key for batch in batches for key in batch] == ["b", "d", "c", "e", "a"]
+    assert shed[0] == 3
+
+
+def test_paused_budget_sheds_every_poll():
+    """Test that a Retry-After pause sheds polls instead of queueing them."""
+    ratelimit_module = importlib.import_module("wolt_watch.ratelimit")
+    polled = []
+    shed = []
+
+    async def poll(batch):
+        polled.extend(batch)
+        return {}
+
+    async def run():
+        bucket = ratelimit_module.TokenBucket(rate=100, capacity=10)
+        bucket.pause(60)
+        scheduler = WatchScheduler(
+            poll, lambda key: None, budget=bucket, priority=lambda key: 0
+        )
+        scheduler.on_shed = shed.append
+        for key in ("a", "b", "c"):
+            scheduler.schedule_poll(key, 0, jitter=False)
+        scheduler.start(asyncio.ensure_future)
+        await asyncio.sleep(0.02)
+        await scheduler.async_stop()
+
+    asyncio.run(run())
+
+    assert polled == []
+    assert shed[0] == 3
+
+
+def test_shed_polls_still_run_within_the_maximum_interval():
+    """Test that an empty budget cannot delay a poll past the maximum interval."""
+    polled = []
+
+    async def poll(batch):
+        polled.extend(batch)
+        return {}
+
+    async def run():
+        scheduler = WatchScheduler(
+            poll,
+            lambda key: None,
+            budget=FakeBudget(0, 0.001),
+            priority=lambda key: 0,
+            max_interval=0.02,
+        )
+        scheduler.schedule_poll("taizu", 0, jitter=False)
+        scheduler.start(asyncio.ensure_future)
+        await asyncio.sleep(0.01)
+        assert polled == []
+        await asyncio.sleep(0.05)
+        await scheduler.async_stop()
+
+    asyncio.run(run())
+
+    assert polled == ["taizu"]
+
+
+def test_failed_batch_is_retried():
+    """Test that a poll callback that raises does not drop its slugs."""
+    batches = []
+
+    async def poll(batch):
+        batches.append(batch)
+        if len(batches) == 1:
+            raise RuntimeError("bug")
+        return {}
+
+    async def run():
+        scheduler = WatchScheduler(poll, lambda key: None, retry_delay=0.01)
+        scheduler.schedule_poll("taizu", 0, jitter=False)
+        scheduler.start(asyncio.ensure_future)
+        await asyncio.sleep(0.05)
+        await scheduler.async_stop()
+
+    asyncio.run(run())
+
+    assert batches == [["taizu"], ["taizu"]]
+
+
+def test_runner_survives_a_failing_priority():
+    """Test that an error while shedding neither kills the runner nor loses polls."""
+    polled = []
+
+    async def poll(batch):
+        polled.extend(batch)
+        return {}
+
+    def priority(key):
+        raise KeyError(key)
+
+    async def run():
+        scheduler = WatchScheduler(
+            poll, lambda key: None, budget=FakeBudget(0, 1), priority=priority
+        )
+        scheduler.schedule_poll("a", 0, jitter=False)
+        scheduler.schedule_poll("b", 0, jitter=False)
+        scheduler.start(asyncio.ensure_future)
+        await asyncio.sleep(0.02)
+        scheduler.schedule_poll("c", 0, jitter=False)
+        await asyncio.sleep(0.02)
+        # pylint: disable-next=protected-access
+        runner_alive = not scheduler._tasks[0].done()
+        await scheduler.async_stop()
+        return runner_alive
+
+    assert asyncio.run(run())
+    assert sorted(polled) == ["a", "b", "c"]
@@ -0,0 +1,127 @@
+"""Test the local venue index."""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import time
+
+index_module = importlib.import_module("wolt_watch.venue_index")
+models_module = importlib.import_module("wolt_watch.models")
+VenueIndex = index_module.VenueIndex
+IndexingWoltClient = index_module.IndexingWoltClient
+VenueStatus = models_module.VenueStatus
+
+
+def _slugs(results):
+    """Return the slugs of search results."""
+    return [venue["slug"] for venue in results]
+
+
+def test_search_matches_word_prefixes():
+    """Test that any word of the slug or name matches as a prefix."""
+    index = VenueIndex()
+    index.add("mcdonalds-dizengoff", "McDonald's Dizengoff")
+    index.add("taizu", "Taizu")
+    index.add("tamara-dizengoff", "Tamara")
+
+    assert _slugs(index.search("dizen")) == ["mcdonalds-dizengoff", "tamara-dizengoff"]
+    assert _slugs(index.search("ta")) == ["taizu", "tamara-dizengoff"]
+    assert _slugs(index.search("tam diz")) == ["tamara-dizengoff"]
+    assert _slugs(index.search("mcdonalds-d")) == ["mcdonalds-dizengoff"]
+    assert index.search("   ") == []
+    assert index.search("sushi") == []
+
+
+def test_renamed_and_evicted_venues():
+    """Test that renames drop old words and the oldest venues are evicted."""
+    changes = []
+    index = VenueIndex(max_size=2)
+    index.on_change = lambda: changes.append(1)
+    index.add_many([VenueStatus("a", True, name="Falafel")])
+    index.add_many([VenueStatus("a", True, name="Falafel")])
+    index.add_many([VenueStatus("a", True, name="Hummus")])
+    assert changes == [1, 1]
+    assert index.search("fal") == []
+    assert _slugs(index.search("hum")) == ["a"]
+
+    index.add("b", "Burger")
+    index.add("a", "Hummus")  # Seen again, so "b" is now the oldest
+    index.add("c", "Pizza")
+    assert len(index) == 2
+    assert index.search("burg") == []
+
+
+def test_churn_does_not_grow_the_trie():
+    """Test that evicted and renamed venues leave no empty nodes behind."""
+
+    def nodes(index):
+        # pylint: disable-next=protected-access
+        stack, count = [index._root], 0
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(node.children.values())
+        return count
+
+    index = VenueIndex(max_size=10)
+    for i in range(2000):
+        index.add(f"venue-{i}", f"Place {i} Number {i * 7919}")
+        index.add(f"venue-{i}", f"Renamed {i}")
+    fresh = VenueIndex(max_size=10)
+    for slug in list(index._names):  # pylint: disable=protected-access
+        fresh.add(slug, index._names[slug])  # pylint: disable=protected-access
+
+    assert len(index) == 10
+    assert nodes(index) == nodes(fresh)
+    assert index._root.size == fresh._root.size  # pylint: disable=protected-access
+    assert _slugs(index.search("renamed 1999")) == ["venue-1999"]
+
+
+def test_round_trip_through_storage():
+    """Test that a saved index restores the same venues."""
+    index = VenueIndex()
+    index.add("taizu", "Taizu")
+    index.add("miznon", "מיזנון")
+
+    restored = VenueIndex()
+    restored.restore(index.as_dict())
+
+    assert _slugs(restored.search("מיז")) == ["miznon"]
+    assert _slugs(restored.search("tai")) == ["taizu"]
+
+
+def test_client_learns_venues_from_results():
+    """Test that statuses flowing through the client are indexed."""
+
+    class Client:
+        async def async_get_status(self, slug):
+            return VenueStatus(slug, False, name="Taizu")
+
+        async def async_get_nearby(self, latitude, longitude):
+            return [VenueStatus("miznon", True, name="Miznon"), VenueStatus("x", True)]
+
+    index = VenueIndex()
+    client = IndexingWoltClient(Client(), index)
+
+    async def run():
+        await client.async_get_status("taizu")
+        await client.async_get_nearby(32.08, 34.78)
+
+    asyncio.run(run())
+
+    assert len(index) == 2
+    assert _slugs(index.search("m")) == ["miznon"]
+
+
+def test_search_is_fast_over_thousands_of_venues():
+    """Test that a lookup over 10,000 venues stays in the millisecond range."""
+    index = VenueIndex()
+    for number in range(10000):
+        index.add(f"venue-{number}", f"Restaurant {number}")
+
+    started = time.perf_counter()
+    results = index.search("venue-123")
+    elapsed = time.perf_counter() - started
+
+    assert _slugs(results)[0] == "venue-123"
+    assert elapsed < 0.05
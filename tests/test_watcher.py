@@ -0,0 +1,744 @@
+"""Test the shared per-slug watch manager."""
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+import importlib
+
+watcher_module = importlib.import_module("wolt_watch.watcher")
+models_module = importlib.import_module("wolt_watch.models")
+history_module = importlib.import_module("wolt_watch.history")
+WatchManager = watcher_module.WatchManager
+VenueStatus = models_module.VenueStatus
+
+
+def _per_slug(check):
+    """Adapt a per-slug check into a batch resolver."""
+
+    async def resolve(due, watched):
+        results = {}
+        for slug in due:
+            try:
+                results[slug] = VenueStatus(slug, await check(slug))
+            except Exception as err:  # pylint: disable=broad-except
+                results[slug] = err
+        return results
+
+    return resolve
+
+
+def _make_manager(results, calls, notified, **kwargs):
+    """Build a manager whose checks pop from a list of results."""
+
+    async def check(slug):
+        calls.append(slug)
+        return results.pop(0) if results else False
+
+    async def notify(watch):
+        notified.append((watch.slug, watch.device))
+
+    return WatchManager(
+        _per_slug(check),
+        notify,
+        asyncio.ensure_future,
+        scan_interval=0.01,
+        backoff_interval=0.01,
+        **kwargs,
+    )
+
+
+def test_watches_on_same_slug_share_one_poller():
+    """Test that five watches on one slug make one call per cycle."""
+    calls, notified = [], []
+
+    async def run():
+        manager = _make_manager([False, True], calls, notified)
+        for i in range(5):
+            manager.async_start("taizu", f"notify.phone_{i}", 60)
+        assert manager.polled_slugs == {"taizu"}
+        await asyncio.sleep(0.1)
+        return manager
+
+    manager = asyncio.run(run())
+
+    assert calls == ["taizu", "taizu"]
+    assert sorted(notified) == [("taizu", f"notify.phone_{i}") for i in range(5)]
+    assert manager.watches == []
+    assert manager.polled_slugs == set()
+    assert manager.metrics.scheduler_lag.count == 2
+
+
+def test_distinct_slugs_get_separate_pollers():
+    """Test that each distinct venue gets its own poll loop."""
+    calls, notified = [], []
+
+    async def run():
+        manager = _make_manager([], calls, notified)
+        manager.async_start("taizu", "notify.a", 60)
+        manager.async_start("taizu", "notify.b", 60)
+        manager.async_start("mcdonalds-dizengoff", "notify.a", 60)
+        assert manager.polled_slugs == {"taizu", "mcdonalds-dizengoff"}
+        await manager.async_stop()
+
+    asyncio.run(run())
+
+
+def test_poller_stops_when_last_subscriber_times_out():
+    """Test that the loop ends as soon as every subscriber expired."""
+    calls, notified = [], []
+
+    async def run():
+        manager = _make_manager([], calls, notified)
+        manager._scan_interval = 60  # pylint: disable=protected-access
+        manager.async_start("taizu", "notify.a", 0.02)
+        manager.async_start("taizu", "notify.b", 0.05)
+        await asyncio.sleep(0.2)
+        return manager
+
+    manager = asyncio.run(run())
+
+    assert calls == ["taizu"]
+    assert notified == []
+    assert manager.polled_slugs == set()
+
+
+def test_failed_check_backs_off_and_retries():
+    """Test that an API error does not end the watch."""
+    notified = []
+    attempts = []
+
+    async def check(slug):
+        attempts.append(slug)
+        if len(attempts) == 1:
+            raise ConnectionError("boom")
+        return True
+
+    async def notify(watch):
+        notified.append(watch.device)
+
+    async def run():
+        manager = WatchManager(
+            _per_slug(check),
+            notify,
+            asyncio.ensure_future,
+            scan_interval=0.01,
+            backoff_interval=0.01,
+        )
+        manager.async_start("taizu", "notify.a", 60)
+        await asyncio.sleep(0.1)
+
+    asyncio.run(run())
+
+    assert len(attempts) == 2
+    assert notified == ["notify.a"]
+
+
+def test_maximum_interval_caps_cadence_but_not_backoff():
+    """Test that a Retry-After wait outlasts the maximum poll interval."""
+    exceptions_module = importlib.import_module("wolt_watch.exceptions")
+    failing = [True]
+
+    async def check(slug):
+        if failing[0]:
+            raise exceptions_module.WoltWatchRateLimitError("slow down", 120)
+        return False
+
+    async def notify(watch):
+        pass
+
+    async def run():
+        manager = WatchManager(
+            _per_slug(check),
+            notify,
+            asyncio.ensure_future,
+            scan_interval=600,
+            backoff_interval=0.01,
+            max_interval=60,
+        )
+        manager.async_start("taizu", "notify.a", 3600)
+        # pylint: disable=protected-access
+        backoff = (await manager._async_poll_open(["taizu"]))["taizu"]
+        failing[0] = False
+        cadence = (await manager._async_poll_open(["taizu"]))["taizu"]
+        await manager.async_stop()
+        return backoff, cadence
+
+    backoff, cadence = asyncio.run(run())
+
+    assert backoff >= 120
+    assert cadence == 60
+
+
+def test_batch_results_refresh_other_watched_slugs():
+    """Test that slugs resolved for free are fanned out and rescheduled."""
+    notified = []
+    batches = []
+
+    async def resolve(due, watched):
+        batches.append(sorted(due))
+        return {slug: VenueStatus(slug, slug == "b") for slug in watched}
+
+    async def notify(watch):
+        notified.append(watch.slug)
+
+    async def run():
+        manager = WatchManager(
+            resolve, notify, asyncio.ensure_future, scan_interval=60
+        )
+        manager.async_start("a", "notify.x", 60)
+        await asyncio.sleep(0.01)
+        manager.async_start("b", "notify.x", 60)
+        await asyncio.sleep(0.01)
+        await manager.async_stop()
+
+    asyncio.run(run())
+
+    assert batches == [["a"], ["b"]]
+    assert notified == ["b"]
+
+
+def test_watches_round_trip_through_storage():
+    """Test that restored watches keep their original wall-clock deadlines."""
+    changes = []
+
+    async def resolve(due, watched):
+        return {}
+
+    async def notify(watch):
+        pass
+
+    async def run():
+        manager = WatchManager(
+            resolve, notify, asyncio.ensure_future, wall_clock=lambda: 1000.0
+        )
+        manager.on_change = lambda: changes.append(True)
+        watch = manager.async_start("taizu", "notify.a", 600)
+        data = manager.as_dict()
+        await manager.async_stop()
+
+        restored_manager = WatchManager(
+            resolve,
+            notify,
+            asyncio.ensure_future,
+            scan_interval=60,
+            wall_clock=lambda: 1100.0,
+        )
+        data["watches"].append(
+            {"watch_id": "old", "slug": "gone", "device": "notify.b", "deadline": 1050.0}
+        )
+        assert restored_manager.async_restore(data) == 1
+        [restored] = restored_manager.watches
+        remaining = restored.deadline - watcher_module.time.monotonic()
+        await restored_manager.async_stop()
+        return watch, restored, remaining
+
+    watch, restored, remaining = asyncio.run(run())
+
+    assert changes == [True]
+    assert restored.watch_id == watch.watch_id
+    assert (restored.slug, restored.device) == ("taizu", "notify.a")
+    assert 490 < remaining <= 500
+
+
+def test_restored_first_polls_are_spread_out():
+    """Test that a restart does not poll every venue at once."""
+
+    async def resolve(due, watched):
+        return {}
+
+    async def notify(watch):
+        pass
+
+    async def run():
+        manager = WatchManager(
+            resolve, notify, asyncio.ensure_future, scan_interval=60
+        )
+        data = {
+            "watches": [
+                {
+                    "watch_id": str(i),
+                    "slug": f"venue-{i}",
+                    "device": "notify.a",
+                    "deadline": watcher_module.time.time() + 3600,
+                }
+                for i in range(50)
+            ]
+        }
+        manager.async_restore(data)
+        # pylint: disable-next=protected-access
+        dues = sorted(entry[0] for entry in manager.scheduler._heap if entry[2] == 0)
+        await manager.async_stop()
+        return dues
+
+    dues = asyncio.run(run())
+
+    assert len(dues) == 50
+    assert dues[-1] - dues[0] > 30
+
+
+def test_unknown_slug_ends_watches_at_once():
+    """Test that a permanent error stops the watch instead of retrying."""
+    exceptions_module = importlib.import_module("wolt_watch.exceptions")
+    calls = []
+
+    async def check(slug):
+        calls.append(slug)
+        raise exceptions_module.WoltWatchNotFoundError("Unknown Wolt venue")
+
+    async def notify(watch):
+        pass
+
+    async def run():
+        manager = WatchManager(
+            _per_slug(check),
+            notify,
+            asyncio.ensure_future,
+            scan_interval=0.01,
+            backoff_interval=0.01,
+        )
+        manager.async_start("tiazu", "notify.a", 60)
+        manager.async_start("tiazu", "notify.b", 60)
+        await asyncio.sleep(0.05)
+        return manager
+
+    manager = asyncio.run(run())
+
+    assert calls == ["tiazu"]
+    assert manager.watches == []
+
+
+def test_duplicate_start_reuses_the_watch():
+    """Test that the same slug and device share one watch with the later deadline."""
+    calls, notified = [], []
+
+    async def run():
+        manager = _make_manager([], calls, notified, clock=lambda: 100.0)
+        first = manager.async_start("taizu", "notify.a", 60)
+        second = manager.async_start("taizu", "notify.a", 600)
+        third = manager.async_start("taizu", "notify.a", 30)
+        await manager.async_stop()
+        return manager, first, second, third
+
+    manager, first, second, third = asyncio.run(run())
+
+    assert first is second is third
+    assert first.deadline == 700
+    assert len(manager.watches) == 1
+    assert manager.stats()["watches"] == 1
+
+
+def test_cancel_and_extend_by_id():
+    """Test that watches can be looked up, extended and cancelled."""
+    calls, notified = [], []
+
+    async def run():
+        manager = _make_manager([], calls, notified, clock=lambda: 0.0)
+        a = manager.async_start("taizu", "notify.a", 60)
+        b = manager.async_start("taizu", "notify.b", 60)
+        c = manager.async_start("miznon", "notify.a", 60)
+        assert manager.find(device="notify.a") == [a, c]
+        assert manager.find(slug="taizu", device="notify.b") == [b]
+
+        assert manager.async_extend(a.watch_id, 120) is a
+        assert manager.remaining(a) == 180
+        assert manager.async_cancel(b.watch_id) is b
+        assert manager.async_cancel(b.watch_id) is None
+        assert manager.async_cancel(c.watch_id) is c
+        stats = manager.stats()
+        await manager.async_stop()
+        return manager, stats
+
+    manager, stats = asyncio.run(run())
+
+    assert [watch.device for watch in manager.watches] == ["notify.a"]
+    assert manager.polled_slugs == {"taizu"}
+    assert manager.find(device="notify.b") == []
+    assert stats["devices"] == 1
+    assert stats["venues"] == 1
+    assert stats["memory_bytes"] > 0
+    assert notified == []
+
+
+def test_start_many_dedupes_and_polls_as_one_batch():
+    """Test that a group start drops duplicates and polls its venues together."""
+    batches = []
+
+    async def resolve(due, watched):
+        batches.append(sorted(due))
+        return {slug: VenueStatus(slug, False) for slug in due}
+
+    async def notify(watch):
+        pass
+
+    async def run():
+        manager = WatchManager(
+            resolve, notify, asyncio.ensure_future, scan_interval=60
+        )
+        changes = []
+        manager.on_change = lambda: changes.append(1)
+        watches = manager.async_start_many(
+            [("a", "notify.x"), ("b", "notify.x"), ("a", "notify.x"), ("c", "notify.y")],
+            60,
+        )
+        await asyncio.sleep(0.05)
+        await manager.async_stop()
+        return watches, changes
+
+    watches, changes = asyncio.run(run())
+
+    assert [(watch.slug, watch.device) for watch in watches] == [
+        ("a", "notify.x"),
+        ("b", "notify.x"),
+        ("c", "notify.y"),
+    ]
+    assert batches == [["a", "b", "c"]]
+    assert changes == [1]
+
+
+def test_subscribers_receive_watch_diffs():
+    """Test the snapshot, add, back-off, update and removal events."""
+    exceptions_module = importlib.import_module("wolt_watch.exceptions")
+    results = [exceptions_module.WoltWatchServerError("down"), False, True]
+    events = []
+
+    async def check(slug):
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def notify(watch):
+        pass
+
+    async def run():
+        manager = WatchManager(
+            _per_slug(check),
+            notify,
+            asyncio.ensure_future,
+            scan_interval=0.01,
+            backoff_interval=0.01,
+        )
+        existing = manager.async_start("miznon", "notify.a", 60)
+        unsubscribe = manager.async_subscribe(events.append)
+        watch = manager.async_start("taizu", "notify.a", 60)
+        manager.async_extend(watch.watch_id, 60)
+        manager.async_cancel(existing.watch_id)
+        await asyncio.sleep(0.1)
+        unsubscribe()
+        manager.async_start("vitrina", "notify.a", 60)
+        await manager.async_stop()
+        return watch
+
+    watch = asyncio.run(run())
+
+    kinds = [event["event"] for event in events]
+    assert kinds[:4] == ["snapshot", "added", "updated", "removed"]
+    assert [item["slug"] for item in events[0]["watches"]] == ["miznon"]
+    assert events[3]["reason"] == "cancelled"
+    venue_states = [event["state"] for event in events if event["event"] == "venue"]
+    assert venue_states == ["backing_off", "polling"]
+    assert events[-1] == {
+        "event": "removed",
+        "watch_id": watch.watch_id,
+        "reason": "opened",
+    }
+    assert "vitrina" not in str(events)
+
+
+def test_menu_watch_alerts_when_an_item_comes_back():
+    """Test that a menu watch polls the menu and ends once its item returns."""
+    api_module = importlib.import_module("wolt_watch.api")
+
+    def payload(sold_out):
+        item = {"id": "1", "category": "mains", "name": "Pad Thai", "baseprice": 5200}
+        if sold_out:
+            item["disabled_info"] = {"disable_reason": "sold_out"}
+        return {"items": [item]}
+
+    payloads = [payload(True), payload(True), payload(False)]
+    fetched, alerts, calls, notified = [], [], [], []
+
+    async def fetch_menu(slug):
+        fetched.append(slug)
+        return api_module.menu_from_payload(slug, payloads.pop(0), None)
+
+    async def alert(watch, texts):
+        alerts.append((watch.device, texts))
+
+    async def run():
+        manager = _make_manager(
+            [False], calls, notified, fetch_menu=fetch_menu, alert=alert
+        )
+        opened = manager.async_start("taizu", "notify.a", 60)
+        watch = manager.async_start_menu("taizu", "notify.a", 60, items=["PAD THAI"])
+        assert manager.find(slug="taizu", device="notify.a") == [opened, watch]
+        assert manager.polled_slugs == {"taizu"}
+        assert manager.stats()["menus"] == 1
+        await asyncio.sleep(0.1)
+        stats = manager.stats()
+        await manager.async_stop()
+        return manager, watch, stats
+
+    manager, watch, stats = asyncio.run(run())
+
+    assert fetched == ["taizu"] * 3
+    assert alerts == [("notify.a", ["Taizu: Pad Thai is back"])]
+    assert watch.items == ("pad thai",)
+    assert stats["menus"] == 0
+    assert [w.kind for w in manager.watches] == ["open"]
+
+
+def test_menu_watch_cancelled_mid_poll_is_not_alerted():
+    """Test that a menu poll in flight drops watches cancelled meanwhile."""
+    api_module = importlib.import_module("wolt_watch.api")
+    item = {"id": "1", "category": "mains", "name": "Pad Thai", "baseprice": 5200}
+    payloads = [{"items": []}, {"items": [item]}]
+    alerts, events, calls, notified = [], [], [], []
+    manager = None
+
+    async def fetch_menu(slug):
+        if len(payloads) == 1:
+            # The last subscriber leaves while the menu is being fetched
+            for watch in manager.find(slug=slug):
+                manager.async_cancel(watch.watch_id)
+        return api_module.menu_from_payload(slug, payloads.pop(0), None)
+
+    async def alert(watch, texts):
+        alerts.append(watch.device)
+
+    async def run():
+        nonlocal manager
+        manager = _make_manager([], calls, notified, fetch_menu=fetch_menu, alert=alert)
+        manager.async_start_menu("taizu", "notify.a", 60, items=["pad thai"])
+        manager.async_subscribe(events.append)
+        await asyncio.sleep(0.1)
+        stats = manager.stats()
+        await manager.async_stop()
+        return stats
+
+    stats = asyncio.run(run())
+
+    assert not payloads
+    assert alerts == []
+    assert [event["reason"] for event in events if event["event"] == "removed"] == [
+        "cancelled"
+    ]
+    assert stats["menus"] == 0
+
+
+def test_menu_watches_round_trip_through_storage():
+    """Test that menu watch conditions survive a restart."""
+    calls, notified = [], []
+
+    async def run():
+        manager = _make_manager([], calls, notified)
+        manager.async_start_menu("taizu", "notify.a", 60, price_changes=True, eta_below=30)
+        data = manager.as_dict()
+        await manager.async_stop()
+
+        restored = _make_manager([], calls, notified)
+        assert restored.async_restore(data) == 1
+        await restored.async_stop()
+        return restored.describe(restored.watches[0])
+
+    description = asyncio.run(run())
+
+    assert description["kind"] == "menu"
+    assert description["price_changes"] is True
+    assert description["eta_below"] == 30
+
+
+def test_priority_favours_expiring_and_changing_venues():
+    """Test that soon-expiring watches and flapping venues rank first."""
+    calls, notified = [], []
+
+    async def run():
+        manager = _make_manager([], calls, notified, clock=lambda: 0.0)
+        manager.async_start("soon", "notify.a", 120)
+        manager.async_start("later", "notify.a", 23 * 3600)
+        manager.async_start("flappy", "notify.b", 23 * 3600)
+        await manager.async_stop()
+        priority = manager._priority  # pylint: disable=protected-access
+        before = priority("flappy")
+        for _ in range(2):
+            manager._record_churn("flappy")  # pylint: disable=protected-access
+        return priority, before
+
+    priority, before = asyncio.run(run())
+
+    assert priority("soon") > priority("later")
+    assert priority("flappy") > before == priority("later")
+    assert priority("gone") == 0
+
+
+def test_slug_with_a_colon_is_polled_as_an_open_watch():
+    """Test that a ":" in a slug is not taken for a watch kind."""
+    calls, notified = [], []
+
+    async def run():
+        manager = _make_manager([False, True], calls, notified)
+        manager.async_start("odd:slug", "notify.a", 60)
+        rank = manager._priority("odd:slug")  # pylint: disable=protected-access
+        await asyncio.sleep(0.1)
+        return rank
+
+    rank = asyncio.run(run())
+
+    assert rank > 0
+    assert calls == ["odd:slug", "odd:slug"]
+    assert notified == [("odd:slug", "notify.a")]
+
+
+def test_learnt_openings_set_the_cadence():
+    """Test that openings are recorded and drive polling without hours."""
+    calls, notified = [], []
+    monday = datetime(2026, 10, 19, 12, tzinfo=UTC)
+    history = history_module.OpeningHistory()
+    for weeks in (1, 2):
+        opened_at = monday + timedelta(hours=6, weeks=-weeks)
+        history.record("venue", True, opened_at.timestamp())
+
+    async def run():
+        manager = _make_manager(
+            [False, True],
+            calls,
+            notified,
+            wall_clock=monday.timestamp,
+            history=history,
+        )
+        manager.async_start("venue", "notify.a", 3600)
+        await manager.async_stop()
+        poll = manager._async_poll_open  # pylint: disable=protected-access
+        return await poll(["venue"]), await poll(["venue"])
+
+    closed, opened = asyncio.run(run())
+
+    # Six hours before the learnt window: sparse, not every scan interval
+    assert closed == {"venue": 5 * 60}
+    assert opened == {}
+    assert notified == [("venue", "notify.a")]
+    assert history.transitions("venue")[-1] == (monday.timestamp(), True)
+
+
+def test_area_watch_reports_only_new_openings():
+    """Test one listing per cycle, a silent first poll and in-radius diffs."""
+    calls, notified, listings, reported = [], [], [], []
+    # Open sets per poll: "far" is ~5 km away, outside the 1 km radius
+    polls = [{"early"}, {"early", "late", "far"}, {"late"}, {"late", "early"}]
+
+    async def fetch_nearby(latitude, longitude):
+        listings.append((latitude, longitude))
+        open_now = polls.pop(0) if polls else set()
+        return [
+            VenueStatus(slug, slug in open_now, 32.08, 34.78, name=slug.title())
+            for slug in ("early", "late")
+        ] + [VenueStatus("far", "far" in open_now, 32.125, 34.78)]
+
+    async def notify_area(watch, names):
+        reported.append((watch.device, names))
+
+    async def run():
+        manager = _make_manager(
+            [], calls, notified, fetch_nearby=fetch_nearby, notify_area=notify_area
+        )
+        watch = manager.async_start_area(32.08, 34.78, 1, "notify.a", 60)
+        shared = manager.async_start_area(32.08, 34.78, 1, "notify.b", 60)
+        assert manager.stats()["areas"] == 1
+        await asyncio.sleep(0.1)
+        await manager.async_stop()
+        return manager, watch, shared
+
+    manager, watch, shared = asyncio.run(run())
+
+    assert calls == []
+    assert len(listings) > 4
+    assert set(listings) == {(32.08, 34.78)}
+    assert watch.slug == shared.slug == "32.0800,34.7800,1"
+    assert reported == [
+        ("notify.a", ["Late"]),
+        ("notify.b", ["Late"]),
+        ("notify.a", ["Early"]),
+        ("notify.b", ["Early"]),
+    ]
+    assert manager.describe(watch)["radius_km"] == 1
+
+
+def test_area_poll_notifies_only_current_watches():
+    """Test that watches cancelled during a listing are not notified."""
+    calls, notified, reported = [], [], []
+    polls = [set(), {"late"}, {"late", "early"}]
+    manager = None
+    watches = []
+
+    async def fetch_nearby(latitude, longitude):
+        if len(polls) < 3:
+            # One subscriber leaves during each listing after the first
+            manager.async_cancel(watches.pop().watch_id)
+        open_now = polls.pop(0)
+        return [
+            VenueStatus(slug, slug in open_now, 32.08, 34.78)
+            for slug in ("early", "late")
+        ]
+
+    async def notify_area(watch, names):
+        reported.append((watch.device, names))
+
+    async def run():
+        nonlocal manager
+        manager = _make_manager(
+            [], calls, notified, fetch_nearby=fetch_nearby, notify_area=notify_area
+        )
+        for device in ("notify.a", "notify.b"):
+            watches.append(manager.async_start_area(32.08, 34.78, 1, device, 60))
+        await asyncio.sleep(0.1)
+        area_open = dict(manager._area_open)  # pylint: disable=protected-access
+        await manager.async_stop()
+        return area_open
+
+    area_open = asyncio.run(run())
+
+    assert not polls
+    assert reported == [("notify.a", ["Late"])]
+    assert area_open == {}
+
+
+def test_area_watches_round_trip_through_storage():
+    """Test that an area watch keeps its circle across a restart."""
+    calls, notified = [], []
+
+    async def run():
+        manager = _make_manager([], calls, notified)
+        manager.async_start_area(32.08, 34.78, 2.5, "notify.a", 60)
+        await manager.async_stop()
+        restored = _make_manager([], calls, notified)
+        assert restored.async_restore(manager.as_dict()) == 1
+        await restored.async_stop()
+        return restored.watches[0]
+
+    watch = asyncio.run(run())
+
+    assert (watch.kind, watch.slug) == ("area", "32.0800,34.7800,2.5")
+    assert (watch.latitude, watch.longitude, watch.radius_km) == (32.08, 34.78, 2.5)
+
+
+def test_watches_are_slotted_and_share_strings():
+    """Test that watch records carry no dict and reuse slug and device."""
+    calls, notified = [], []
+
+    async def run():
+        manager = _make_manager([], calls, notified)
+        first = manager.async_start("".join(["tai", "zu"]), "notify.a", 60)
+        second = manager.async_start_menu(
+            "".join(["ta", "izu"]), "notify.a", 60, price_changes=True
+        )
+        stats = manager.stats()
+        await manager.async_stop()
+        return manager, first, second, stats
+
+    manager, first, second, stats = asyncio.run(run())
+
+    assert not hasattr(first, "__dict__")
+    assert first.slug is second.slug
+    assert first.device is second.device
+    assert manager.find(slug="taizu", device="notify.a") == [first, second]
+    assert stats["memory_bytes"] > 0
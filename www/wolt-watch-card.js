@@ -12,9 +12,108 @@ import {
 class WoltWatchCard extends LitElement {
   static properties = { 
     hass: {}, 
-    config: {} 
+    config: {},
+    _suggestions: { attribute: false },
+    _devices: { attribute: false },
+    _watches: { attribute: false },
   };
 
+  constructor() {
+    super();
+    this._suggestions = [];
+    this._searchTimer = null;
+    this._devices = [];
+    this._notifyServices = undefined;
+    this._watches = new Map();
+    this._unsubscribe = null;
+  }
+
+  connectedCallback() {
+    super.connectedCallback();
+    this._subscribe();
+  }
+
+  disconnectedCallback() {
+    super.disconnectedCallback();
+    if (this._unsubscribe) {
+      this._unsubscribe.then(unsubscribe => unsubscribe()).catch(() => {});
+      this._unsubscribe = null;
+    }
+  }
+
+  shouldUpdate(changedProps) {
+    if (!changedProps.has("hass")) {
+      return true;
+    }
+    // hass changes on every state change anywhere; only the notify
+    // services matter here, and HA replaces that object when they change
+    this._subscribe();
+    const devicesChanged = this._updateDevices();
+    return devicesChanged || changedProps.size > 1 || !changedProps.get("hass");
+  }
+
+  _updateDevices() {
+    const services = this.hass.services?.notify;
+    if (services === this._notifyServices) {
+      return false;
+    }
+    this._notifyServices = services;
+    this._devices = Object.keys(services || {})
+      .filter(service => service.startsWith("mobile_app"))
+      .sort()
+      .map(service => {
+        const entityId = `notify.${service}`;
+        const name =
+          this.hass.states[entityId]?.attributes?.friendly_name ||
+          service.replace(/^mobile_app_/, "").replace(/_/g, " ");
+        return { entityId, name };
+      });
+    return true;
+  }
+
+  _subscribe() {
+    if (this._unsubscribe || !this.hass || !this.isConnected) {
+      return;
+    }
+    this._unsubscribe = this.hass.connection.subscribeMessage(
+      event => this._onWatchEvent(event),
+      { type: "wolt_watch/watches/subscribe" }
+    );
+    this._unsubscribe.catch(() => {
+      // The integration is not loaded yet; retry on the next hass update
+      this._unsubscribe = null;
+    });
+  }
+
+  _onWatchEvent(event) {
+    const watches = new Map(event.event === "snapshot" ? [] : this._watches);
+    switch (event.event) {
+      case "snapshot":
+        event.watches.forEach(watch => watches.set(watch.watch_id, watch));
+        break;
+      case "added":
+      case "updated":
+        watches.set(event.watch.watch_id, event.watch);
+        break;
+      case "removed":
+        watches.delete(event.watch_id);
+        break;
+      case "venue":
+        watches.forEach((watch, id) => {
+          if (
+            watch.slug === event.slug &&
+            (watch.kind || "open") === (event.kind || "open")
+          ) {
+            watches.set(id, { ...watch, state: event.state });
+          }
+        });
+        break;
+      default:
+        return;
+    }
+    this._watches = watches;
+  }
+
   static getConfigElement() {
     return document.createElement("wolt-watch-card-editor");
   }
@@ -36,11 +135,6 @@ class WoltWatchCard extends LitElement {
       return html`<ha-card>Loading...</ha-card>`;
     }
 
-    // Get all mobile_app notify entities
-    const notifyEntities = Object.keys(this.hass.states)
-      .filter(entityId => entityId.startsWith("notify.mobile_app"))
-      .sort();
-
     return html`
       <ha-card header="Watch Wolt Restaurant">
         <div class="card-content">
@@ -52,7 +146,25 @@ class WoltWatchCard extends LitElement {
               helper-text="Find the restaurant slug from the Wolt URL"
               outlined
               style="width: 100%; margin-bottom: 16px;"
+              @input="${this._onSlugInput}"
             ></ha-textfield>
+            ${this._suggestions.length
+              ? html`
+                  <mwc-list class="suggestions">
+                    ${this._suggestions.map(
+                      venue => html`
+                        <mwc-list-item
+                          twoline
+                          @click="${() => this._pickSuggestion(venue)}"
+                        >
+                          <span>${venue.name}</span>
+                          <span slot="secondary">${venue.slug}</span>
+                        </mwc-list-item>
+                      `
+                    )}
+                  </mwc-list>
+                `
+              : ""}
           </div>
 
           <div class="input-group">
@@ -73,14 +185,13 @@ class WoltWatchCard extends LitElement {
               style="width: 100%; margin-bottom: 16px;"
             >
               <mwc-list-item value="">Select a device...</mwc-list-item>
-              ${notifyEntities.map(entityId => {
-                const friendlyName = this.hass.states[entityId]?.attributes?.friendly_name || entityId;
-                return html`
-                  <mwc-list-item value="${entityId}">
-                    ${friendlyName}
+              ${this._devices.map(
+                device => html`
+                  <mwc-list-item value="${device.entityId}">
+                    ${device.name}
                   </mwc-list-item>
-                `;
-              })}
+                `
+              )}
             </ha-select>
           </div>
 
@@ -94,11 +205,78 @@ class WoltWatchCard extends LitElement {
               Start Watching
             </mwc-button>
           </div>
+
+          ${this._watches.size
+            ? html`
+                <div class="watches">
+                  ${[...this._watches.values()].map(
+                    watch => html`
+                      <div class="watch">
+                        <div class="watch-info">
+                          <div>
+                            ${watch.kind === "area"
+                              ? `Within ${watch.radius_km} km`
+                              : this._title(watch.slug)}
+                          </div>
+                          <div class="watch-detail">
+                            ${watch.state === "backing_off"
+                              ? "Wolt unreachable, retrying"
+                              : watch.kind === "menu"
+                              ? "Watching menu"
+                              : watch.kind === "area"
+                              ? "Watching area"
+                              : "Watching"}
+                            until
+                            ${new Date(watch.expires_at * 1000).toLocaleTimeString([], {
+                              hour: "2-digit",
+                              minute: "2-digit",
+                            })}
+                          </div>
+                        </div>
+                        <ha-icon-button
+                          .label=${"Stop watching"}
+                          @click="${() => this._cancelWatch(watch.watch_id)}"
+                        >
+                          <ha-icon icon="mdi:close"></ha-icon>
+                        </ha-icon-button>
+                      </div>
+                    `
+                  )}
+                </div>
+              `
+            : ""}
         </div>
       </ha-card>
     `;
   }
 
+  _onSlugInput(event) {
+    // Look venues up in the integration's local index; this never calls Wolt
+    const query = event.target.value?.trim();
+    clearTimeout(this._searchTimer);
+    if (!query) {
+      this._suggestions = [];
+      return;
+    }
+    this._searchTimer = setTimeout(async () => {
+      try {
+        const result = await this.hass.callWS({
+          type: "wolt_watch/venues/search",
+          query: query,
+          limit: 8,
+        });
+        this._suggestions = result.venues;
+      } catch (error) {
+        this._suggestions = [];
+      }
+    }, 150);
+  }
+
+  _pickSuggestion(venue) {
+    this.shadowRoot.getElementById("slug").value = venue.slug;
+    this._suggestions = [];
+  }
+
   async _startWatch() {
     const slugElement = this.shadowRoot.getElementById("slug");
     const durationElement = this.shadowRoot.getElementById("duration");
@@ -146,7 +324,7 @@ class WoltWatchCard extends LitElement {
 
       // Show success notification
       this._fireEvent("hass-notification", {
-        message: `Now watching ${slug.replace(/-/g, " ").replace(/\b\w/g, l => l.toUpperCase())}...`,
+        message: `Now watching ${this._title(slug)}...`,
       });
 
       // Clear form
@@ -158,6 +336,18 @@ class WoltWatchCard extends LitElement {
     }
   }
 
+  async _cancelWatch(watchId) {
+    try {
+      await this.hass.callService("wolt_watch", "cancel", { watch_id: watchId });
+    } catch (error) {
+      this._showError(`Failed to stop watching: ${error.message}`);
+    }
+  }
+
+  _title(slug) {
+    return slug.replace(/-/g, " ").replace(/\b\w/g, l => l.toUpperCase());
+  }
+
   _showError(message) {
     this._fireEvent("hass-notification", {
       message: message,
@@ -188,6 +378,30 @@ class WoltWatchCard extends LitElement {
         margin-bottom: 16px;
       }
 
+      .suggestions {
+        margin-top: -12px;
+        margin-bottom: 16px;
+        border: 1px solid var(--divider-color);
+        border-radius: 4px;
+      }
+
+      .watches {
+        margin-top: 16px;
+        border-top: 1px solid var(--divider-color);
+      }
+
+      .watch {
+        display: flex;
+        align-items: center;
+        justify-content: space-between;
+        padding: 8px 0;
+      }
+
+      .watch-detail {
+        font-size: 12px;
+        color: var(--secondary-text-color);
+      }
+
       .duration-label {
         display: block;
         font-size: 12px;